@@ -0,0 +1,7 @@
+"""
+Benchmarks reproductibles des scènes (voir ``bench/run.py``).
+
+Usage:
+    python -m bench --list
+    python -m bench [scénarios...] [--seconds 20] [--compare bench/baseline.json]
+"""
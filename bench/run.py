@@ -0,0 +1,360 @@
+"""
+Benchmark reproductible des scènes, avec comparaison à une référence.
+
+Chaque scénario (voir ``bench/scenarios.py``) est joué pendant N secondes
+simulées, à pas fixe, avec une graine et des entrées scriptées. Le rapport
+JSON donne, par scénario, les percentiles p50/p95/p99 des temps d'update et
+de draw (ms), le pic d'allocation Python de chaque tick (Kio au-dessus de la
+mémoire tracée avant le tick, tracemalloc) et le pic de mémoire résidente.
+
+Chaque scénario tourne dans son propre processus, pour que son pic RSS ne
+soit pas celui d'un scénario précédent ; ``--in-process`` les enchaîne dans
+le processus courant (plus rapide, mais pic RSS cumulé).
+
+Une session enregistrée en jeu (F5) est jouée telle quelle avec
+``--recording`` : un scénario par scène, de la durée jouée par le joueur.
+
+Par défaut les scènes tournent sans fenêtre (``core.headless``) et seul
+l'update est mesuré. Avec ``--window``, une fenêtre cachée est ouverte et le
+draw est mesuré aussi (``ctx.finish()`` inclus, donc temps GPU compris),
+ainsi que, par frame, les draws envoyés au GPU et les textures liées (compteurs
+de ``core.profiler``) et, par SpriteList, le nombre d'images distinctes
+derrière ses textures (une seule quand la scène tire tout de son atlas).
+
+Usage:
+    python -m bench [--seconds 20] [--window] [--output rapport.json]
+    python -m bench --save-baseline bench/baseline.json
+    python -m bench --compare bench/baseline.json [--tolerance 0.15]
+    python -m bench --recording recordings/session_....oosr
+    python -m bench --in-process
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+import arcade
+
+from core import force_next_seed, get_headless_window, get_profiler, is_game_over, set_headless, texture_sources
+from .scenarios import SCENARIOS, Scenario, recording_scenarios
+
+try:
+    import resource
+    _RESOURCE_OK = True
+except ImportError:  # Windows
+    _RESOURCE_OK = False
+
+TICKS_PER_SECOND = 60
+# Frames mesurées sous tracemalloc (plus lent : passe séparée, plus courte)
+ALLOC_FRAMES = 300
+# Métriques comparées à la référence
+COMPARED_METRICS = (
+    ("update_ms", "p95"), ("update_ms", "p99"),
+    ("draw_ms", "p95"), ("draw_ms", "p99"),
+    ("alloc_peak_kib", "p95"),
+    ("gl_draws", "p95"),
+)
+# En dessous de cet écart absolu, une hausse est du bruit de mesure
+NOISE_FLOOR = {"update_ms": 0.05, "draw_ms": 0.05, "alloc_peak_kib": 4.0, "gl_draws": 0.5}
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Percentile par rang le plus proche (liste déjà triée)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[rank]
+
+
+def summarize(values: List[float]) -> Optional[Dict[str, float]]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return {
+        "p50": round(_percentile(ordered, 50), 4),
+        "p95": round(_percentile(ordered, 95), 4),
+        "p99": round(_percentile(ordered, 99), 4),
+        "mean": round(sum(ordered) / len(ordered), 4),
+        "max": round(ordered[-1], 4),
+    }
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Pic de mémoire résidente du processus depuis son lancement (Mo), None si indisponible."""
+    if not _RESOURCE_OK:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux : Kio, macOS : octets
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+class SceneDriver:
+    """Joue un scénario frame par frame, en relançant la scène à chaque fin de partie."""
+
+    def __init__(self, scenario: Scenario, window=None):
+        self.scenario = scenario
+        self.window = window
+        self.view_class = scenario.view_class()
+        self.view = None
+        self.tick = 0
+        self.restarts = -1
+        # Session enregistrée : entrées par tick de la scène
+        self._recorded = scenario.segment.inputs() if scenario.segment else None
+        self._start()
+
+    def _start(self):
+        self.restarts += 1
+        if self.scenario.segment:
+            force_next_seed(self.scenario.segment.seed)
+        self.view = self.view_class()
+        if self.window is not None:
+            self.window.show_view(self.view)
+        else:
+            headless = get_headless_window()
+            headless.reset()
+            headless.current_view = self.view
+            self.view.on_show_view()
+        if self.scenario.prepare:
+            self.scenario.prepare(self.view)
+
+    def _ended(self) -> bool:
+        view = self.view
+        current = (self.window or get_headless_window()).current_view
+        if self._recorded is not None:
+            # La partie enregistrée continue après un game over, comme pour le joueur
+            return current is not view or view.tick >= self.scenario.segment.ticks
+        return current is not view or is_game_over(view)
+
+    def before_frame(self):
+        """Entrées scriptées et maintien de la charge (hors mesure)."""
+        if self._ended():
+            self._start()
+        if self.scenario.each_tick:
+            self.scenario.each_tick(self.view, self.tick)
+        if self.scenario.inputs:
+            for method, args in self.scenario.inputs(self.tick):
+                getattr(self.view, method)(*args)
+        if self._recorded is not None:
+            for method, args in self._recorded.get(self.view.tick, ()):
+                getattr(self.view, method)(*args)
+        self.tick += 1
+
+    def update(self):
+        if self.window is not None:
+            self.view.on_update(1 / TICKS_PER_SECOND)
+        else:
+            self.view.step()
+
+    def draw(self):
+        self.view.on_draw()
+        self.window.ctx.finish()
+
+    def sprite_list_sources(self) -> Dict[str, int]:
+        """Images distinctes derrière les textures de chaque SpriteList de la vue."""
+        return {
+            name: len(texture_sources(sprite.texture for sprite in value))
+            for name, value in vars(self.view).items()
+            if isinstance(value, arcade.SpriteList) and len(value)
+        }
+
+
+def run_scenario(scenario: Scenario, seconds: float, seed: int, window=None) -> Dict:
+    """Mesure un scénario ; renvoie ses statistiques (ou l'erreur rencontrée)."""
+    # Une session enregistrée dure ce qu'a joué le joueur
+    frames = scenario.segment.ticks if scenario.segment else int(seconds * TICKS_PER_SECOND)
+    random.seed(seed)
+    profiler = get_profiler()
+    try:
+        driver = SceneDriver(scenario, window)
+        update_ms: List[float] = []
+        draw_ms: List[float] = []
+        gl_draws: List[float] = []
+        texture_binds: List[float] = []
+        sources: Dict[str, int] = {}
+        # Compteurs d'appels de rendu : relevés par BaseView à la fin de chaque draw
+        profiler.set_counting(window is not None)
+        try:
+            for _ in range(frames):
+                driver.before_frame()
+                start = time.perf_counter()
+                driver.update()
+                update_ms.append((time.perf_counter() - start) * 1000.0)
+                if window is not None and driver.view is window.current_view:
+                    start = time.perf_counter()
+                    driver.draw()
+                    draw_ms.append((time.perf_counter() - start) * 1000.0)
+                    gl_draws.append(profiler.last_gl_draws)
+                    texture_binds.append(profiler.last_texture_binds)
+        finally:
+            profiler.set_counting(False)
+        if window is not None:
+            sources = driver.sprite_list_sources()
+
+        restarts = driver.restarts
+
+        # Passe séparée sous tracemalloc : mêmes entrées, même graine
+        random.seed(seed)
+        driver = SceneDriver(scenario, window)
+        # Pic au-dessus de la mémoire tracée avant le tick : la taille du plus
+        # gros temporaire, pas le nombre d'allocations
+        alloc_peak_kib: List[float] = []
+        tracemalloc.start()
+        try:
+            for _ in range(min(frames, ALLOC_FRAMES)):
+                driver.before_frame()
+                before, _peak = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                driver.update()
+                _current, peak = tracemalloc.get_traced_memory()
+                alloc_peak_kib.append(max(0, peak - before) / 1024.0)
+        finally:
+            tracemalloc.stop()
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+
+    return {
+        "frames": frames,
+        "restarts": restarts,
+        "update_ms": summarize(update_ms),
+        "draw_ms": summarize(draw_ms),
+        "gl_draws": summarize(gl_draws),
+        "texture_binds": summarize(texture_binds),
+        "texture_sources": sources or None,
+        "alloc_peak_kib": summarize(alloc_peak_kib),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def _open_window(use_window: bool):
+    """Fenêtre cachée pour mesurer le draw, ou mode headless (None)."""
+    if use_window:
+        return arcade.Window(1080, 720, "bench", visible=False)
+    set_headless(True)
+    return None
+
+
+def _run_isolated(name: str, seconds: float, seed: int, use_window: bool, recordings: Sequence[str]) -> Dict:
+    """Point d'entrée du processus fils : un seul scénario, avec son propre pic RSS."""
+    for path in recordings:
+        SCENARIOS.update((scenario.name, scenario) for scenario in recording_scenarios(path))
+    window = _open_window(use_window)
+    try:
+        return run_scenario(SCENARIOS[name], seconds, seed, window)
+    finally:
+        if window is not None:
+            window.close()
+
+
+def run(names: List[str], seconds: float, seed: int, use_window: bool,
+        recordings: Sequence[str] = (), isolated: bool = True) -> Dict:
+    report = {
+        "meta": {
+            "mode": "window" if use_window else "headless",
+            "isolated": isolated,
+            "seconds": seconds,
+            "seed": seed,
+            "python": platform.python_version(),
+            "arcade": arcade.__version__,
+            "platform": platform.platform(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "scenarios": {},
+    }
+    window = None if isolated else _open_window(use_window)
+    # spawn : le fils part d'un interpréteur neuf, sans la mémoire ni le contexte GL du parent
+    context = multiprocessing.get_context("spawn")
+    for name in names:
+        print(f"[bench] {name}...", file=sys.stderr)
+        if not isolated:
+            report["scenarios"][name] = run_scenario(SCENARIOS[name], seconds, seed, window)
+            continue
+        try:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                stats = pool.submit(_run_isolated, name, seconds, seed, use_window, list(recordings)).result()
+        except Exception as e:
+            stats = {"error": f"{type(e).__name__}: {e}"}
+        report["scenarios"][name] = stats
+    if window is not None:
+        window.close()
+    return report
+
+
+def compare(report: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Liste les régressions (métrique > référence * (1 + tolérance) et au-delà du bruit)."""
+    regressions = []
+    if report["meta"]["mode"] != baseline.get("meta", {}).get("mode"):
+        print("[bench] attention : mode différent de celui de la référence", file=sys.stderr)
+    for name, stats in report["scenarios"].items():
+        ref = baseline.get("scenarios", {}).get(name)
+        if not ref or "error" in stats or "error" in ref:
+            continue
+        for metric, pct in COMPARED_METRICS:
+            if not stats.get(metric) or not ref.get(metric):
+                continue
+            value, ref_value = stats[metric][pct], ref[metric][pct]
+            if value > ref_value * (1.0 + tolerance) and value - ref_value > NOISE_FLOOR[metric]:
+                regressions.append(f"{name} {metric} {pct}: {ref_value:.3f} -> {value:.3f} "
+                                   f"(+{(value / ref_value - 1.0) * 100 if ref_value else float('inf'):.0f}%)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark reproductible des scènes du jeu.")
+    parser.add_argument("scenarios", nargs="*", help="Scénarios à jouer (défaut : tous)")
+    parser.add_argument("--list", action="store_true", help="Lister les scénarios")
+    parser.add_argument("--seconds", type=float, default=20.0, help="Durée simulée par scénario")
+    parser.add_argument("--seed", type=int, default=0, help="Graine de random")
+    parser.add_argument("--window", action="store_true", help="Ouvrir une fenêtre cachée et mesurer le draw")
+    parser.add_argument("--output", help="Écrire le rapport JSON dans ce fichier (défaut : stdout)")
+    parser.add_argument("--save-baseline", metavar="PATH", help="Enregistrer le rapport comme référence")
+    parser.add_argument("--compare", metavar="PATH", help="Comparer à une référence")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Hausse tolérée (0.15 = +15 %%)")
+    parser.add_argument("--recording", metavar="PATH", action="append", default=[],
+                        help="Jouer aussi une session enregistrée (F5 en jeu), une fois par scène")
+    parser.add_argument("--in-process", action="store_true",
+                        help="Enchaîner les scénarios dans ce processus (plus rapide, pic RSS cumulé)")
+    args = parser.parse_args()
+
+    recorded = [scenario for path in args.recording for scenario in recording_scenarios(path)]
+    SCENARIOS.update((scenario.name, scenario) for scenario in recorded)
+
+    if args.list:
+        for scenario in SCENARIOS.values():
+            print(f"{scenario.name:<16}{scenario.view:<14}{scenario.description}")
+        return
+
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        raise SystemExit(f"Scénario(s) inconnu(s): {', '.join(unknown)}")
+
+    names = args.scenarios + [scenario.name for scenario in recorded]
+    if not names:
+        names = list(SCENARIOS)
+    report = run(names, args.seconds, args.seed, args.window, args.recording, not args.in_process)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance)
+        for line in regressions:
+            print(f"[bench] RÉGRESSION {line}", file=sys.stderr)
+        if regressions:
+            raise SystemExit(1)
+        print("[bench] aucune régression", file=sys.stderr)
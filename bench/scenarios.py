@@ -0,0 +1,152 @@
+"""
+Scénarios de benchmark : une scène, un état de départ et des entrées scriptées.
+
+Chaque scénario pousse une scène vers son cas le plus chargé (liste de
+dangers qui grossit, colonie de 200 fourmis, difficulté maximale...). Les
+entrées sont déterministes (fonction du tick) et la graine de ``random`` est
+fixée par le runner : deux exécutions jouent exactement la même partie.
+
+Une session de joueur enregistrée (F5 en jeu, voir ``core.replay``) donne
+aussi des scénarios, un par scène jouée : ``recording_scenarios()``.
+"""
+
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import arcade
+
+# Évènement injecté : (nom de méthode de la vue, arguments)
+Event = Tuple[str, Tuple]
+
+_ARROWS = (arcade.key.UP, arcade.key.RIGHT, arcade.key.DOWN, arcade.key.LEFT)
+
+
+def hold_arrows(period: int = 90) -> Callable[[int], Sequence[Event]]:
+    """Maintient une flèche à la fois, en changeant toutes les `period` ticks."""
+    def events(tick: int) -> Sequence[Event]:
+        if tick % period:
+            return ()
+        index = tick // period
+        pressed = _ARROWS[index % len(_ARROWS)]
+        out: List[Event] = [("on_key_press", (pressed, 0))]
+        if index:
+            out.insert(0, ("on_key_release", (_ARROWS[(index - 1) % len(_ARROWS)], 0)))
+        return out
+    return events
+
+
+class Scenario:
+    """Description d'un scénario de benchmark."""
+
+    def __init__(
+        self,
+        name: str,
+        view: str,
+        description: str,
+        prepare: Optional[Callable] = None,
+        each_tick: Optional[Callable] = None,
+        inputs: Optional[Callable[[int], Sequence[Event]]] = None,
+        segment=None,
+    ):
+        """
+        Args:
+            name: Identifiant du scénario (clé du rapport JSON)
+            view: Nom de la classe de vue dans le package scenes
+            description: Résumé affiché par --list
+            prepare: Appelé une fois la vue affichée (avant le premier tick)
+            each_tick: Appelé avant chaque tick, pour maintenir la charge
+            inputs: tick -> évènements clavier/souris à injecter
+            segment: Scène enregistrée (core.replay.Segment) : sa graine, ses
+                entrées au tick de la scène et sa durée remplacent les précédents
+        """
+        self.name = name
+        self.view = view
+        self.description = description
+        self.prepare = prepare
+        self.each_tick = each_tick
+        self.inputs = inputs
+        self.segment = segment
+
+    def view_class(self):
+        import scenes
+        return getattr(scenes, self.view)
+
+
+# ----- AtomView : liste de dangers qui grossit -----
+def _atom_prepare(view):
+    # Un nouveau danger tous les 6 ticks au lieu de 60
+    view.atom_spawn_interval = 6
+
+
+# ----- AntView : colonie de 200+ fourmis -----
+ANT_FOLLOWERS = 200
+
+
+def _ant_keep_colony(view, tick: int):
+    while len(view.followers) < ANT_FOLLOWERS:
+        view._spawn_follower()
+
+
+# ----- AntView : piétinement, des dizaines de pieds en même temps -----
+STAMPEDE_FEET = 48
+
+
+def _ant_stampede_prepare(view):
+    view.prewarm_feet(STAMPEDE_FEET)
+
+
+def _ant_stampede(view, tick: int):
+    _ant_keep_colony(view, tick)
+    # Un nouveau pied à chaque tick tant qu'il y en a moins de STAMPEDE_FEET
+    if len(view.foot_events) < STAMPEDE_FEET:
+        view._foot_timer = view._next_foot_in
+
+
+# ----- HumanDogView : difficulté maximale -----
+def _human_dog_prepare(view):
+    # La difficulté plafonne après 90 s de jeu
+    view._elapsed = 90.0
+
+
+# ----- AlienView : niveau 3 -----
+def _alien_prepare(view):
+    view.level = 3
+    view.spawn_aliens()
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    s.name: s for s in (
+        Scenario("atom_growing", "AtomView",
+                 "Atomes : un danger de plus tous les 6 ticks, flèches scriptées",
+                 prepare=_atom_prepare, inputs=hold_arrows()),
+        Scenario("atom_storm", "AtomStormView",
+                 "Atomes, mode tempête : jusqu'à 4000 dangers (NumPy)",
+                 inputs=hold_arrows()),
+        Scenario("ant_colony", "AntView",
+                 f"Fourmis : colonie maintenue à {ANT_FOLLOWERS} suiveuses, pieds qui tombent",
+                 each_tick=_ant_keep_colony, inputs=hold_arrows(45)),
+        Scenario("ant_stampede", "AntView",
+                 f"Fourmis : {STAMPEDE_FEET} pieds en même temps sur une colonie de {ANT_FOLLOWERS}",
+                 prepare=_ant_stampede_prepare, each_tick=_ant_stampede, inputs=hold_arrows(45)),
+        Scenario("human_dog_max", "HumanDogView",
+                 "Chien : difficulté maximale (voitures rapides et nombreuses)",
+                 prepare=_human_dog_prepare, inputs=hold_arrows(60)),
+        Scenario("alien_level3", "AlienView",
+                 "Aliens : niveau 3, 76 têtes en mouvement",
+                 prepare=_alien_prepare),
+    )
+}
+
+
+def recording_scenarios(path) -> List[Scenario]:
+    """Un scénario par scène jouée d'une session enregistrée (core.replay)."""
+    from core import load_recording
+
+    path = Path(path)
+    return [
+        Scenario(f"{path.stem}:{i}:{segment.scene}", segment.scene,
+                 f"Session {path.name}, scène {i} ({segment.ticks} ticks, {len(segment.events)} entrées)",
+                 segment=segment)
+        for i, segment in enumerate(load_recording(path))
+        if segment.ticks
+    ]
@@ -1,19 +1,97 @@
-from .sound_manager import (
-    SoundManager, get_sound_manager, play_sound, play_ui_sound, play_gameplay_sound,
-    play_dog_sound, play_car_crash, play_explosion, play_laser_impact, 
-    play_footstep, play_ambient_sound
-)
-
-__all__ = [
-    'SoundManager',
-    'get_sound_manager', 
-    'play_sound',
-    'play_ui_sound',
-    'play_gameplay_sound',
-    'play_dog_sound',
-    'play_car_crash',
-    'play_explosion',
-    'play_laser_impact',
-    'play_footstep',
-    'play_ambient_sound'
-]
+"""
+Services partagés par les scènes (textures, sons, profilage, headless...).
+
+Les noms sont ré-exportés à la demande : ``from core import make_sprite``
+n'importe que ``core.texture_cache`` (et ses dépendances), pas NumPy, le
+cache audio ni le replay. Un module lancé en ligne de commande
+(``python -m core ...``, voir ``core/__main__.py``) n'est ainsi jamais
+importé deux fois.
+"""
+
+import importlib
+
+# Nom exporté -> module du paquet core qui le définit
+_EXPORTS = {
+    'SoundManager': 'sound_manager',
+    'get_sound_manager': 'sound_manager',
+    'play_sound': 'sound_manager',
+    'play_ui_sound': 'sound_manager',
+    'play_gameplay_sound': 'sound_manager',
+    'play_dog_sound': 'sound_manager',
+    'play_car_crash': 'sound_manager',
+    'play_explosion': 'sound_manager',
+    'play_laser_impact': 'sound_manager',
+    'play_footstep': 'sound_manager',
+    'play_ambient_sound': 'sound_manager',
+    'AudioCache': 'audio_cache',
+    'get_audio_cache': 'audio_cache',
+    'load_cached_sound': 'audio_cache',
+    'TextureCache': 'texture_cache',
+    'get_texture_cache': 'texture_cache',
+    'load_texture': 'texture_cache',
+    'make_sprite': 'texture_cache',
+    'texture_sources': 'texture_cache',
+    'AnimationCache': 'animations',
+    'AnimatedSprite': 'animations',
+    'get_animations': 'animations',
+    'preload_animation': 'animations',
+    'make_animated_sprite': 'animations',
+    'ScenePreloader': 'preloader',
+    'get_preloader': 'preloader',
+    'FrameProfiler': 'profiler',
+    'get_profiler': 'profiler',
+    'SpatialGrid': 'spatial_grid',
+    'ParticleSwarm': 'particles',
+    'TrailBuffer': 'trail',
+    'InputRecorder': 'replay',
+    'Segment': 'replay',
+    'get_recorder': 'replay',
+    'new_scene_seed': 'replay',
+    'force_next_seed': 'replay',
+    'load_recording': 'replay',
+    'replay_segment': 'replay',
+    'replay': 'replay',
+    'GameWindow': 'window',
+    'SpritePool': 'sprite_pool',
+    'PARK_POSITION': 'sprite_pool',
+    'TextCache': 'text_cache',
+    'ProceduralTextureCache': 'procedural_textures',
+    'get_procedural_textures': 'procedural_textures',
+    'soft_ellipse_texture': 'procedural_textures',
+    'solid_texture': 'procedural_textures',
+    'Entity': 'headless',
+    'EntityList': 'headless',
+    'TextureInfo': 'headless',
+    'HeadlessWindow': 'headless',
+    'set_headless': 'headless',
+    'is_headless': 'headless',
+    'get_headless_window': 'headless',
+    'simulate': 'headless',
+    'run_sessions': 'headless',
+    'is_game_over': 'headless',
+    'make_sprite_list': 'headless',
+    'make_blank_sprite': 'headless',
+    'make_solid_sprite': 'headless',
+    'make_camera': 'headless',
+    'check_for_collision': 'headless',
+    'check_for_collision_with_list': 'headless',
+    'get_sprites_at_point': 'headless',
+}
+
+
+def __getattr__(name: str):
+    # Import paresseux : core.make_sprite importe core.texture_cache au premier accès
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    # Les accès suivants ne repassent plus par __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+__all__ = list(_EXPORTS)
@@ -0,0 +1,42 @@
+"""
+Point d'entrée des outils en ligne de commande de ``core``.
+
+Les modules de ``core`` sont importés par les scènes : lancés directement
+(``python -m core.headless``), ils existeraient en deux exemplaires,
+``__main__`` et ``core.headless``, chacun avec son propre état. Les outils
+passent donc par ce module, qui importe le module normalement puis appelle
+son ``main()``.
+
+Usage:
+    python -m core headless AtomView [--sessions 1000] [--ticks 600] [--seed 0]
+    python -m core replay recordings/session_....oosr [--window] [--slowest 5]
+    python -m core audio_cache [--force] [--prune]
+    python -m core asset_baker [--manifest data/bake_manifest.json] [--force]
+    python -m core atlas_packer [--manifest data/atlas_manifest.json]
+"""
+
+import importlib
+import sys
+
+# Commande -> module du paquet core qui fournit main()
+COMMANDS = {
+    "headless": "headless",
+    "replay": "replay",
+    "audio_cache": "audio_cache",
+    "asset_baker": "asset_baker",
+    "atlas_packer": "atlas_packer",
+}
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in COMMANDS:
+        names = ", ".join(COMMANDS)
+        raise SystemExit(f"Usage: python -m core <commande> [options]  (commandes : {names})")
+    command = sys.argv[1]
+    # argparse du module affiche « python -m core <commande> » dans son aide
+    sys.argv = [f"python -m core {command}"] + sys.argv[2:]
+    importlib.import_module(f"{__package__}.{COMMANDS[command]}").main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Animations (GIF) décodées en arrière-plan et gardées en cache.
+
+Décoder un GIF avec Pillow, puis créer une texture par frame, prend plusieurs
+centaines de millisecondes pour une grande animation : fait sur le thread
+principal au moment où l'animation doit apparaître (fond du menu, explosion
+de l'UniverseView), cela bloque le jeu. Ici le décodage est lancé à l'avance
+sur un thread de travail (``preload``, en général à l'entrée de la scène ou
+via ``PRELOAD_ANIMATIONS``), et le résultat (``arcade.TextureAnimation``,
+partageable entre sprites) est gardé par chemin.
+
+``make_sprite`` retourne ensuite un ``AnimatedSprite`` prêt à jouer, avancé
+par ``update_animation(delta_time)``.
+
+En mode headless, rien n'est décodé (``get`` retourne None).
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Union
+import logging
+
+import arcade
+from arcade import TextureAnimation, TextureKeyframe
+from PIL import Image, ImageSequence
+
+from .asset_baker import PROJECT_ROOT
+from .headless import is_headless
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+# Durée d'une frame sans information de durée (ms)
+DEFAULT_FRAME_MS = 80
+# Durée minimale d'une frame (ms) : certains GIF déclarent 0
+MIN_FRAME_MS = 10
+
+
+def _absolute(path: PathLike) -> str:
+    """Les chemins relatifs sont exprimés depuis la racine du projet."""
+    path = Path(path)
+    return str(path if path.is_absolute() else PROJECT_ROOT / path)
+
+
+def decode_animation(path: PathLike) -> TextureAnimation:
+    """Décode toutes les frames d'une image animée en keyframes (durées en ms)."""
+    keyframes = []
+    with Image.open(path) as im:
+        for i, frame in enumerate(ImageSequence.Iterator(im)):
+            texture = arcade.Texture(
+                frame.convert("RGBA"),
+                hash=f"animation:{path}:{i}",
+                # Décor : la boîte englobante suffit et ne parcourt pas les pixels
+                hit_box_algorithm=arcade.hitbox.algo_bounding_box,
+            )
+            duration = max(MIN_FRAME_MS, int(frame.info.get("duration", DEFAULT_FRAME_MS) or DEFAULT_FRAME_MS))
+            keyframes.append(TextureKeyframe(texture, duration))
+    if not keyframes:
+        raise ValueError(f"Aucune frame dans {path}")
+    return TextureAnimation(keyframes)
+
+
+class AnimatedSprite(arcade.TextureAnimationSprite):
+    """Sprite qui joue une TextureAnimation, en boucle ou une seule fois."""
+
+    def __init__(self, animation: TextureAnimation, loop: bool = True, **kwargs):
+        super().__init__(animation=animation, **kwargs)
+        self.loop = loop
+
+    @property
+    def finished(self) -> bool:
+        """Animation jouée une fois jusqu'au bout (jamais vrai en boucle)."""
+        return not self.loop and self.time >= self.animation.duration_seconds
+
+    def update_animation(self, delta_time: float = 1 / 60, **kwargs) -> None:
+        self.time += delta_time
+        index, keyframe = self.animation.get_keyframe(self.time, loop=self.loop)
+        if index != self._current_keyframe_index:
+            self._current_keyframe_index = index
+            self.texture = keyframe.texture
+
+
+class AnimationCache:
+    """Animations décodées sur un thread de travail, indexées par chemin."""
+
+    def __init__(self, max_workers: int = 1):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="animation")
+        self._futures: Dict[str, Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def preload(self, path: PathLike) -> Optional[Future]:
+        """
+        Lance le décodage de `path` en arrière-plan (déjà demandé = ignoré).
+
+        Returns:
+            Future: Résultat (TextureAnimation), ou None en mode headless
+        """
+        if is_headless():
+            return None
+        key = _absolute(path)
+        future = self._futures.get(key)
+        if future is None:
+            self.misses += 1
+            future = self._executor.submit(decode_animation, key)
+            self._futures[key] = future
+        return future
+
+    def is_ready(self, path: PathLike) -> bool:
+        """True si l'animation est décodée (ou a échoué) : get() ne bloquera pas."""
+        future = self._futures.get(_absolute(path))
+        return future is not None and future.done()
+
+    def get(self, path: PathLike, timeout: Optional[float] = None) -> Optional[TextureAnimation]:
+        """
+        Retourne l'animation, en attendant la fin de son décodage si besoin.
+
+        Args:
+            path: Image animée (relative à la racine du projet ou absolue)
+            timeout: Attente maximale en secondes (None = jusqu'à la fin)
+
+        Returns:
+            TextureAnimation, ou None (headless, fichier illisible, délai dépassé)
+        """
+        if self.is_ready(path):
+            self.hits += 1
+        future = self.preload(path)
+        if future is None:
+            return None
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            return None
+        except Exception as e:
+            logger.warning(f"Animation illisible {path}: {e}")
+            return None
+
+    def make_sprite(self, path: PathLike, loop: bool = True, timeout: Optional[float] = None,
+                    **kwargs) -> Optional[AnimatedSprite]:
+        """Sprite prêt à jouer l'animation `path` (None si elle n'est pas disponible)."""
+        animation = self.get(path, timeout=timeout)
+        if animation is None:
+            return None
+        return AnimatedSprite(animation, loop=loop, **kwargs)
+
+    def evict(self, path: PathLike):
+        self._futures.pop(_absolute(path), None)
+
+    def clear(self):
+        self._futures.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Compteurs d'instrumentation du cache."""
+        return {
+            "entries": len(self._futures),
+            "pending": sum(1 for future in self._futures.values() if not future.done()),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Instance globale du cache d'animations
+_animations = None
+
+
+def get_animations() -> AnimationCache:
+    """Retourne l'instance globale du cache d'animations."""
+    global _animations
+    if _animations is None:
+        _animations = AnimationCache()
+    return _animations
+
+
+def preload_animation(path: PathLike) -> Optional[Future]:
+    """Fonction utilitaire : lance le décodage d'une animation en arrière-plan."""
+    return get_animations().preload(path)
+
+
+def make_animated_sprite(path: PathLike, loop: bool = True, **kwargs) -> Optional[AnimatedSprite]:
+    """Fonction utilitaire : sprite animé depuis le cache (attend la fin du décodage)."""
+    return get_animations().make_sprite(path, loop=loop, **kwargs)
@@ -0,0 +1,143 @@
+"""
+Étape de « baking » hors-ligne des images du jeu OUT OF SCALE.
+
+Plusieurs sources sont bien plus grandes que leur taille à l'écran (planètes
+de ~1500 px affichées à ``scale=0.1``, lune de 2736 px à ``scale=0.075``...).
+Ce module lit un manifeste de tailles cibles et écrit des copies réduites dans
+un dossier dédié. Le cache de textures (``core.texture_cache``) les utilise
+ensuite de façon transparente à la place des originaux. Les dimensions sont
+arrondies au multiple de ``multiple_of`` supérieur (4 par défaut).
+
+Usage:
+    python -m core asset_baker [--manifest data/bake_manifest.json] [--force]
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import logging
+
+# Pillow est requis pour le baking (mais pas pour lancer le jeu)
+try:
+    from PIL import Image
+    _PIL_OK = True
+except Exception:
+    _PIL_OK = False
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_MANIFEST = PROJECT_ROOT / "data" / "bake_manifest.json"
+BAKED_DIR = PROJECT_ROOT / "assets_baked"
+# Index écrit par le baker et lu par le cache de textures
+INDEX_FILENAME = "index.json"
+
+
+def _round_up(value: float, multiple: int) -> int:
+    """
+    Arrondit au multiple supérieur (``multiple_of`` du manifeste, 4 pour les
+    blocs 4x4 des formats compressés). Ce n'est pas une puissance de deux :
+    Arcade range de toute façon chaque image dans son propre atlas GPU.
+    """
+    multiple = max(1, multiple)
+    return max(multiple, int(-(-value // multiple)) * multiple)
+
+
+def _target_size(src_size: Tuple[int, int], spec: Dict, multiple: int) -> Tuple[int, int]:
+    """Calcule la taille de sortie en conservant le ratio."""
+    src_w, src_h = src_size
+    if "width" in spec:
+        factor = spec["width"] / float(src_w)
+    elif "height" in spec:
+        factor = spec["height"] / float(src_h)
+    else:
+        factor = float(spec.get("scale", 1.0))
+    return _round_up(src_w * factor, multiple), _round_up(src_h * factor, multiple)
+
+
+def _downscale(image: "Image.Image", size: Tuple[int, int]) -> "Image.Image":
+    """Réduit par divisions successives par 2 puis termine en Lanczos (moins d'aliasing)."""
+    while image.width >= size[0] * 2 and image.height >= size[1] * 2:
+        image = image.reduce(2)
+    return image.resize(size, Image.LANCZOS)
+
+
+def bake_asset(source: Path, dest: Path, spec: Dict, multiple: int) -> Optional[Dict]:
+    """
+    Produit la copie réduite d'une image.
+
+    Returns:
+        dict: Entrée d'index (facteur, mtime source), ou None si inutile
+    """
+    with Image.open(source) as im:
+        src_size = im.size
+        size = _target_size(src_size, spec, multiple)
+        if size[0] >= src_size[0] or size[1] >= src_size[1]:
+            logger.info(f"Ignoré (déjà assez petit): {source} {src_size}")
+            return None
+        baked = _downscale(im.convert("RGBA"), size)
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    baked.save(dest, optimize=True)
+    logger.info(f"Baké: {source} {src_size} -> {size}")
+    return {
+        "factor": size[0] / float(src_size[0]),
+        "source_mtime": source.stat().st_mtime,
+    }
+
+
+def bake(manifest_path: Path = DEFAULT_MANIFEST, output_dir: Path = BAKED_DIR,
+         force: bool = False) -> Dict[str, Dict]:
+    """Bake toutes les images du manifeste et écrit l'index du dossier de sortie."""
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    multiple = int(manifest.get("multiple_of", 4))
+    index_path = output_dir / INDEX_FILENAME
+
+    previous: Dict[str, Dict] = {}
+    if index_path.exists() and not force:
+        with open(index_path, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+
+    index: Dict[str, Dict] = {}
+    for rel_path, spec in manifest.get("assets", {}).items():
+        source = PROJECT_ROOT / rel_path
+        if not source.exists():
+            logger.warning(f"Source introuvable: {rel_path}")
+            continue
+        dest = output_dir / rel_path
+        old = previous.get(rel_path)
+        if old and dest.exists() and old.get("source_mtime") == source.stat().st_mtime:
+            index[rel_path] = old
+            continue
+        try:
+            entry = bake_asset(source, dest, spec, multiple)
+        except Exception as e:
+            logger.error(f"Erreur lors du baking de {rel_path}: {e}")
+            continue
+        if entry:
+            index[rel_path] = entry
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+    logger.info(f"{len(index)} image(s) bakée(s) dans {output_dir}")
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Réduit les images à leur taille d'affichage.")
+    parser.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST,
+                        help="Manifeste JSON des tailles cibles")
+    parser.add_argument("--output", type=Path, default=BAKED_DIR,
+                        help="Dossier de sortie des images bakées")
+    parser.add_argument("--force", action="store_true",
+                        help="Refaire toutes les images même si elles sont à jour")
+    args = parser.parse_args()
+
+    if not _PIL_OK:
+        raise SystemExit("Pillow est requis pour le baking (pip install pillow)")
+    logging.basicConfig(level=logging.INFO)
+    bake(args.manifest, args.output, force=args.force)
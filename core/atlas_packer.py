@@ -0,0 +1,160 @@
+"""
+Regroupement des sprites de chaque mini-jeu dans un atlas de textures.
+
+Pour chaque scène déclarée dans ``data/atlas_manifest.json``, les images
+sources sont réduites (optionnellement) puis rangées dans une seule feuille
+PNG, accompagnée des coordonnées de chaque région. Le cache de textures
+(``core.texture_cache``) découpe ensuite les sous-textures dans la feuille :
+une seule image est ouverte et décodée par scène au lieu d'une par sprite.
+
+Les sous-textures restent des copies découpées : Arcade les range dans son
+atlas GPU comme n'importe quelle texture. Le nombre de draws et de textures
+liées ne change donc pas (Arcade 3 dessine déjà chaque SpriteList depuis son
+atlas global, en un seul draw) ; le gain porte sur les fichiers lus et décodés.
+
+Usage:
+    python -m core atlas_packer [--manifest data/atlas_manifest.json]
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, List, Tuple
+import logging
+
+from .asset_baker import PROJECT_ROOT, BAKED_DIR, _PIL_OK, _downscale, _round_up
+
+if _PIL_OK:
+    from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MANIFEST = PROJECT_ROOT / "data" / "atlas_manifest.json"
+ATLAS_DIR = BAKED_DIR / "atlas"
+# Index écrit par le packer et lu par le cache de textures
+ATLAS_INDEX_FILENAME = "index.json"
+
+Rect = Tuple[int, int, int, int]
+
+
+def _shelf_pack(sizes: List[Tuple[int, int]], max_size: int, padding: int) -> Tuple[List[Rect], Tuple[int, int]]:
+    """
+    Range des rectangles par étagères (les plus hauts d'abord).
+
+    Returns:
+        (rectangles (x, y, w, h) dans l'ordre d'entrée, taille de la feuille)
+    """
+    order = sorted(range(len(sizes)), key=lambda i: sizes[i][1], reverse=True)
+    rects: List[Rect] = [(0, 0, 0, 0)] * len(sizes)
+    x = y = padding
+    shelf_h = 0
+    sheet_w = 0
+    for i in order:
+        w, h = sizes[i]
+        if x + w + padding > max_size:
+            # Étagère suivante
+            x = padding
+            y += shelf_h + padding
+            shelf_h = 0
+        if x + w + padding > max_size or y + h + padding > max_size:
+            raise ValueError(f"Atlas trop petit ({max_size}px) pour {len(sizes)} images")
+        rects[i] = (x, y, w, h)
+        x += w + padding
+        shelf_h = max(shelf_h, h)
+        sheet_w = max(sheet_w, x)
+    sheet_h = y + shelf_h + padding
+    return rects, (_round_up(sheet_w, 4), _round_up(sheet_h, 4))
+
+
+def pack_atlas(name: str, spec: Dict, max_size: int, padding: int, output_dir: Path) -> Dict:
+    """Construit la feuille d'une scène et retourne son entrée d'index."""
+    images = []
+    entries = []
+    for rel_path in spec.get("sources", []):
+        source = PROJECT_ROOT / rel_path
+        if not source.exists():
+            logger.warning(f"Source introuvable: {rel_path}")
+            continue
+        with Image.open(source) as im:
+            image = im.convert("RGBA")
+        factor = 1.0
+        target_w = spec.get("width")
+        if target_w and image.width > target_w:
+            factor = target_w / float(image.width)
+            image = _downscale(image, (int(target_w), max(1, round(image.height * factor))))
+        images.append(image)
+        entries.append((rel_path, factor, source.stat().st_mtime))
+
+    rects, sheet_size = _shelf_pack([im.size for im in images], max_size, padding)
+    sheet = Image.new("RGBA", sheet_size, (0, 0, 0, 0))
+    regions = {}
+    for image, rect, (rel_path, factor, mtime) in zip(images, rects, entries):
+        sheet.paste(image, rect[:2])
+        regions[rel_path] = {"rect": list(rect), "factor": factor, "source_mtime": mtime}
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    sheet.save(output_dir / f"{name}.png", optimize=True)
+    return {"file": f"{name}.png", "size": list(sheet_size), "regions": regions}
+
+
+def report(index: Dict[str, Dict], atlas_dir: Path = ATLAS_DIR):
+    """
+    Affiche, par atlas, le nombre d'images distinctes derrière les textures
+    que reçoivent les SpriteList, sans puis avec l'atlas.
+
+    Les deux colonnes sont mesurées en chargeant réellement les textures par
+    le cache (``core.texture_cache``) : une région périmée ou absente de la
+    feuille retombe sur son image d'origine et compte comme une source de plus.
+    """
+    # Import local : le cache de textures dépend de ce module
+    from .texture_cache import TextureCache, texture_sources
+
+    without_atlas = TextureCache(atlas_dir=None)
+    with_atlas = TextureCache(atlas_dir=atlas_dir)
+    print(f"{'atlas':<12}{'images':>8}{'sources avant':>16}{'sources après':>16}{'Mo décodés avant':>20}{'Mo après':>12}")
+    for name, atlas in index.items():
+        regions = atlas["regions"]
+        before = [without_atlas.get_texture(PROJECT_ROOT / rel_path) for rel_path in regions]
+        after = list(with_atlas.get_atlas(name).values())
+        before_bytes = without_atlas.current_bytes
+        after_bytes = with_atlas.current_bytes
+        without_atlas.clear()
+        with_atlas.clear()
+        print(f"{name:<12}{len(regions):>8}{len(texture_sources(before)):>16}{len(texture_sources(after)):>16}"
+              f"{before_bytes / 1e6:>20.1f}{after_bytes / 1e6:>12.1f}")
+
+
+def pack(manifest_path: Path = DEFAULT_MANIFEST, output_dir: Path = ATLAS_DIR) -> Dict[str, Dict]:
+    """Construit tous les atlas du manifeste et écrit l'index."""
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    max_size = int(manifest.get("max_size", 2048))
+    padding = int(manifest.get("padding", 2))
+
+    index: Dict[str, Dict] = {}
+    for name, spec in manifest.get("atlases", {}).items():
+        try:
+            index[name] = pack_atlas(name, spec, max_size, padding, output_dir)
+            logger.info(f"Atlas {name}: {len(index[name]['regions'])} régions, {index[name]['size']}")
+        except Exception as e:
+            logger.error(f"Erreur lors de la création de l'atlas {name}: {e}")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with open(output_dir / ATLAS_INDEX_FILENAME, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Construit un atlas de textures par scène.")
+    parser.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST,
+                        help="Manifeste JSON des atlas")
+    parser.add_argument("--output", type=Path, default=ATLAS_DIR,
+                        help="Dossier de sortie des atlas")
+    args = parser.parse_args()
+
+    if not _PIL_OK:
+        raise SystemExit("Pillow est requis pour créer les atlas (pip install pillow)")
+    logging.basicConfig(level=logging.INFO)
+    report(pack(args.manifest, args.output), args.output)
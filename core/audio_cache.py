@@ -0,0 +1,319 @@
+"""
+Cache disque des sons décodés (PCM brut) pour le jeu OUT OF SCALE.
+
+Décoder un MP3 coûte cher et se refait à chaque lancement. Ce module écrit le
+PCM décodé de chaque fichier dans ``audio_cache/``, sous le nom du hash SHA-1
+du fichier source, et l'index (``index.json``) garde pour chaque source sa
+taille, son mtime, son hash et son format audio. Au chargement suivant, le
+fichier PCM est simplement projeté en mémoire (``mmap``) : aucun décodage.
+
+Une source dont la taille ou le mtime a changé est re-hachée ; elle n'est
+décodée à nouveau que si son contenu a réellement changé. Le PCM est laissé
+brut (pas de compression) pour pouvoir être projeté tel quel.
+
+Usage (pré-remplissage au déploiement):
+    python -m core audio_cache [--force] [--prune]
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import logging
+
+import arcade
+from pyglet import media
+from pyglet.media.codecs.base import AudioData, AudioFormat, StaticMemorySource, StaticSource
+
+from .asset_baker import PROJECT_ROOT
+
+logger = logging.getLogger(__name__)
+
+AUDIO_CACHE_DIR = PROJECT_ROOT / "audio_cache"
+INDEX_FILENAME = "index.json"
+# Dossiers pré-remplis par la ligne de commande
+SOURCE_DIRECTORIES = ("sounds", "music")
+AUDIO_EXTENSIONS = (".mp3", ".wav", ".ogg")
+# Taille des blocs lus au décodage et au hachage (octets)
+_CHUNK_SIZE = 1 << 20
+
+PathLike = Union[str, Path]
+
+
+class MappedSource(StaticSource):
+    """Source statique dont les données PCM sont un fichier projeté en mémoire."""
+
+    def __init__(self, data, audio_format: AudioFormat):
+        self.audio_format = audio_format
+        self._data = data
+        self._duration = len(data) / float(audio_format.bytes_per_second)
+
+    def get_queue_source(self) -> "MappedMemorySource":
+        # StaticSource passerait par io.BytesIO(data) : copie de tout le PCM à chaque lecture
+        return MappedMemorySource(self._data, self.audio_format)
+
+
+class MappedMemorySource(StaticMemorySource):
+    """
+    Une lecture d'une MappedSource : lit directement la projection, sans la copier.
+
+    Chaque lecture a sa propre position (celle de l'objet mmap est partagée
+    entre toutes les lectures simultanées du son).
+    """
+
+    def __init__(self, data, audio_format: AudioFormat):
+        self._view = memoryview(data)
+        self._offset = 0
+        self._max_offset = len(data)
+        self.audio_format = audio_format
+        self._duration = len(data) / float(audio_format.bytes_per_second)
+
+    def seek(self, timestamp: float):
+        offset = self.audio_format.align(int(timestamp * self.audio_format.bytes_per_second))
+        self._offset = min(max(0, offset), self._max_offset)
+
+    def get_audio_data(self, num_bytes: float, compensation_time: float = 0.0) -> Optional[AudioData]:
+        start = self._offset
+        end = min(start + int(num_bytes), self._max_offset)
+        if end <= start:
+            return None
+        self._offset = end
+        # Seul le paquet demandé est copié (les pilotes attendent des bytes)
+        data = bytes(self._view[start:end])
+        bytes_per_second = self.audio_format.bytes_per_second
+        return AudioData(data, len(data), start / bytes_per_second, len(data) / bytes_per_second)
+
+
+class CachedSound(arcade.Sound):
+    """arcade.Sound construit sur une source déjà décodée (sans passer par media.load)."""
+
+    def __init__(self, file_name: str, source: StaticSource):
+        self.file_name = file_name
+        self.source = source
+        self.min_distance = 100000000  # comme arcade.Sound : panoramique 2D
+
+
+def _file_hash(path: Path) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def decode(path: PathLike) -> Tuple[bytes, AudioFormat]:
+    """Décode entièrement un fichier audio ; retourne (PCM, format)."""
+    source = media.load(str(path), streaming=True)
+    audio_format = source.audio_format
+    if audio_format is None:
+        raise ValueError(f"Aucune piste audio dans {path}")
+    chunks = []
+    while True:
+        audio_data = source.get_audio_data(_CHUNK_SIZE)
+        if audio_data is None:
+            break
+        chunks.append(audio_data.data)
+    return b"".join(chunks), audio_format
+
+
+class AudioCache:
+    """PCM décodé sur disque, indexé par fichier source."""
+
+    def __init__(self, cache_dir: PathLike = AUDIO_CACHE_DIR):
+        """
+        Args:
+            cache_dir: Dossier du cache (créé au premier son décodé)
+        """
+        self.cache_dir = Path(cache_dir)
+        self._index: Optional[Dict[str, Dict]] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # ----- Index -----
+    def _load_index(self) -> Dict[str, Dict]:
+        if self._index is None:
+            self._index = {}
+            index_path = self.cache_dir / INDEX_FILENAME
+            if index_path.exists():
+                try:
+                    with open(index_path, "r", encoding="utf-8") as f:
+                        self._index = json.load(f)
+                except Exception as e:
+                    logger.warning(f"Index du cache audio illisible, ignoré: {e}")
+        return self._index
+
+    def _save_index(self):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_dir / (INDEX_FILENAME + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._index, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.cache_dir / INDEX_FILENAME)
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        """Chemin relatif au projet si possible (index portable d'une machine à l'autre)."""
+        try:
+            return path.relative_to(PROJECT_ROOT).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    # ----- Entrées -----
+    def _valid(self, entry: Optional[Dict]) -> bool:
+        """Le fichier PCM de l'entrée existe avec la taille attendue."""
+        if not entry:
+            return False
+        pcm = self.cache_dir / entry["file"]
+        return pcm.exists() and pcm.stat().st_size == entry["length"]
+
+    def entry(self, path: PathLike, force: bool = False) -> Dict:
+        """
+        Entrée d'index du fichier `path`, décodé et écrit dans le cache si besoin.
+
+        Args:
+            path: Fichier audio source
+            force: Décoder même si le cache est à jour
+        """
+        path = Path(os.path.abspath(path))
+        key = self._key(path)
+        stat = path.stat()
+        with self._lock:
+            entry = self._load_index().get(key)
+        if not force and self._valid(entry) and entry["mtime_ns"] == stat.st_mtime_ns \
+                and entry["size"] == stat.st_size:
+            self.hits += 1
+            return entry
+
+        digest = _file_hash(path)
+        if not force and self._valid(entry) and entry["sha1"] == digest:
+            # Fichier touché mais contenu identique : seul l'index change
+            self.hits += 1
+        else:
+            data, audio_format = decode(path)
+            self.misses += 1
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            pcm = self.cache_dir / f"{digest}.pcm"
+            tmp = pcm.with_name(f"{pcm.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, pcm)
+            entry = {
+                "file": pcm.name,
+                "length": len(data),
+                "channels": audio_format.channels,
+                "sample_size": audio_format.sample_size,
+                "sample_rate": audio_format.sample_rate,
+                "sample_type": audio_format.sample_type,
+            }
+            logger.info(f"Son décodé et mis en cache: {key} ({len(data) / 1e6:.1f} Mo)")
+        entry = dict(entry, sha1=digest, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        with self._lock:
+            self._load_index()[key] = entry
+            self._save_index()
+        return entry
+
+    def load(self, path: PathLike) -> arcade.Sound:
+        """
+        Retourne un arcade.Sound dont les données viennent du cache (projetées en mémoire).
+
+        En cas d'échec du cache (dossier en lecture seule...), le son est décodé
+        normalement par arcade.
+        """
+        try:
+            entry = self.entry(path)
+            with open(self.cache_dir / entry["file"], "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if entry["length"] else b""
+        except Exception as e:
+            logger.warning(f"Cache audio indisponible pour {path}: {e}")
+            return arcade.load_sound(path)
+        audio_format = AudioFormat(entry["channels"], entry["sample_size"], entry["sample_rate"],
+                                   entry.get("sample_type"))
+        return CachedSound(os.path.abspath(path), MappedSource(data, audio_format))
+
+    def warm(self, paths: Iterable[PathLike], force: bool = False) -> int:
+        """Met en cache les fichiers donnés ; retourne le nombre de fichiers en cache."""
+        count = 0
+        for path in paths:
+            try:
+                self.entry(path, force=force)
+                count += 1
+            except Exception as e:
+                logger.error(f"Erreur lors du décodage de {path}: {e}")
+        return count
+
+    def prune(self) -> int:
+        """Supprime les fichiers PCM qui ne sont plus référencés par l'index."""
+        with self._lock:
+            used = {entry["file"] for entry in self._load_index().values()}
+        removed = 0
+        if self.cache_dir.exists():
+            for pcm in self.cache_dir.glob("*.pcm"):
+                if pcm.name not in used:
+                    pcm.unlink()
+                    removed += 1
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        """Compteurs d'instrumentation du cache."""
+        return {"entries": len(self._load_index()), "hits": self.hits, "misses": self.misses}
+
+
+# Instance globale du cache audio
+_audio_cache = None
+
+
+def get_audio_cache() -> AudioCache:
+    """Retourne l'instance globale du cache audio."""
+    global _audio_cache
+    if _audio_cache is None:
+        _audio_cache = AudioCache()
+    return _audio_cache
+
+
+def load_cached_sound(path: PathLike) -> arcade.Sound:
+    """Fonction utilitaire : charge un son via le cache disque."""
+    return get_audio_cache().load(path)
+
+
+def _default_sources() -> List[Path]:
+    """Fichiers décodés en entier par le jeu (les gros sons de ``sounds/`` sont streamés)."""
+    from .sound_manager import DEFAULT_STREAM_THRESHOLD
+
+    sources = []
+    for directory in SOURCE_DIRECTORIES:
+        folder = PROJECT_ROOT / directory
+        if not folder.exists():
+            continue
+        for path in sorted(folder.iterdir()):
+            if path.suffix.lower() not in AUDIO_EXTENSIONS:
+                continue
+            if directory == "sounds" and path.stat().st_size >= DEFAULT_STREAM_THRESHOLD:
+                continue
+            sources.append(path)
+    return sources
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Décode les sons du jeu dans le cache disque.")
+    parser.add_argument("files", nargs="*", type=Path,
+                        help="Fichiers à mettre en cache (défaut : sounds/ et music/)")
+    parser.add_argument("--cache-dir", type=Path, default=AUDIO_CACHE_DIR,
+                        help="Dossier du cache")
+    parser.add_argument("--force", action="store_true",
+                        help="Décoder à nouveau même les fichiers à jour")
+    parser.add_argument("--prune", action="store_true",
+                        help="Supprimer les fichiers PCM orphelins")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    cache = AudioCache(args.cache_dir)
+    sources = args.files or _default_sources()
+    count = cache.warm(sources, force=args.force)
+    logger.info(f"{count}/{len(sources)} son(s) en cache dans {args.cache_dir}"
+                f" ({cache.misses} décodé(s))")
+    if args.prune:
+        logger.info(f"{cache.prune()} fichier(s) orphelin(s) supprimé(s)")
@@ -0,0 +1,486 @@
+"""
+Mode « headless » : simulation des mini-jeux sans fenêtre ni contexte OpenGL.
+
+Les scènes créent leurs sprites, listes et caméras via les fabriques de ce
+module (``make_sprite_list``, ``make_blank_sprite``, ``make_solid_sprite``,
+``make_camera``) et testent leurs collisions avec ``check_for_collision*``.
+En temps normal ces fonctions renvoient les objets Arcade habituels. Une fois
+``set_headless()`` appelé, elles renvoient des enregistrements légers
+(``Entity``, ``EntityList``, ``TextureInfo``) : seule la taille des images est
+lue (en-tête du fichier, sans décodage) et aucune ressource GPU n'est créée.
+Les vues tournent alors sur une ``HeadlessWindow`` et ``simulate()`` enchaîne
+leurs ``fixed_update`` aussi vite que possible.
+
+Les collisions headless sont des boîtes englobantes alignées sur les axes
+(sans rotation ni hitbox détaillée) : suffisant pour l'équilibrage et les
+tests de non-régression, pas pour du pixel près.
+
+Usage:
+    python -m core headless AtomView [--sessions 1000] [--ticks 600] [--seed 0]
+"""
+
+import argparse
+import importlib
+import os
+import random
+import time
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import logging
+
+import arcade
+
+logger = logging.getLogger(__name__)
+
+# Taille de la fenêtre simulée (celle du jeu)
+DEFAULT_WIDTH = 1080
+DEFAULT_HEIGHT = 720
+
+# Évènements injectés : tick -> [(nom de méthode de la vue, arguments), ...]
+InputScript = Dict[int, Sequence[Tuple[str, Tuple[Any, ...]]]]
+
+
+class TextureInfo:
+    """Remplace arcade.Texture en mode headless : seulement la taille de l'image."""
+
+    __slots__ = ("file_path", "width", "height")
+
+    def __init__(self, file_path: str, width: int, height: int):
+        self.file_path = file_path
+        self.width = width
+        self.height = height
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.width, self.height
+
+    def __repr__(self) -> str:
+        return f"TextureInfo({self.file_path!r}, {self.width}x{self.height})"
+
+
+# Texture par défaut d'arcade.Sprite() sans image
+_DEFAULT_TEXTURE = TextureInfo(":default:", 128, 128)
+
+
+@lru_cache(maxsize=None)
+def _image_size(path: str) -> Tuple[int, int]:
+    """Lit la taille d'une image dans son en-tête (aucun décodage des pixels)."""
+    from PIL import Image
+    with Image.open(path) as im:
+        return im.size
+
+
+def texture_info(path, scale: float = 1.0, size: Optional[Tuple[int, int]] = None) -> TextureInfo:
+    """Équivalent headless de ``load_texture`` (mêmes arguments)."""
+    norm = os.path.normpath(os.path.abspath(str(path)))
+    if size is None:
+        width, height = _image_size(norm)
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return TextureInfo(norm, int(size[0]), int(size[1]))
+
+
+class Entity:
+    """
+    Enregistrement léger remplaçant arcade.Sprite en mode headless.
+
+    Reprend les attributs utilisés par la logique des scènes (position, angle,
+    échelle, taille, vitesse, appartenance aux listes). Les scènes peuvent y
+    ajouter leurs propres attributs, comme sur un sprite.
+    """
+
+    __slots__ = (
+        "center_x", "center_y", "angle", "change_x", "change_y", "change_angle",
+        "alpha", "color", "visible", "properties", "sprite_lists",
+        "_texture", "_scale_x", "_scale_y", "__dict__",
+    )
+
+    def __init__(self, texture=None, scale: float = 1.0, center_x: float = 0.0,
+                 center_y: float = 0.0, angle: float = 0.0):
+        self.center_x = center_x
+        self.center_y = center_y
+        self.angle = angle
+        self.change_x = 0.0
+        self.change_y = 0.0
+        self.change_angle = 0.0
+        self.alpha = 255
+        self.color = (255, 255, 255, 255)
+        self.visible = True
+        self.properties: Dict[str, Any] = {}
+        self.sprite_lists: List["EntityList"] = []
+        self._texture = texture if texture is not None else _DEFAULT_TEXTURE
+        self._scale_x = self._scale_y = float(scale)
+
+    # ----- Texture / taille -----
+    @property
+    def texture(self):
+        return self._texture
+
+    @texture.setter
+    def texture(self, texture):
+        self._texture = texture
+
+    @property
+    def scale(self) -> Tuple[float, float]:
+        return self._scale_x, self._scale_y
+
+    @scale.setter
+    def scale(self, value):
+        if isinstance(value, (tuple, list)):
+            self._scale_x, self._scale_y = float(value[0]), float(value[1])
+        else:
+            self._scale_x = self._scale_y = float(value)
+
+    @property
+    def scale_x(self) -> float:
+        return self._scale_x
+
+    @scale_x.setter
+    def scale_x(self, value: float):
+        self._scale_x = float(value)
+
+    @property
+    def scale_y(self) -> float:
+        return self._scale_y
+
+    @scale_y.setter
+    def scale_y(self, value: float):
+        self._scale_y = float(value)
+
+    @property
+    def width(self) -> float:
+        return self._texture.width * self._scale_x
+
+    @width.setter
+    def width(self, value: float):
+        self._scale_x = value / self._texture.width
+
+    @property
+    def height(self) -> float:
+        return self._texture.height * self._scale_y
+
+    @height.setter
+    def height(self, value: float):
+        self._scale_y = value / self._texture.height
+
+    # ----- Position -----
+    @property
+    def position(self) -> Tuple[float, float]:
+        return self.center_x, self.center_y
+
+    @position.setter
+    def position(self, value: Tuple[float, float]):
+        self.center_x, self.center_y = value
+
+    @property
+    def left(self) -> float:
+        return self.center_x - self.width / 2
+
+    @property
+    def right(self) -> float:
+        return self.center_x + self.width / 2
+
+    @property
+    def bottom(self) -> float:
+        return self.center_y - self.height / 2
+
+    @property
+    def top(self) -> float:
+        return self.center_y + self.height / 2
+
+    # ----- Comportement de sprite -----
+    def update(self, delta_time: float = 1 / 60, *args, **kwargs):
+        """Comme arcade.Sprite.update : avance de change_x / change_y par appel."""
+        self.center_x += self.change_x
+        self.center_y += self.change_y
+        self.angle += self.change_angle
+
+    def remove_from_sprite_lists(self):
+        for sprite_list in list(self.sprite_lists):
+            sprite_list.remove(self)
+
+    def collides_with_point(self, point: Tuple[float, float]) -> bool:
+        x, y = point
+        return (abs(x - self.center_x) * 2 <= self.width
+                and abs(y - self.center_y) * 2 <= self.height)
+
+    def collides_with_sprite(self, other: "Entity") -> bool:
+        return (abs(self.center_x - other.center_x) * 2 < self.width + other.width
+                and abs(self.center_y - other.center_y) * 2 < self.height + other.height)
+
+    def draw(self, **kwargs):
+        pass
+
+
+class EntityList(list):
+    """Remplace arcade.SpriteList en mode headless (aucune ressource GPU)."""
+
+    def __init__(self, *args, **kwargs):
+        # Les options d'arcade.SpriteList (use_spatial_hash, lazy...) sont ignorées
+        super().__init__()
+
+    def _unlink(self, entity: Entity):
+        lists = entity.sprite_lists
+        for i, sprite_list in enumerate(lists):
+            if sprite_list is self:
+                del lists[i]
+                return
+
+    def append(self, entity: Entity):
+        super().append(entity)
+        entity.sprite_lists.append(self)
+
+    def insert(self, index: int, entity: Entity):
+        super().insert(index, entity)
+        entity.sprite_lists.append(self)
+
+    def extend(self, entities: Iterable[Entity]):
+        for entity in entities:
+            self.append(entity)
+
+    def remove(self, entity: Entity):
+        # Entity ne définit pas __eq__ : index() compare par identité
+        try:
+            del self[self.index(entity)]
+        except ValueError:
+            raise ValueError("Entité absente de la liste") from None
+        self._unlink(entity)
+
+    def pop(self, index: int = -1) -> Entity:
+        entity = super().pop(index)
+        self._unlink(entity)
+        return entity
+
+    def clear(self):
+        for entity in self:
+            self._unlink(entity)
+        super().clear()
+
+    def update(self, delta_time: float = 1 / 60, *args, **kwargs):
+        for entity in list(self):
+            entity.update(delta_time, *args, **kwargs)
+
+    def draw(self, **kwargs):
+        pass
+
+    __hash__ = object.__hash__
+    __eq__ = object.__eq__
+    __ne__ = object.__ne__
+
+
+class HeadlessCamera:
+    """Remplace arcade.Camera2D : garde la position, ne fait aucun rendu."""
+
+    def __init__(self, position: Optional[Tuple[float, float]] = None):
+        window = get_headless_window()
+        if position is None and window is not None:
+            position = (window.width / 2, window.height / 2)
+        self.position = position or (0.0, 0.0)
+        self.zoom = 1.0
+        self.angle = 0.0
+
+    def use(self):
+        pass
+
+
+class HeadlessWindow:
+    """Fenêtre simulée : dimensions et changements de scène, sans contexte OpenGL."""
+
+    def __init__(self, width: int = DEFAULT_WIDTH, height: int = DEFAULT_HEIGHT):
+        self.width = width
+        self.height = height
+        self.ctx = None
+        self.current_view = None
+        # Noms des scènes demandées par les vues, dans l'ordre
+        self.transitions: List[str] = []
+
+    def get_size(self) -> Tuple[int, int]:
+        return self.width, self.height
+
+    def record_transition(self, scene_name: str):
+        """Note un changement de scène ; la vue simulée n'est plus la vue courante."""
+        self.transitions.append(scene_name)
+        self.current_view = None
+
+    def show_view(self, view, **kwargs):
+        self.record_transition(type(view).__name__)
+
+    def set_mouse_visible(self, visible: bool = True):
+        pass
+
+    def close(self):
+        self.current_view = None
+
+    def reset(self):
+        self.current_view = None
+        self.transitions = []
+
+
+# État global du mode headless
+_window: Optional[HeadlessWindow] = None
+
+
+def set_headless(enabled: bool = True, width: int = DEFAULT_WIDTH,
+                 height: int = DEFAULT_HEIGHT) -> Optional[HeadlessWindow]:
+    """
+    Active (ou désactive) le mode headless pour tout le processus.
+
+    Returns:
+        HeadlessWindow: La fenêtre simulée (None si désactivé)
+    """
+    global _window
+    _window = HeadlessWindow(width, height) if enabled else None
+    return _window
+
+
+def is_headless() -> bool:
+    """True si les scènes tournent sans fenêtre."""
+    return _window is not None
+
+
+def get_headless_window() -> Optional[HeadlessWindow]:
+    """Retourne la fenêtre simulée, ou None hors mode headless."""
+    return _window
+
+
+# ----- Fabriques utilisées par les scènes -----
+def make_sprite_list(**kwargs):
+    """arcade.SpriteList, ou EntityList en mode headless."""
+    if _window is not None:
+        return EntityList(**kwargs)
+    return arcade.SpriteList(**kwargs)
+
+
+def make_blank_sprite(texture=None):
+    """Sprite sans image (texture affectée ensuite)."""
+    if _window is not None:
+        return Entity(texture)
+    return arcade.Sprite(texture) if texture is not None else arcade.Sprite()
+
+
+def make_solid_sprite(width: int, height: int, color=arcade.color.WHITE):
+    """Rectangle de couleur unie (texture partagée par taille, voir core.procedural_textures)."""
+    if _window is not None:
+        entity = Entity(TextureInfo(":solid:", int(width), int(height)))
+        entity.color = color
+        return entity
+    from .procedural_textures import solid_texture
+    sprite = arcade.Sprite(solid_texture(width, height))
+    sprite.color = color
+    return sprite
+
+
+def make_camera():
+    """arcade.Camera2D, ou HeadlessCamera en mode headless."""
+    if _window is not None:
+        return HeadlessCamera()
+    return arcade.Camera2D()
+
+
+def check_for_collision(sprite1, sprite2) -> bool:
+    if _window is not None:
+        return sprite1.collides_with_sprite(sprite2)
+    return arcade.check_for_collision(sprite1, sprite2)
+
+
+def check_for_collision_with_list(sprite, sprite_list) -> list:
+    if _window is not None:
+        return [other for other in sprite_list if other is not sprite and sprite.collides_with_sprite(other)]
+    return arcade.check_for_collision_with_list(sprite, sprite_list)
+
+
+def get_sprites_at_point(point: Tuple[float, float], sprite_list) -> list:
+    if _window is not None:
+        return [sprite for sprite in sprite_list if sprite.collides_with_point(point)]
+    return arcade.get_sprites_at_point(point, sprite_list)
+
+
+# ----- Simulation -----
+def simulate(view_class: Callable, ticks: int = 600, seed: Optional[int] = None,
+             inputs: Optional[InputScript] = None) -> Dict[str, Any]:
+    """
+    Joue une partie d'un mini-jeu sans fenêtre.
+
+    Args:
+        view_class: Classe de la vue (AtomView, AntView...)
+        ticks: Nombre maximum de pas de simulation (60 par seconde de jeu)
+        seed: Graine de ``random`` pour rejouer exactement la même partie
+        inputs: Évènements injectés avant certains ticks,
+            ex. ``{0: [("on_key_press", (arcade.key.UP, 0))]}``
+
+    Returns:
+        dict: Scène, ticks joués, scène suivante demandée (None si aucune),
+        partie perdue (``game_over`` ou ``_game_over`` de la vue)
+    """
+    window = _window or set_headless(True)
+    window.reset()
+    if seed is not None:
+        random.seed(seed)
+
+    view = view_class()
+    window.current_view = view
+    view.on_show_view()
+
+    played = 0
+    inputs = inputs or {}
+    while played < ticks and window.current_view is view:
+        for method, args in inputs.get(played, ()):
+            getattr(view, method)(*args)
+        view.step()
+        played += 1
+
+    return {
+        "scene": view_class.__name__,
+        "seed": seed,
+        "ticks": played,
+        "next_scene": window.transitions[0] if window.transitions else None,
+        "game_over": is_game_over(view),
+    }
+
+
+def is_game_over(view) -> bool:
+    """Partie perdue : les scènes n'exposent pas toutes le même drapeau."""
+    return bool(getattr(view, "game_over", False) or getattr(view, "_game_over", False))
+
+
+def run_sessions(view_class: Callable, sessions: int = 100, ticks: int = 600,
+                 seed: int = 0) -> Dict[str, Any]:
+    """Enchaîne des parties (graines seed, seed+1...) et mesure le débit."""
+    outcomes: Counter = Counter()
+    total_ticks = 0
+    start = time.perf_counter()
+    for i in range(sessions):
+        result = simulate(view_class, ticks=ticks, seed=seed + i)
+        # Une partie perdue sans changement de scène n'est pas « en cours »
+        outcomes[result["next_scene"] or ("game over" if result["game_over"] else None)] += 1
+        total_ticks += result["ticks"]
+    seconds = time.perf_counter() - start
+    return {
+        "scene": view_class.__name__,
+        "sessions": sessions,
+        "ticks": total_ticks,
+        "seconds": seconds,
+        "sessions_per_s": sessions / seconds if seconds > 0 else float("inf"),
+        "ticks_per_s": total_ticks / seconds if seconds > 0 else float("inf"),
+        "outcomes": dict(outcomes),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simule des parties d'un mini-jeu sans fenêtre.")
+    parser.add_argument("scene", help="Nom de la vue (AtomView, AntView, HumanDogView, AlienView, UniverseView)")
+    parser.add_argument("--sessions", type=int, default=100, help="Nombre de parties")
+    parser.add_argument("--ticks", type=int, default=600, help="Ticks maximum par partie (60 = 1 s)")
+    parser.add_argument("--seed", type=int, default=0, help="Graine de la première partie")
+    args = parser.parse_args()
+
+    set_headless(True)
+    view_class = getattr(importlib.import_module("scenes"), args.scene, None)
+    if view_class is None:
+        raise SystemExit(f"Scène inconnue: {args.scene}")
+
+    stats = run_sessions(view_class, args.sessions, args.ticks, args.seed)
+    print(f"{stats['scene']}: {stats['sessions']} parties, {stats['ticks']} ticks en {stats['seconds']:.2f} s "
+          f"({stats['sessions_per_s']:.0f} parties/s, {stats['ticks_per_s']:.0f} ticks/s)")
+    for next_scene, count in sorted(stats["outcomes"].items(), key=lambda item: -item[1]):
+        print(f"  -> {next_scene or 'en cours'}: {count}")
@@ -0,0 +1,214 @@
+"""
+Particules en structure de tableaux NumPy (positions, vitesses, angles).
+
+La logique d'un grand nombre de sprites simples (dangers de l'AtomView) est
+calculée sur des tableaux contigus, en une poignée d'opérations vectorisées
+par tick, au lieu de lire et écrire ``center_x`` / ``center_y`` sprite par
+sprite. Les tableaux font foi.
+
+``write_back(alpha)`` place les sprites une fois par frame dessinée,
+interpolés entre l'avant-dernier et le dernier tick (``prev_pos`` /
+``prev_angle``), au lieu de passer par ``BaseView.INTERPOLATED_LISTS``
+sprite par sprite. Quand l'essaim connaît la SpriteList Arcade de ses
+sprites (Arcade 3, sans spatial hash), la position affichée est écrite
+directement dans le buffer de la liste, en une opération NumPy. Les
+sprites, eux, gardent la position du dernier tick (``center_x``,
+``center_y``, angle et hitbox) : collisions, ``get_sprites_at_point`` et
+une reconstruction du buffer par Arcade voient l'état simulé, comme pour
+``BaseView._restore_simulated_state``. Sinon, chaque sprite est placé par
+ses setters publics.
+
+L'essaim ne gère pas l'appartenance aux SpriteList (voir ``SpritePool``) :
+un sprite ajouté par ``add()`` ne doit plus être déplacé directement ni
+quitter sa SpriteList tant qu'il est dans l'essaim, et les sprites retirés
+sont rendus à l'appelant.
+"""
+
+from typing import List, Tuple
+
+import arcade
+import numpy as np
+
+# Capacité initiale des tableaux (doublée à la demande)
+DEFAULT_CAPACITY = 256
+
+
+# Disposition du buffer position / angle des SpriteList (x, y, profondeur,
+# angle par emplacement) lue par write_back : celle d'Arcade 3
+_BUFFER_LAYOUT_SUPPORTED = arcade.version.VERSION.split(".")[0] == "3"
+
+# Tableaux par particule (agrandis et compactés ensemble)
+_ARRAYS = ("pos", "vel", "angle", "spin", "prev_pos", "prev_angle", "slot")
+
+
+class ParticleSwarm:
+    """Miroir NumPy d'un ensemble de sprites déplacés en bloc."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, sprite_list=None):
+        """
+        Args:
+            capacity: Nombre de particules avant le premier agrandissement
+            sprite_list: SpriteList des sprites de l'essaim, pour l'écriture
+                groupée dans son buffer (None ou EntityList = sprite par sprite)
+        """
+        self.sprites: List = []
+        self.count = 0
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.angle = np.zeros(capacity)
+        self.spin = np.zeros(capacity)
+        # Position et angle au tick précédent (interpolation de l'affichage)
+        self.prev_pos = np.zeros((capacity, 2))
+        self.prev_angle = np.zeros(capacity)
+        # Emplacement de chaque sprite dans le buffer de la SpriteList
+        self.slot = np.zeros(capacity, dtype=np.intp)
+        self.sprite_list = sprite_list
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _grow(self, needed: int):
+        capacity = len(self.angle)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in _ARRAYS:
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def add(self, sprite, spin: float = 0.0):
+        """Ajoute un sprite à l'essaim (avec sa position et son angle actuels)."""
+        self._grow(self.count + 1)
+        i = self.count
+        self.pos[i] = self.prev_pos[i] = (sprite.center_x, sprite.center_y)
+        self.vel[i] = 0.0
+        self.angle[i] = self.prev_angle[i] = sprite.angle
+        self.spin[i] = spin
+        if self._buffer() is not None:
+            self.slot[i] = self.sprite_list.sprite_slot[sprite]
+        self.sprites.append(sprite)
+        self.count += 1
+
+    def _remove(self, mask: np.ndarray) -> List:
+        """Retire les particules marquées (tableaux compactés dans l'ordre)."""
+        n = self.count
+        keep = ~mask
+        removed = [self.sprites[i] for i in np.flatnonzero(mask)]
+        kept = int(keep.sum())
+        for name in _ARRAYS:
+            array = getattr(self, name)
+            array[:kept] = array[:n][keep]
+        self.sprites = [sprite for sprite, k in zip(self.sprites, keep.tolist()) if k]
+        self.count = kept
+        return removed
+
+    # ----- Noyaux -----
+    def attract(self, x: float, y: float, speed: float, absorb_radius: float) -> List:
+        """
+        Déplace chaque particule de `speed` px vers (x, y) et la fait tourner de son spin.
+
+        Les particules déjà à moins de `absorb_radius` sont retirées. Position
+        et angle d'avant le déplacement sont gardés pour l'interpolation.
+
+        Returns:
+            list: Sprites retirés (à recycler)
+        """
+        n = self.count
+        if not n:
+            return []
+        pos = self.pos[:n]
+        self.prev_pos[:n] = pos
+        self.prev_angle[:n] = self.angle[:n]
+        delta = np.array((x, y)) - pos
+        distance = np.hypot(delta[:, 0], delta[:, 1])
+        absorbed = distance < absorb_radius
+        moving = ~absorbed
+        vel = self.vel[:n]
+        vel[moving] = delta[moving] * (speed / distance[moving])[:, None]
+        vel[absorbed] = 0.0
+        pos += vel
+        self.angle[:n] += self.spin[:n]
+        removed = self._remove(absorbed) if absorbed.any() else []
+        self._sync_sprites()
+        return removed
+
+    def repulsion(self, x: float, y: float, radius: float, strength: float) -> Tuple[float, float]:
+        """
+        Poussée totale subie au point (x, y) : `strength` px par particule à moins de `radius`.
+
+        Returns:
+            tuple: Déplacement (dx, dy) à appliquer au point
+        """
+        n = self.count
+        if not n:
+            return 0.0, 0.0
+        delta = np.array((x, y)) - self.pos[:n]
+        distance_sq = np.einsum("ij,ij->i", delta, delta)
+        near = (distance_sq > 0.0) & (distance_sq < radius * radius)
+        if not near.any():
+            return 0.0, 0.0
+        push = delta[near] / np.sqrt(distance_sq[near])[:, None]
+        dx, dy = push.sum(axis=0) * strength
+        return float(dx), float(dy)
+
+    # ----- Affichage -----
+    def _buffer(self):
+        """
+        Données position / angle de la SpriteList Arcade, ou None : écriture
+        sprite par sprite (EntityList, pas de liste, autre version d'Arcade,
+        spatial hash à tenir à jour).
+        """
+        if not _BUFFER_LAYOUT_SUPPORTED or getattr(self.sprite_list, "spatial_hash", None) is not None:
+            return None
+        return getattr(self.sprite_list, "_sprite_pos_angle_data", None)
+
+    def _sync_sprites(self):
+        """Remet les sprites à la position et l'angle du dernier tick (une fois par tick)."""
+        n = self.count
+        rows = zip(self.sprites, self.pos[:n, 0].tolist(), self.pos[:n, 1].tolist(), self.angle[:n].tolist())
+        if self._buffer() is None:
+            for sprite, x, y, a in rows:
+                sprite.position = (x, y)
+                sprite.angle = a
+            return
+        # Le buffer de la liste est écrit par write_back : seuls le sprite et
+        # sa hitbox sont mis à jour, sans recopie emplacement par emplacement
+        for sprite, x, y, a in rows:
+            sprite._position = (x, y)
+            sprite._angle = a
+            hit_box = sprite._hit_box
+            hit_box.position = (x, y)
+            hit_box.angle = a
+
+    def write_back(self, alpha: float = 1.0):
+        """
+        Place les sprites entre le tick précédent (alpha = 0) et le dernier (alpha = 1).
+
+        Une fois par frame dessinée, juste avant le draw de la SpriteList.
+        Avec le buffer de la liste, seul l'affichage est interpolé : les
+        sprites restent à la position du dernier tick.
+        """
+        n = self.count
+        if not n:
+            return
+        prev = self.prev_pos[:n]
+        pos = prev + (self.pos[:n] - prev) * alpha
+        prev_angle = self.prev_angle[:n]
+        angle = prev_angle + (self.angle[:n] - prev_angle) * alpha
+        data = self._buffer()
+        if data is None:
+            for sprite, (x, y), a in zip(self.sprites, pos.tolist(), angle.tolist()):
+                sprite.position = (x, y)
+                sprite.angle = a
+            return
+        # Buffer de la SpriteList : x, y, profondeur, angle par emplacement.
+        # Vue éphémère : un buffer exporté ne pourrait plus être agrandi par Arcade.
+        buffer = np.frombuffer(data, dtype=np.float32).reshape(-1, 4)
+        slots = self.slot[:n]
+        buffer[slots, :2] = pos
+        buffer[slots, 3] = angle
+        del buffer
+        self.sprite_list._sprite_pos_angle_changed = True
@@ -0,0 +1,163 @@
+"""
+Préchargement en arrière-plan des assets de la scène suivante.
+
+Pendant qu'un dialogue est affiché, un thread de travail décode les images
+(via le cache de textures), les animations (via ``core.animations``) et les
+sons de la scène suivante. Seul l'envoi des textures vers le GPU (ajout à
+l'atlas d'Arcade) est fait sur le thread principal, par petits lots, dans
+``pump()``.
+"""
+
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+import logging
+
+import arcade
+
+from .animations import get_animations
+from .asset_baker import PROJECT_ROOT
+from .sound_manager import get_sound_manager
+from .texture_cache import get_texture_cache
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+
+class ScenePreloader:
+    """Décode des assets sur un thread de travail et les envoie au GPU sur le thread principal."""
+
+    def __init__(self, max_workers: int = 1):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="preload")
+        self._futures: List[Future] = []
+        # Textures décodées en attente d'envoi au GPU (thread principal)
+        self._uploads: "queue.SimpleQueue[arcade.Texture]" = queue.SimpleQueue()
+        self._requested: set = set()
+
+    @staticmethod
+    def _absolute(path: PathLike) -> str:
+        """Les chemins relatifs sont exprimés depuis la racine du projet."""
+        path = Path(path)
+        return str(path if path.is_absolute() else PROJECT_ROOT / path)
+
+    # ----- Thread de travail -----
+    def _load_texture(self, path: str):
+        texture = get_texture_cache().get_texture(path)
+        self._uploads.put(texture)
+
+    def _load_sound(self, path: str):
+        get_sound_manager().load_file(path)
+
+    def _submit(self, fn, path: str):
+        if path in self._requested:
+            return
+        self._requested.add(path)
+        future = self._executor.submit(fn, path)
+        future.add_done_callback(self._log_failure)
+        self._futures.append(future)
+
+    def _queue_animation_upload(self, future: Future):
+        """Frames d'une animation décodée : envoyées au GPU par pump() comme les textures."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        for keyframe in future.result().keyframes:
+            self._uploads.put(keyframe.texture)
+
+    @staticmethod
+    def _log_failure(future: Future):
+        error = future.exception()
+        if error is not None:
+            logger.warning(f"Préchargement échoué: {error}")
+
+    # ----- API -----
+    def preload(self, textures: Iterable[PathLike] = (), sounds: Iterable[PathLike] = (),
+                animations: Iterable[PathLike] = ()):
+        """
+        Lance le décodage des assets en arrière-plan (déjà demandés = ignorés).
+
+        Args:
+            textures: Chemins d'images (relatifs à la racine du projet ou absolus)
+            sounds: Chemins de fichiers audio
+            animations: Chemins d'images animées (GIF), gardées par core.animations
+        """
+        for path in textures:
+            self._submit(self._load_texture, self._absolute(path))
+        for path in sounds:
+            self._submit(self._load_sound, self._absolute(path))
+        for path in animations:
+            path = self._absolute(path)
+            if path in self._requested or get_animations().is_ready(path):
+                continue
+            future = get_animations().preload(path)
+            if future is None:
+                continue
+            self._requested.add(path)
+            future.add_done_callback(self._log_failure)
+            future.add_done_callback(self._queue_animation_upload)
+            self._futures.append(future)
+
+    def preload_view(self, view_class: type):
+        """Précharge les assets déclarés par une classe de vue (PRELOAD_TEXTURES / _SOUNDS / _ANIMATIONS)."""
+        self.preload(
+            getattr(view_class, "PRELOAD_TEXTURES", ()),
+            getattr(view_class, "PRELOAD_SOUNDS", ()),
+            getattr(view_class, "PRELOAD_ANIMATIONS", ()),
+        )
+
+    def pump(self, max_uploads: Optional[int] = 4) -> int:
+        """
+        Envoie au GPU les textures décodées (à appeler sur le thread principal).
+
+        Args:
+            max_uploads: Nombre maximum de textures par appel (None = toutes)
+
+        Returns:
+            int: Nombre de textures envoyées
+        """
+        try:
+            window = arcade.get_window()
+        except RuntimeError:
+            window = None
+        uploaded = 0
+        while max_uploads is None or uploaded < max_uploads:
+            try:
+                texture = self._uploads.get_nowait()
+            except queue.Empty:
+                break
+            if window is not None:
+                try:
+                    window.ctx.default_atlas.add(texture)
+                except Exception as e:
+                    logger.debug(f"Envoi GPU différé: {e}")
+            uploaded += 1
+        return uploaded
+
+    def pending(self) -> int:
+        """Nombre de tâches de décodage encore en cours."""
+        self._futures = [f for f in self._futures if not f.done()]
+        return len(self._futures)
+
+    def finish(self, timeout: Optional[float] = None):
+        """Attend la fin des décodages puis envoie tout au GPU (avant d'ouvrir la scène suivante)."""
+        if self._futures:
+            wait(self._futures, timeout=timeout)
+            self._futures = [f for f in self._futures if not f.done()]
+        self._requested.clear()
+        self.pump(max_uploads=None)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Instance globale du préchargeur
+_preloader = None
+
+
+def get_preloader() -> ScenePreloader:
+    """Retourne l'instance globale du préchargeur."""
+    global _preloader
+    if _preloader is None:
+        _preloader = ScenePreloader()
+    return _preloader
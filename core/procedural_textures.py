@@ -0,0 +1,161 @@
+"""
+Cache des textures générées par le code (ombres, rectangles de couleur).
+
+``arcade.make_soft_ellipse_texture`` rastérise une nouvelle image (et calcule
+sa hit box) à chaque appel, et ``SpriteSolidColor`` ne garde ses textures que
+tant qu'un sprite les utilise. Les scènes qui font apparaître des entités en
+continu (pieds de l'AntView, barres du mini-jeu...) demandent donc ici une
+texture par (forme, largeur, hauteur, couleur) : elle n'est générée et
+envoyée au GPU qu'une fois.
+
+Ces tailles dépendent en général de la taille de la fenêtre : le cache est
+vidé quand celle-ci change. En mode headless, seules les dimensions sont
+renvoyées (``TextureInfo``).
+"""
+
+from typing import Callable, Dict, Optional, Tuple
+import logging
+
+import arcade
+import PIL.Image
+
+from .headless import TextureInfo, is_headless
+
+logger = logging.getLogger(__name__)
+
+Key = Tuple[str, int, int, Tuple[int, ...]]
+
+# Image unique des rectangles de couleur (teintés par sprite.color)
+_WHITE_IMAGE = None
+
+
+def _white_image() -> arcade.texture.ImageData:
+    global _WHITE_IMAGE
+    if _WHITE_IMAGE is None:
+        _WHITE_IMAGE = arcade.texture.ImageData(
+            PIL.Image.new("RGBA", (32, 32), (255, 255, 255, 255)), hash="procedural_solid_white"
+        )
+    return _WHITE_IMAGE
+
+
+class ProceduralTextureCache:
+    """Textures générées, indexées par (forme, largeur, hauteur, couleur)."""
+
+    def __init__(self):
+        self._textures: Dict[Key, arcade.Texture] = {}
+        self._window_size: Optional[Tuple[int, int]] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _check_window_size(self):
+        """Vide le cache si la fenêtre a changé de taille depuis le dernier appel."""
+        try:
+            window = arcade.get_window()
+        except RuntimeError:
+            return
+        size = (window.width, window.height)
+        if self._window_size is not None and size != self._window_size and self._textures:
+            logger.debug(f"Fenêtre redimensionnée: {len(self._textures)} texture(s) procédurale(s) évincée(s)")
+            self.clear()
+        self._window_size = size
+
+    def get(self, kind: str, width: int, height: int, color: Tuple[int, ...],
+            factory: Callable[[int, int, Tuple[int, ...]], arcade.Texture]) -> arcade.Texture:
+        """
+        Retourne la texture (kind, width, height, color), générée par `factory` au premier appel.
+
+        Args:
+            kind: Nom de la forme (clé du cache)
+            width: Largeur en pixels
+            height: Hauteur en pixels
+            color: Couleur RGBA
+            factory: (width, height, color) -> arcade.Texture
+        """
+        width, height, color = int(width), int(height), tuple(color)
+        if is_headless():
+            # Seules les dimensions comptent pour la simulation
+            return TextureInfo(f":{kind}:", width, height)
+        self._check_window_size()
+        key = (kind, width, height, color)
+        texture = self._textures.get(key)
+        if texture is not None:
+            self.hits += 1
+            return texture
+        self.misses += 1
+        texture = factory(width, height, color)
+        self._textures[key] = texture
+        return texture
+
+    def soft_ellipse(self, width: int, height: int, color: Tuple[int, ...]) -> arcade.Texture:
+        """Ellipse à bords doux (ombres)."""
+        return self.get("soft_ellipse", width, height, color, _make_soft_ellipse)
+
+    def solid(self, width: int, height: int) -> arcade.Texture:
+        """Rectangle blanc de la taille demandée, à teinter avec ``sprite.color``."""
+        return self.get("solid", width, height, (255, 255, 255, 255), _make_solid)
+
+    def clear(self):
+        self.evictions += len(self._textures)
+        self._textures.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Compteurs d'instrumentation du cache."""
+        return {
+            "entries": len(self._textures),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._textures)
+
+
+def _make_soft_ellipse(width: int, height: int, color: Tuple[int, ...]) -> arcade.Texture:
+    try:
+        return arcade.make_soft_ellipse_texture(width, height, color)
+    except Exception:
+        # Versions d'Arcade sans ellipse : cercle doux, puis cercle plein
+        diameter = max(width, height)
+        try:
+            return arcade.make_soft_circle_texture(diameter, color)
+        except Exception:
+            return arcade.make_circle_texture(diameter, color)
+
+
+def _make_solid(width: int, height: int, color: Tuple[int, ...]) -> arcade.Texture:
+    # Même principe que SpriteSolidColor : une image partagée, taille et hit box par texture
+    texture = arcade.Texture(
+        _white_image(),
+        hit_box_points=(
+            (-width / 2, -height / 2),
+            (width / 2, -height / 2),
+            (width / 2, height / 2),
+            (-width / 2, height / 2),
+        ),
+    )
+    texture.size = width, height
+    return texture
+
+
+# Instance globale du cache
+_procedural_textures = None
+
+
+def get_procedural_textures() -> ProceduralTextureCache:
+    """Retourne l'instance globale du cache de textures procédurales."""
+    global _procedural_textures
+    if _procedural_textures is None:
+        _procedural_textures = ProceduralTextureCache()
+    return _procedural_textures
+
+
+def soft_ellipse_texture(width: int, height: int, color: Tuple[int, ...]) -> arcade.Texture:
+    """Fonction utilitaire : ellipse douce en cache."""
+    return get_procedural_textures().soft_ellipse(width, height, color)
+
+
+def solid_texture(width: int, height: int) -> arcade.Texture:
+    """Fonction utilitaire : rectangle blanc en cache."""
+    return get_procedural_textures().solid(width, height)
@@ -0,0 +1,237 @@
+"""
+Instrumentation des frames : overlay de performance, minuteurs nommés et trace.
+
+``BaseView`` mesure automatiquement l'update et le draw de chaque scène et
+affiche l'overlay (F3) : FPS, millisecondes d'update / draw, minuteurs nommés,
+nombre d'appels ``arcade.draw_*``, de draws GPU et de textures liées du frame,
+sprites par SpriteList et état du cache de textures. Les scènes entourent leurs sections coûteuses avec::
+
+    with self.profiler.timer("repulsion"):
+        ...
+
+F4 démarre / arrête l'enregistrement d'une trace au format Chrome
+(``chrome://tracing`` ou https://ui.perfetto.dev), écrite dans ``traces/``.
+Quand ni l'overlay ni la trace ne sont actifs, les minuteurs ne coûtent
+presque rien.
+"""
+
+import json
+import os
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Deque, Dict, List, Optional
+import logging
+
+import arcade
+from arcade.gl import Texture2D, VertexArray
+
+from .asset_baker import PROJECT_ROOT
+
+logger = logging.getLogger(__name__)
+
+# Nombre de frames conservées pour les moyennes de l'overlay
+HISTORY_FRAMES = 120
+TRACE_DIR = PROJECT_ROOT / "traces"
+
+_NULL_TIMER = nullcontext()
+
+
+class FrameProfiler:
+    """Collecte les temps par frame (update, draw, minuteurs nommés) et les appels draw_*."""
+
+    def __init__(self, history: int = HISTORY_FRAMES):
+        self.enabled = False
+        # ms accumulées pendant le frame en cours, par nom
+        self._current: Dict[str, float] = defaultdict(float)
+        self._history: Deque[Dict[str, float]] = deque(maxlen=history)
+        self._frame_starts: Deque[float] = deque(maxlen=history)
+        # Mode compteur seul (benchmark) : ni overlay ni trace
+        self.counting = False
+        # Appels arcade.draw_*, draws GPU (VertexArray.render) et textures liées (Texture2D.use)
+        self.draw_calls = 0
+        self.gl_draws = 0
+        self.texture_binds = 0
+        self.last_draw_calls = 0
+        self.last_gl_draws = 0
+        self.last_texture_binds = 0
+        # Fonctions arcade.draw_* d'origine, tant que le compteur est installé
+        self._draw_originals: Dict[str, object] = {}
+        # (classe du backend, méthode) -> méthode d'origine
+        self._gl_originals: Dict[tuple, object] = {}
+        # Trace Chrome en cours d'enregistrement
+        self._trace: Optional[List[dict]] = None
+        self._trace_origin = 0.0
+        self._frame_index = 0
+
+    @property
+    def active(self) -> bool:
+        return self.enabled or self.counting or self._trace is not None
+
+    # ----- Activation -----
+    def set_enabled(self, enabled: bool):
+        """Affiche / masque l'overlay (et active les mesures)."""
+        self.enabled = enabled
+        self._update_draw_counter()
+
+    def set_counting(self, counting: bool):
+        """Compte les appels de rendu sans afficher l'overlay (utilisé par le benchmark)."""
+        self.counting = counting
+        self._update_draw_counter()
+
+    def toggle(self) -> bool:
+        self.set_enabled(not self.enabled)
+        return self.enabled
+
+    def _update_draw_counter(self):
+        if self.active and not self._draw_originals:
+            self._install_draw_counter()
+        elif not self.active and self._draw_originals:
+            self._uninstall_draw_counter()
+
+    def _install_draw_counter(self):
+        """Remplace les fonctions arcade.draw_* par des versions qui se comptent."""
+        for name in dir(arcade):
+            original = getattr(arcade, name)
+            if not name.startswith("draw_") or not callable(original):
+                continue
+
+            def counted(*args, _original=original, **kwargs):
+                self.draw_calls += 1
+                return _original(*args, **kwargs)
+
+            self._draw_originals[name] = original
+            setattr(arcade, name, counted)
+
+        # Appels envoyés au GPU par arcade.gl : SpriteList, formes et draw_* y passent tous
+        for base, method, counter in ((VertexArray, "render", "gl_draws"), (Texture2D, "use", "texture_binds")):
+            for cls in base.__subclasses__():
+                original = cls.__dict__.get(method)
+                if original is None:
+                    continue
+
+                def counted_gl(*args, _original=original, _counter=counter, **kwargs):
+                    setattr(self, _counter, getattr(self, _counter) + 1)
+                    return _original(*args, **kwargs)
+
+                self._gl_originals[(cls, method)] = original
+                setattr(cls, method, counted_gl)
+
+    def _uninstall_draw_counter(self):
+        for name, original in self._draw_originals.items():
+            setattr(arcade, name, original)
+        self._draw_originals.clear()
+        for (cls, method), original in self._gl_originals.items():
+            setattr(cls, method, original)
+        self._gl_originals.clear()
+
+    # ----- Mesures -----
+    def timer(self, name: str):
+        """Context manager mesurant une section nommée (cumulée sur le frame)."""
+        if not self.active:
+            return _NULL_TIMER
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, start, time.perf_counter())
+
+    def add_time(self, name: str, start: float, end: float):
+        """Ajoute une mesure (secondes perf_counter) au frame en cours et à la trace."""
+        if not self.active:
+            return
+        self._current[name] += (end - start) * 1000.0
+        if self._trace is not None:
+            self._trace.append({
+                "name": name, "ph": "X", "pid": os.getpid(), "tid": 0,
+                "ts": (start - self._trace_origin) * 1e6,
+                "dur": (end - start) * 1e6,
+            })
+
+    def end_frame(self):
+        """Clôt le frame (à appeler après le draw) ; retourne au compteur suivant."""
+        now = time.perf_counter()
+        self._frame_starts.append(now)
+        if self.active:
+            counts = {"draw_calls": self.draw_calls, "gl_draws": self.gl_draws,
+                      "texture_binds": self.texture_binds}
+            self._current.update(counts)
+            self._history.append(dict(self._current))
+            if self._trace is not None:
+                self._trace.append({
+                    "name": "draw_calls", "ph": "C", "pid": os.getpid(),
+                    "ts": (now - self._trace_origin) * 1e6,
+                    "args": counts,
+                })
+        self._current.clear()
+        self.last_draw_calls = self.draw_calls
+        self.last_gl_draws = self.gl_draws
+        self.last_texture_binds = self.texture_binds
+        self.draw_calls = self.gl_draws = self.texture_binds = 0
+        self._frame_index += 1
+
+    # ----- Lecture -----
+    def fps(self) -> float:
+        frames = self._frame_starts
+        if len(frames) < 2 or frames[-1] <= frames[0]:
+            return 0.0
+        return (len(frames) - 1) / (frames[-1] - frames[0])
+
+    def averages(self) -> Dict[str, float]:
+        """Moyenne par frame de chaque mesure sur l'historique (ms, ou nombre pour les compteurs)."""
+        if not self._history:
+            return {}
+        totals: Dict[str, float] = defaultdict(float)
+        for frame in self._history:
+            for name, value in frame.items():
+                totals[name] += value
+        return {name: total / len(self._history) for name, total in totals.items()}
+
+    # ----- Trace Chrome -----
+    @property
+    def tracing(self) -> bool:
+        return self._trace is not None
+
+    def start_trace(self):
+        """Commence à enregistrer chaque mesure pour une trace Chrome."""
+        self._trace = []
+        self._trace_origin = time.perf_counter()
+        self._update_draw_counter()
+        logger.info("Enregistrement de la trace démarré")
+
+    def stop_trace(self, path: Optional[Path] = None) -> Optional[Path]:
+        """Arrête l'enregistrement et écrit la trace JSON. Retourne le fichier écrit."""
+        if self._trace is None:
+            return None
+        events, self._trace = self._trace, None
+        self._update_draw_counter()
+        if path is None:
+            TRACE_DIR.mkdir(parents=True, exist_ok=True)
+            path = TRACE_DIR / f"trace_{time.strftime('%Y%m%d_%H%M%S')}.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        logger.info(f"Trace écrite: {path} ({len(events)} évènements)")
+        return path
+
+    def toggle_trace(self) -> Optional[Path]:
+        if self._trace is None:
+            self.start_trace()
+            return None
+        return self.stop_trace()
+
+
+# Instance globale du profileur
+_profiler = None
+
+
+def get_profiler() -> FrameProfiler:
+    """Retourne l'instance globale du profileur."""
+    global _profiler
+    if _profiler is None:
+        _profiler = FrameProfiler()
+    return _profiler
@@ -0,0 +1,332 @@
+"""
+Enregistrement et relecture des entrées joueur, pour rejouer une partie à l'identique.
+
+Chaque scène (``BaseView``) tire une graine de ``random`` à sa construction
+(ou à son ``reset()``) et l'applique à nouveau à son affichage ; ses entrées
+(touches, souris) sont notées avec le numéro du tick de simulation auquel
+elles arrivent. Une scène forme
+ainsi un segment (scène, graine, entrées, nombre de ticks) que ``replay()``
+rejoue tick par tick, sans attendre l'horloge : mêmes tirages aléatoires,
+mêmes entrées au même tick, donc la même partie et les mêmes pics de calcul.
+
+Le segment de la scène courante est toujours gardé en mémoire (quelques
+octets par entrée) : ``F5`` (ou ``main.py --record``) écrit la session dans
+``recordings/`` à partir du début de la scène en cours, jusqu'au prochain
+``F5`` ou à la fermeture du jeu.
+
+Format binaire (petit-boutiste), une suite d'enregistrements :
+    en-tête     b"OOSR" + version (u8)
+    scène       0 (u8), graine (u64), largeur, hauteur (u16), nom (u8 + UTF-8)
+    entrée      type (u8), tick (u32), arguments (voir ``_PAYLOADS``)
+    fin         255 (u8), ticks joués (u32)
+
+Limites : les widgets ``arcade.gui`` (boutons de l'AlienView) ne sont pas
+rejoués. En mode headless, les collisions sont des boîtes englobantes (voir
+``core.headless``) : une partie jouée avec une fenêtre se rejoue exactement
+avec ``--window``.
+
+Usage:
+    python -m core replay recordings/session_*.oosr [--window] [--slowest 5]
+"""
+
+import argparse
+import importlib
+import random
+import struct
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+import logging
+
+from .asset_baker import PROJECT_ROOT
+
+logger = logging.getLogger(__name__)
+
+RECORDINGS_DIR = PROJECT_ROOT / "recordings"
+MAGIC = b"OOSR"
+VERSION = 1
+
+PathLike = Union[str, Path]
+
+# Méthode de la vue -> (type d'enregistrement, format des arguments)
+_PAYLOADS: Dict[str, Tuple[int, str]] = {
+    "on_key_press": (1, "<ii"),             # key, modifiers
+    "on_key_release": (2, "<ii"),
+    "on_mouse_motion": (3, "<dddd"),        # x, y, dx, dy
+    "on_mouse_press": (4, "<ddii"),         # x, y, button, modifiers
+    "on_mouse_release": (5, "<ddii"),
+    "on_mouse_drag": (6, "<ddddii"),        # x, y, dx, dy, buttons, modifiers
+}
+_METHODS = {kind: (method, struct.Struct(fmt)) for method, (kind, fmt) in _PAYLOADS.items()}
+_RECORDS = {method: (kind, struct.Struct(fmt)) for method, (kind, fmt) in _PAYLOADS.items()}
+_SCENE, _END = 0, 255
+_HEADER = struct.Struct("<4sB")
+_KIND_TICK = struct.Struct("<BI")
+_SCENE_INFO = struct.Struct("<QHHB")
+
+# Entrée d'un segment : (tick, méthode de la vue, arguments)
+Event = Tuple[int, str, Tuple]
+
+# Graine imposée à la prochaine scène construite (relecture)
+_forced_seed: Optional[int] = None
+
+
+def new_scene_seed() -> int:
+    """
+    Graine de ``random`` d'une nouvelle scène.
+
+    Tirée de ``random`` lui-même (une simulation lancée avec une graine reste
+    donc reproductible), sauf si ``force_next_seed()`` en a imposé une.
+    """
+    global _forced_seed
+    if _forced_seed is not None:
+        seed, _forced_seed = _forced_seed, None
+        return seed
+    return random.getrandbits(32)
+
+
+def force_next_seed(seed: int):
+    """Impose la graine de la prochaine scène construite (ou remise à zéro)."""
+    global _forced_seed
+    _forced_seed = seed
+
+
+class Segment:
+    """Une scène jouée : graine, taille de fenêtre, entrées horodatées au tick."""
+
+    __slots__ = ("scene", "seed", "width", "height", "events", "ticks")
+
+    def __init__(self, scene: str, seed: int, width: int = 0, height: int = 0):
+        self.scene = scene
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.events: List[Event] = []
+        # Ticks joués (connu à la fin de la scène)
+        self.ticks = 0
+
+    def inputs(self) -> Dict[int, List[Tuple[str, Tuple]]]:
+        """Entrées groupées par tick (format ``InputScript`` de core.headless)."""
+        script: Dict[int, List[Tuple[str, Tuple]]] = {}
+        for tick, method, args in self.events:
+            script.setdefault(tick, []).append((method, args))
+        return script
+
+    def encode(self) -> bytes:
+        name = self.scene.encode("utf-8")
+        out = [bytes((_SCENE,)), _SCENE_INFO.pack(self.seed, self.width, self.height, len(name)), name]
+        for tick, method, args in self.events:
+            kind, payload = _RECORDS[method]
+            out.append(_KIND_TICK.pack(kind, tick))
+            out.append(payload.pack(*args))
+        out.append(_KIND_TICK.pack(_END, self.ticks))
+        return b"".join(out)
+
+
+def decode(data: bytes) -> List[Segment]:
+    """Relit un enregistrement ; retourne ses segments dans l'ordre de jeu."""
+    magic, version = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Enregistrement inconnu (en-tête {magic!r}, version {version})")
+    segments: List[Segment] = []
+    segment = None
+    pos = _HEADER.size
+    while pos < len(data):
+        kind = data[pos]
+        if kind == _SCENE:
+            seed, width, height, size = _SCENE_INFO.unpack_from(data, pos + 1)
+            pos += 1 + _SCENE_INFO.size
+            segment = Segment(data[pos:pos + size].decode("utf-8"), seed, width, height)
+            segments.append(segment)
+            pos += size
+            continue
+        kind, tick = _KIND_TICK.unpack_from(data, pos)
+        pos += _KIND_TICK.size
+        if segment is None:
+            raise ValueError("Entrée avant la première scène")
+        if kind == _END:
+            segment.ticks = tick
+            segment = None
+            continue
+        method, payload = _METHODS[kind]
+        segment.events.append((tick, method, payload.unpack_from(data, pos)))
+        pos += payload.size
+    return segments
+
+
+def load_recording(path: PathLike) -> List[Segment]:
+    with open(path, "rb") as f:
+        return decode(f.read())
+
+
+class InputRecorder:
+    """Garde le segment de la scène courante ; l'écrit dans un fichier pendant un enregistrement."""
+
+    def __init__(self):
+        self.segment: Optional[Segment] = None
+        self._view = None
+        self._file = None
+        self.path: Optional[Path] = None
+
+    @property
+    def recording(self) -> bool:
+        return self._file is not None
+
+    def begin_scene(self, view, seed: int):
+        """Nouvelle scène affichée : clôt le segment précédent et en ouvre un autre."""
+        self._end_segment()
+        window = view.window
+        self.segment = Segment(type(view).__name__, seed,
+                               int(window.width) if window else 0, int(window.height) if window else 0)
+        self._view = view
+
+    def record(self, view, method: str, args: Tuple):
+        """Note une entrée de la scène courante, au tick où elle arrive."""
+        if view is self._view and method in _RECORDS:
+            self.segment.events.append((view.tick, method, args))
+
+    def _end_segment(self):
+        if self.segment is not None and self._file is not None:
+            self.segment.ticks = self._view.tick
+            self._file.write(self.segment.encode())
+            self._file.flush()
+
+    def start(self, path: Optional[PathLike] = None) -> Path:
+        """Commence à écrire la session (depuis le début de la scène en cours)."""
+        if self._file is not None:
+            return self.path
+        if path is None:
+            RECORDINGS_DIR.mkdir(parents=True, exist_ok=True)
+            path = RECORDINGS_DIR / f"session_{time.strftime('%Y%m%d_%H%M%S')}.oosr"
+        self.path = Path(path)
+        self._file = open(self.path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION))
+        logger.info(f"Enregistrement des entrées: {self.path}")
+        return self.path
+
+    def stop(self) -> Optional[Path]:
+        """Écrit la scène en cours (jusqu'au tick actuel) et ferme le fichier."""
+        if self._file is None:
+            return None
+        self._end_segment()
+        self._file.close()
+        self._file = None
+        logger.info(f"Enregistrement écrit: {self.path}")
+        return self.path
+
+    def toggle(self) -> Optional[Path]:
+        if self._file is None:
+            self.start()
+            return None
+        return self.stop()
+
+
+# Instance globale de l'enregistreur
+_recorder = None
+
+
+def get_recorder() -> InputRecorder:
+    """Retourne l'instance globale de l'enregistreur d'entrées."""
+    global _recorder
+    if _recorder is None:
+        _recorder = InputRecorder()
+    return _recorder
+
+
+def replay_segment(segment: Segment, window=None) -> Dict:
+    """
+    Rejoue un segment tick par tick, aussi vite que possible.
+
+    Args:
+        segment: Scène enregistrée
+        window: Fenêtre Arcade (cachée) pour rejouer avec les vraies collisions
+            et mesurer aussi le draw ; None = mode headless
+
+    Returns:
+        dict: Scène, ticks joués, scène suivante, temps par tick (ms)
+    """
+    from .headless import get_headless_window, set_headless
+    from scenes.registry import get_scene_class
+
+    view_class = get_scene_class(segment.scene)
+    # Même graine qu'à l'enregistrement, dès la construction de la vue
+    force_next_seed(segment.seed)
+    view = view_class()
+    if window is not None:
+        host = window
+        window.show_view(view)
+    else:
+        host = get_headless_window() or set_headless(True)
+        host.reset()
+        host.current_view = view
+        view.on_show_view()
+
+    inputs = segment.inputs()
+    update_ms: List[float] = []
+    draw_ms: List[float] = []
+    while view.tick < segment.ticks and host.current_view is view:
+        for method, args in inputs.get(view.tick, ()):
+            getattr(view, method)(*args)
+        # Une entrée a pu changer de scène (la suite est dans le segment suivant)
+        if host.current_view is not view:
+            break
+        start = time.perf_counter()
+        view.step()
+        update_ms.append((time.perf_counter() - start) * 1000.0)
+        if window is not None and window.current_view is view:
+            start = time.perf_counter()
+            view.on_draw()
+            window.ctx.finish()
+            draw_ms.append((time.perf_counter() - start) * 1000.0)
+
+    if window is None:
+        next_scene = host.transitions[0] if host.transitions else None
+    else:
+        next_scene = type(window.current_view).__name__ if window.current_view is not view else None
+    return {
+        "scene": segment.scene,
+        "seed": segment.seed,
+        "ticks": view.tick,
+        "recorded_ticks": segment.ticks,
+        "next_scene": next_scene,
+        "update_ms": update_ms,
+        "draw_ms": draw_ms,
+    }
+
+
+def replay(path: PathLike, window=None) -> List[Dict]:
+    """Rejoue toutes les scènes d'un enregistrement (voir replay_segment)."""
+    return [replay_segment(segment, window) for segment in load_recording(path)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rejoue une session enregistrée (F5 en jeu).")
+    parser.add_argument("recording", type=Path, help="Fichier .oosr")
+    parser.add_argument("--window", action="store_true",
+                        help="Fenêtre cachée : collisions Arcade exactes, draw mesuré")
+    parser.add_argument("--slowest", type=int, default=5, help="Ticks les plus lents affichés par scène")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    window = None
+    if args.window:
+        import arcade
+        window = arcade.Window(1080, 720, "replay", visible=False)
+    else:
+        from .headless import set_headless
+        set_headless(True)
+    # Les scènes s'importent après le choix du mode
+    importlib.import_module("scenes")
+
+    for result in replay(args.recording, window):
+        ticks = result["ticks"]
+        update_ms = result["update_ms"]
+        total = sum(update_ms)
+        print(f"{result['scene']} (graine {result['seed']}): {ticks}/{result['recorded_ticks']} ticks, "
+              f"update {total:.1f} ms -> {result['next_scene'] or 'fin de l enregistrement'}")
+        slowest = sorted(range(len(update_ms)), key=update_ms.__getitem__, reverse=True)[:args.slowest]
+        for tick in slowest:
+            draw = f", draw {result['draw_ms'][tick]:.2f} ms" if tick < len(result["draw_ms"]) else ""
+            print(f"  tick {tick}: update {update_ms[tick]:.2f} ms{draw}")
+    if window is not None:
+        window.close()
@@ -3,14 +3,57 @@ Gestionnaire centralisé des effets sonores pour le jeu OUT OF SCALE.
 
 Ce module gère le chargement, la lecture et le contrôle du volume des effets sonores.
 Il utilise arcade.Sound pour une intégration optimale avec le framework.
+
+Au démarrage, seul l'index des fichiers disponibles est construit : chaque son
+est décodé lors de son premier play_sound(). Les fichiers dépassant
+``stream_threshold`` octets (longues ambiances) sont lus en streaming au lieu
+d'être décodés entièrement en mémoire. Les autres sont décodés une fois pour
+toutes dans le cache disque (``core.audio_cache``) puis relus tels quels.
+
+Les lectures passent par un nombre fixe de voix (``max_voices``). Chaque son a
+une polyphonie maximale et un intervalle minimal entre deux départs
+(``sound_limits``) : un son redemandé trop tôt est ignoré (compté dans
+``dropped``), un son qui a déjà toutes ses voix, ou un départ alors que
+toutes les voix sont prises, coupe la voix la plus ancienne (``stolen``) ;
+les sons longs (ambiances, musiques) ne sont volés qu'en dernier recours.
+Le nombre de players pyglet actifs reste ainsi borné quoi que demande la
+logique de jeu (un son de pas à chaque tick, par exemple).
 """
 
 import arcade
 import os
+import threading
+import time
+from collections import Counter
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
+from .audio_cache import get_audio_cache
+from .headless import is_headless
+
+# Taille à partir de laquelle un fichier est lu en streaming (octets)
+DEFAULT_STREAM_THRESHOLD = 512 * 1024
+
+# Nombre de voix (players pyglet) simultanées, tous sons confondus
+DEFAULT_MAX_VOICES = 16
+# Durée (s) à partir de laquelle un son est une ambiance, volée en dernier
+LONG_SOUND_SECONDS = 5.0
+# Limites par son : (voix simultanées max, intervalle min entre deux départs en s)
+DEFAULT_SOUND_LIMIT = (4, 0.03)
+DEFAULT_SOUND_LIMITS: Dict[str, Tuple[int, float]] = {
+    'FootstepSound': (2, 0.25),
+    'ClickSound': (2, 0.05),
+    'DogBarkSound': (2, 0.15),
+    'DogSound': (1, 0.5),
+    'CarCrashSound': (3, 0.1),
+    'ExplosionSound': (3, 0.1),
+    'Impact_Laser': (4, 0.05),
+    'ALIEN_Ambiance': (1, 1.0),
+    'AntSound': (1, 1.0),
+    'AtomSound': (1, 1.0),
+}
+
 # Configuration du logging pour déboguer les sons
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -19,15 +62,34 @@ logger = logging.getLogger(__name__)
 class SoundManager:
     """Gestionnaire centralisé des sons du jeu."""
     
-    def __init__(self, sounds_directory: str = "sounds"):
+    def __init__(self, sounds_directory: str = "sounds", stream_threshold: int = DEFAULT_STREAM_THRESHOLD,
+                 max_voices: int = DEFAULT_MAX_VOICES):
         """
         Initialise le gestionnaire de sons.
         
         Args:
             sounds_directory: Chemin vers le dossier contenant les fichiers audio
+            stream_threshold: Taille de fichier (octets) au-delà de laquelle le son est lu en streaming
+            max_voices: Nombre maximum de sons joués simultanément
         """
         self.sounds_directory = Path(sounds_directory)
+        self.stream_threshold = stream_threshold
+        # Index construit au démarrage : nom -> fichier (aucun décodage)
+        self.sound_paths: Dict[str, Path] = {}
+        self.sound_sizes: Dict[str, int] = {}
+        # Sons déjà décodés en mémoire (les sons en streaming n'y figurent pas)
         self.sounds: Dict[str, arcade.Sound] = {}
+        # Sons chargés par chemin (musiques de scène), partagés entre les vues
+        self._file_sounds: Dict[str, arcade.Sound] = {}
+        self._file_lock = threading.Lock()
+        # Voix en cours (nom, player, départ, son long), de la plus ancienne à la plus récente
+        self.max_voices = max_voices
+        self.voices: List[Tuple[str, object, float, bool]] = []
+        self.sound_limits: Dict[str, Tuple[int, float]] = dict(DEFAULT_SOUND_LIMITS)
+        self._last_start: Dict[str, float] = {}
+        self.played = 0
+        self.stolen = 0
+        self.dropped: Counter = Counter()
         self.master_volume = 1.0
         self.sfx_volume = 0.7
         self.music_volume = 0.5
@@ -41,10 +103,10 @@ class SoundManager:
             'feedback': ['ExplosionSound']
         }
         
-        self._load_sounds()
+        self._index_sounds()
     
-    def _load_sounds(self):
-        """Charge tous les fichiers audio du dossier sounds."""
+    def _index_sounds(self):
+        """Recense les fichiers audio du dossier sounds sans les décoder."""
         if not self.sounds_directory.exists():
             logger.warning(f"Le dossier {self.sounds_directory} n'existe pas. Création du dossier...")
             self.sounds_directory.mkdir(parents=True, exist_ok=True)
@@ -58,11 +120,38 @@ class SoundManager:
             if audio_file.suffix.lower() in audio_extensions:
                 try:
                     sound_name = audio_file.stem  # nom sans extension
-                    sound = arcade.Sound(str(audio_file))
-                    self.sounds[sound_name] = sound
-                    logger.info(f"Son chargé: {sound_name}")
+                    self.sound_paths[sound_name] = audio_file
+                    self.sound_sizes[sound_name] = audio_file.stat().st_size
+                except Exception as e:
+                    logger.error(f"Erreur lors de l'indexation de {audio_file}: {e}")
+        logger.info(f"{len(self.sound_paths)} son(s) indexé(s)")
+
+    def is_streamed(self, sound_name: str) -> bool:
+        """True si le son est lu en streaming (fichier plus gros que stream_threshold)."""
+        return self.sound_sizes.get(sound_name, 0) >= self.stream_threshold
+
+    def _get_sound(self, sound_name: str) -> arcade.Sound:
+        """Retourne le son, décodé au premier appel (ou un nouveau flux pour les sons en streaming)."""
+        sound = self.sounds.get(sound_name)
+        if sound is not None:
+            return sound
+        path = str(self.sound_paths[sound_name])
+        if self.is_streamed(sound_name):
+            # Une source en streaming ne peut être jouée qu'une fois : on rouvre le fichier à chaque lecture
+            return arcade.Sound(path, streaming=True)
+        sound = get_audio_cache().load(path)
+        self.sounds[sound_name] = sound
+        logger.info(f"Son chargé: {sound_name}")
+        return sound
+
+    def preload(self, *sound_names: str):
+        """Décode à l'avance des sons (non streamés) pour éviter la latence au premier play_sound."""
+        for sound_name in sound_names:
+            if sound_name in self.sound_paths and not self.is_streamed(sound_name):
+                try:
+                    self._get_sound(sound_name)
                 except Exception as e:
-                    logger.error(f"Erreur lors du chargement de {audio_file}: {e}")
+                    logger.error(f"Erreur lors du chargement de {sound_name}: {e}")
     
     def _create_sample_sounds(self):
         """Crée des fichiers d'exemple pour les développeurs."""
@@ -88,6 +177,29 @@ Exemples de noms recommandés:
         with open(self.sounds_directory / "README.txt", "w", encoding="utf-8") as f:
             f.write(sample_sounds_info)
     
+    def load_file(self, path: str) -> arcade.Sound:
+        """
+        Charge un fichier audio hors du dossier sounds (musique de scène) une seule fois.
+
+        Peut être appelé depuis le thread de préchargement.
+
+        Args:
+            path: Chemin du fichier audio
+
+        Returns:
+            arcade.Sound, ou None en mode headless (aucun décodage)
+        """
+        if is_headless():
+            return None
+        key = os.path.normpath(os.path.abspath(path))
+        with self._file_lock:
+            sound = self._file_sounds.get(key)
+        if sound is not None:
+            return sound
+        sound = get_audio_cache().load(key)
+        with self._file_lock:
+            return self._file_sounds.setdefault(key, sound)
+
     def play_sound(self, sound_name: str, volume: Optional[float] = None) -> bool:
         """
         Joue un effet sonore.
@@ -99,22 +211,131 @@ Exemples de noms recommandés:
         Returns:
             bool: True si le son a été joué, False sinon
         """
-        if self.muted:
+        if self.muted or is_headless():
             return False
             
-        if sound_name not in self.sounds:
+        if sound_name not in self.sound_paths:
             logger.warning(f"Son non trouvé: {sound_name}")
             return False
         
+        allowed, victim = self._claim_voice(sound_name)
+        if not allowed:
+            return False
         try:
             effective_volume = self._calculate_volume(sound_name, volume)
-            arcade.play_sound(self.sounds[sound_name], volume=effective_volume)
+            if not self._start_voice(sound_name, self._get_sound(sound_name), effective_volume, victim):
+                return False
             logger.debug(f"Son joué: {sound_name} (volume: {effective_volume:.2f})")
             return True
         except Exception as e:
             logger.error(f"Erreur lors de la lecture de {sound_name}: {e}")
             return False
     
+    def play_loaded(self, sound: Optional[arcade.Sound], volume: float = 1.0) -> bool:
+        """
+        Joue un son obtenu par load_file (musique de scène).
+
+        Returns:
+            bool: True si le son a été joué (False si muet, headless, son absent ou limité)
+        """
+        if sound is None or self.muted or is_headless():
+            return False
+        name = str(sound.file_name)
+        allowed, victim = self._claim_voice(name)
+        if not allowed:
+            return False
+        try:
+            return self._start_voice(name, sound, volume, victim)
+        except Exception as e:
+            logger.error(f"Erreur lors de la lecture d'un son: {e}")
+            return False
+
+    # ----- Voix -----
+    def _reap_voices(self):
+        """Oublie les voix dont la lecture est terminée."""
+        self.voices = [
+            voice for voice in self.voices
+            if voice[1].source is not None and voice[1].playing
+        ]
+
+    def _stop_voice(self, voice: Tuple[str, object, float, bool]):
+        self.voices.remove(voice)
+        self.stolen += 1
+        try:
+            arcade.stop_sound(voice[1])
+        except Exception as e:
+            logger.debug(f"Voix déjà libérée ({voice[0]}): {e}")
+
+    def _claim_voice(self, name: str) -> Tuple[bool, Optional[Tuple[str, object, float, bool]]]:
+        """
+        Applique les limites avant un départ de `name` ; ne coupe encore rien.
+
+        Returns:
+            tuple: (False, None) si le son est redemandé avant son intervalle
+                minimal, sinon (True, voix à libérer une fois le son parti ou None)
+        """
+        max_polyphony, min_interval = self.sound_limits.get(name, DEFAULT_SOUND_LIMIT)
+        last = self._last_start.get(name)
+        if last is not None and time.monotonic() - last < min_interval:
+            self.dropped[name] += 1
+            return False, None
+        self._reap_voices()
+        same = [voice for voice in self.voices if voice[0] == name]
+        if len(same) >= max_polyphony:
+            return True, same[0]
+        if len(self.voices) >= self.max_voices:
+            short = [voice for voice in self.voices if not voice[3]]
+            return True, short[0] if short else self.voices[0]
+        return True, None
+
+    def _start_voice(self, name: str, sound: arcade.Sound, volume: float,
+                     victim: Optional[Tuple[str, object, float, bool]] = None) -> bool:
+        """Lance le son ; la voix `victim` n'est coupée, et le départ compté, que s'il a démarré."""
+        player = arcade.play_sound(sound, volume=volume)
+        if player is None:
+            return False
+        if victim is not None:
+            self._stop_voice(victim)
+        now = time.monotonic()
+        self._last_start[name] = now
+        # Durée inconnue (streaming) : traité comme une ambiance
+        duration = sound.source.duration
+        long = duration is None or duration >= LONG_SOUND_SECONDS
+        self.voices.append((name, player, now, long))
+        self.played += 1
+        return True
+
+    def set_sound_limit(self, sound_name: str, max_polyphony: int, min_interval: float = 0.0):
+        """
+        Définit la polyphonie maximale et l'intervalle minimal (s) entre deux départs d'un son.
+
+        Args:
+            sound_name: Nom du son (ou fichier pour play_loaded)
+            max_polyphony: Nombre de lectures simultanées autorisées
+            min_interval: Délai minimal entre deux départs, en secondes
+        """
+        self.sound_limits[sound_name] = (max(1, int(max_polyphony)), max(0.0, float(min_interval)))
+
+    def stop_all_voices(self):
+        """Coupe tous les sons en cours."""
+        for _name, player, _start, _long in self.voices:
+            try:
+                arcade.stop_sound(player)
+            except Exception:
+                pass
+        self.voices.clear()
+
+    def voice_stats(self) -> Dict[str, int]:
+        """Compteurs d'instrumentation des voix."""
+        self._reap_voices()
+        return {
+            "active": len(self.voices),
+            "max": self.max_voices,
+            "played": self.played,
+            "stolen": self.stolen,
+            "dropped": sum(self.dropped.values()),
+        }
+
     def _calculate_volume(self, sound_name: str, custom_volume: Optional[float] = None) -> float:
         """Calcule le volume effectif en tenant compte des catégories et paramètres."""
         base_volume = custom_volume if custom_volume is not None else self.sfx_volume
@@ -232,12 +453,14 @@ Exemples de noms recommandés:
     
     def get_available_sounds(self) -> list:
         """Retourne la liste des sons disponibles."""
-        return list(self.sounds.keys())
+        return list(self.sound_paths.keys())
     
     def reload_sounds(self):
         """Recharge tous les sons depuis le dossier."""
         self.sounds.clear()
-        self._load_sounds()
+        self.sound_paths.clear()
+        self.sound_sizes.clear()
+        self._index_sounds()
         logger.info("Sons rechargés")
 
 
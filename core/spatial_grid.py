@@ -0,0 +1,61 @@
+"""
+Grille spatiale uniforme pour les requêtes de voisinage.
+
+Les sprites qui bougent à chaque tick rendent le ``use_spatial_hash``
+d'Arcade coûteux (le hash est mis à jour à chaque déplacement). Ici la
+grille est reconstruite une fois par tick, en O(n), puis interrogée autant
+de fois que nécessaire : une requête ne parcourt que les cellules qui
+touchent le cercle demandé.
+
+Fonctionne avec tout objet exposant ``center_x`` / ``center_y`` (sprites
+Arcade comme entités sans fenêtre).
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+
+class SpatialGrid:
+    """Indexe des objets par cellule carrée de `cell_size` pixels."""
+
+    def __init__(self, cell_size: float = 64.0):
+        self.cell_size = float(cell_size)
+        self._cells: Dict[Tuple[int, int], List] = defaultdict(list)
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def rebuild(self, items: Iterable):
+        """Vide la grille et y range chaque objet selon sa position actuelle."""
+        cells = self._cells
+        cells.clear()
+        size = self.cell_size
+        for item in items:
+            cells[(int(item.center_x // size), int(item.center_y // size))].append(item)
+
+    def insert(self, item):
+        self._cells[self._cell(item.center_x, item.center_y)].append(item)
+
+    def query(self, x: float, y: float, radius: float) -> List:
+        """
+        Objets des cellules couvertes par le cercle (x, y, radius).
+
+        Le résultat est un sur-ensemble : la distance exacte reste à tester.
+        """
+        size = self.cell_size
+        x0, x1 = int((x - radius) // size), int((x + radius) // size)
+        y0, y1 = int((y - radius) // size), int((y + radius) // size)
+        cells = self._cells
+        found = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+    def clear(self):
+        self._cells.clear()
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._cells.values())
@@ -0,0 +1,119 @@
+"""
+Pool de sprites réutilisables pour les entités de courte durée.
+
+Au lieu de créer un sprite à chaque spawn puis de le jeter avec
+``remove_from_sprite_lists()``, une scène demande un sprite au pool
+(``acquire``) et le rend quand il a fini de servir (``release``). Un sprite
+rendu reste dans sa SpriteList : il est seulement masqué et garé loin de
+l'écran, où il ne touche rien. Le buffer GPU de la SpriteList ne change donc
+pas de taille et rien n'est alloué pendant les phases les plus chargées.
+
+La logique de jeu parcourt ``pool.active`` (sprites en service) plutôt que
+la SpriteList, qui contient aussi les sprites garés. L'ordre de ``active``
+n'est pas garanti : ``release`` remplace le sprite rendu par le dernier.
+
+Un sprite tiré du pool part de ``PARK_POSITION`` : l'interpolation de
+l'affichage (``BaseView``) ne part jamais de cette position.
+"""
+
+from collections import defaultdict
+from typing import Callable, Dict, Hashable, List
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Position des sprites rendus au pool (hors de tout écran et de toute collision)
+PARK_POSITION = (-100000.0, -100000.0)
+
+
+class SpritePool:
+    """Sprites d'une SpriteList recyclés par acquire() / release()."""
+
+    def __init__(self, sprite_list, factory: Callable[[Hashable], object], name: str = "pool"):
+        """
+        Args:
+            sprite_list: SpriteList (ou EntityList) où vivent les sprites du pool
+            factory: Crée un sprite neuf pour une clé (texture, couleur...)
+            name: Nom affiché dans les statistiques
+        """
+        self.sprite_list = sprite_list
+        self.factory = factory
+        self.name = name
+        self.active: List = []
+        # id(sprite) -> index dans active (retrait en O(1))
+        self._index: Dict[int, int] = {}
+        # Sprites garés, par clé : un sprite ne sert qu'à la clé qui l'a créé
+        self._free: Dict[Hashable, List] = defaultdict(list)
+        self._keys: Dict[int, Hashable] = {}
+        self.created = 0
+        self.reused = 0
+        self.high_water = 0
+
+    def __len__(self) -> int:
+        return len(self.active)
+
+    def __iter__(self):
+        return iter(self.active)
+
+    def __contains__(self, sprite) -> bool:
+        return id(sprite) in self._index
+
+    def acquire(self, key: Hashable = None):
+        """
+        Retourne un sprite visible pour `key` (garé si disponible, sinon neuf).
+
+        Position, vitesse et angle sont à régler par l'appelant.
+        """
+        free = self._free.get(key)
+        if free:
+            sprite = free.pop()
+            sprite.visible = True
+            self.reused += 1
+        else:
+            sprite = self.factory(key)
+            self._keys[id(sprite)] = key
+            self.sprite_list.append(sprite)
+            self.created += 1
+        self._index[id(sprite)] = len(self.active)
+        self.active.append(sprite)
+        if len(self.active) > self.high_water:
+            self.high_water = len(self.active)
+        return sprite
+
+    def release(self, sprite):
+        """Masque et gare le sprite ; il reste dans sa SpriteList."""
+        i = self._index.pop(id(sprite), None)
+        if i is None:
+            logger.debug(f"{self.name}: sprite rendu deux fois")
+            return
+        # Le dernier sprite actif prend la place du sprite rendu
+        last = self.active.pop()
+        if last is not sprite:
+            self.active[i] = last
+            self._index[id(last)] = i
+        sprite.visible = False
+        sprite.change_x = 0.0
+        sprite.change_y = 0.0
+        sprite.position = PARK_POSITION
+        self._free[self._keys[id(sprite)]].append(sprite)
+
+    def release_all(self):
+        # Toujours le dernier : aucun déplacement dans active
+        while self.active:
+            self.release(self.active[-1])
+
+    def prewarm(self, count: int, key: Hashable = None):
+        """Crée d'avance `count` sprites garés pour `key` (hors partie)."""
+        sprites = [self.acquire(key) for _ in range(count)]
+        for sprite in sprites:
+            self.release(sprite)
+
+    def stats(self) -> Dict[str, int]:
+        """Compteurs d'instrumentation du pool."""
+        return {
+            "active": len(self.active),
+            "free": sum(len(free) for free in self._free.values()),
+            "created": self.created,
+            "reused": self.reused,
+            "high_water": self.high_water,
+        }
@@ -0,0 +1,100 @@
+"""
+Textes conservés d'un frame à l'autre, dessinés en un seul batch pyglet.
+
+``arcade.draw_text`` reconstruit une mise en page pyglet à chaque appel. Une
+scène demande plutôt ses libellés au cache, avec une clé stable, dans son
+``on_draw`` ::
+
+    self.labels.text("score", f"Score: {self.score}", 10, 690, arcade.color.WHITE, 20)
+
+Le premier appel crée un ``arcade.Text`` dans le batch de la scène ; les
+suivants ne touchent à l'objet que si le texte, la position, la couleur ou
+la taille ont changé (un autre style recrée le libellé). ``draw()`` dessine
+tous les libellés demandés pendant le frame en un seul appel et masque ceux
+qui ne l'ont pas été. ``BaseView`` l'appelle à la fin de ``on_draw`` si la
+scène ne l'a pas fait elle-même (une seule fois par frame).
+"""
+
+from typing import Any, Dict, Hashable, Set, Tuple
+
+import arcade
+import pyglet
+
+
+class TextCache:
+    """Registre de libellés arcade.Text partageant un pyglet Batch."""
+
+    def __init__(self):
+        self.batch = pyglet.graphics.Batch()
+        self._labels: Dict[Hashable, arcade.Text] = {}
+        # Dernier état appliqué : (texte, x, y, couleur, taille) et style
+        self._state: Dict[Hashable, Tuple] = {}
+        self._style: Dict[Hashable, Dict[str, Any]] = {}
+        self._touched: Set[Hashable] = set()
+        self.layouts = 0
+
+    @property
+    def pending(self) -> bool:
+        """Des libellés ont été demandés depuis le dernier draw()."""
+        return bool(self._touched)
+
+    def text(self, key: Hashable, text: Any, x: float, y: float,
+             color=arcade.color.WHITE, font_size: float = 12, **style) -> arcade.Text:
+        """
+        Affiche `text` ce frame-ci sous la clé `key` ; retourne l'arcade.Text conservé.
+
+        Args:
+            key: Identifiant stable du libellé dans la scène
+            text: Contenu (converti en str)
+            x, y: Position
+            color: Couleur
+            font_size: Taille de police
+            **style: Autres arguments d'arcade.Text (anchor_x, multiline, width...)
+        """
+        text = str(text)
+        state = (text, x, y, color, font_size)
+        label = self._labels.get(key)
+        if label is not None and self._style[key] != style:
+            label.label.delete()
+            label = None
+        if label is None:
+            label = arcade.Text(text, x, y, color, font_size, batch=self.batch, **style)
+            self._labels[key] = label
+            self._style[key] = style
+            self.layouts += 1
+        elif self._state[key] != state:
+            old_text, old_x, old_y, old_color, old_size = self._state[key]
+            if text != old_text:
+                label.text = text
+                self.layouts += 1
+            if (x, y) != (old_x, old_y):
+                label.position = (x, y)
+            if color != old_color:
+                label.color = color
+            if font_size != old_size:
+                label.font_size = font_size
+        self._state[key] = state
+        if key not in self._touched:
+            self._touched.add(key)
+            if not label.visible:
+                label.visible = True
+        return label
+
+    def draw(self):
+        """Dessine les libellés demandés depuis le dernier draw() ; masque les autres."""
+        for key, label in self._labels.items():
+            if key not in self._touched and label.visible:
+                label.visible = False
+        self._touched.clear()
+        self.batch.draw()
+
+    def clear(self):
+        for label in self._labels.values():
+            label.label.delete()
+        self._labels.clear()
+        self._state.clear()
+        self._style.clear()
+        self._touched.clear()
+
+    def __len__(self) -> int:
+        return len(self._labels)
@@ -0,0 +1,366 @@
+"""
+Cache centralisé des textures pour le jeu OUT OF SCALE.
+
+Chaque fichier image n'est décodé qu'une seule fois par processus. Les scènes
+passent par ce module au lieu d'appeler directement ``arcade.Sprite(chemin)``
+ou ``arcade.load_texture(chemin)``, ce qui évite de relire le disque et de
+redécoder les PNG à chaque apparition d'une entité.
+
+Les entrées sont indexées par (chemin, échelle ou taille) et évincées selon
+une politique LRU lorsque le budget mémoire est dépassé. Le cache peut être
+rempli depuis un thread de préchargement : le décodage se fait hors verrou,
+seule l'insertion est protégée.
+
+Si des copies réduites ont été produites par ``python -m core asset_baker``,
+elles sont chargées à la place des originaux. Le facteur de réduction est
+compensé dans ``make_sprite`` pour que la taille à l'écran reste identique.
+De même, les images regroupées par ``python -m core atlas_packer`` sont
+découpées dans la feuille de leur scène, décodée une seule fois (les
+sous-textures sont des copies, pas des vues sur la feuille).
+
+En mode headless (``core.headless``), aucune image n'est décodée : seules
+leurs dimensions sont lues pour la logique de jeu.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple, Union
+import logging
+
+import arcade
+
+from .asset_baker import BAKED_DIR, INDEX_FILENAME, PROJECT_ROOT
+from .atlas_packer import ATLAS_DIR, ATLAS_INDEX_FILENAME
+from .headless import Entity, is_headless, texture_info
+
+logger = logging.getLogger(__name__)
+
+# Budget mémoire par défaut (octets, estimation RGBA non compressée)
+DEFAULT_BUDGET_BYTES = 256 * 1024 * 1024
+
+PathLike = Union[str, Path]
+CacheKey = Tuple[str, float, Optional[Tuple[int, int]]]
+Rect = Tuple[int, int, int, int]
+
+
+class TextureCache:
+    """Registre LRU des textures décodées, partagé par toutes les scènes."""
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_BUDGET_BYTES,
+        baked_dir: Optional[PathLike] = BAKED_DIR,
+        atlas_dir: Optional[PathLike] = ATLAS_DIR,
+    ):
+        """
+        Initialise le cache.
+
+        Args:
+            max_bytes: Budget mémoire approximatif (largeur * hauteur * 4 octets par texture)
+            baked_dir: Dossier des images bakées (None pour toujours charger les originaux)
+            atlas_dir: Dossier des atlas par scène (None pour ne pas les utiliser)
+        """
+        self.max_bytes = max_bytes
+        self.baked_dir = Path(baked_dir) if baked_dir is not None else None
+        self.atlas_dir = Path(atlas_dir) if atlas_dir is not None else None
+        # source absolue -> (fichier baké absolu, facteur, mtime source au moment du baking)
+        self._baked: Optional[Dict[str, Tuple[str, float, float]]] = None
+        # source absolue -> (feuille absolue, région, facteur, mtime source)
+        self._atlas_regions: Optional[Dict[str, Tuple[str, Rect, float, float]]] = None
+        # nom d'atlas -> sources absolues de ses régions
+        self._atlas_members: Dict[str, list] = {}
+        # source absolue -> facteur de réduction de la texture effectivement chargée
+        self._factors: Dict[str, float] = {}
+        self._entries: "OrderedDict[CacheKey, arcade.Texture]" = OrderedDict()
+        self._sizes: Dict[CacheKey, int] = {}
+        self.current_bytes = 0
+        self._lock = threading.RLock()
+
+        # Instrumentation
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ----- Clés -----
+    @staticmethod
+    def _normalize_path(path: PathLike) -> str:
+        """Chemin absolu sans accès disque (pas de resolve())."""
+        return os.path.normpath(os.path.abspath(str(path)))
+
+    # ----- Images bakées -----
+    def _load_baked_index(self) -> Dict[str, Tuple[str, float, float]]:
+        """Lit l'index du baker une seule fois (absent = aucun asset baké)."""
+        with self._lock:
+            if self._baked is not None:
+                return self._baked
+            self._baked = {}
+            if self.baked_dir is None:
+                return self._baked
+            index_path = self.baked_dir / INDEX_FILENAME
+            if not index_path.exists():
+                return self._baked
+            try:
+                with open(index_path, "r", encoding="utf-8") as f:
+                    index = json.load(f)
+                for rel_path, entry in index.items():
+                    source = self._normalize_path(PROJECT_ROOT / rel_path)
+                    baked = self._normalize_path(self.baked_dir / rel_path)
+                    self._baked[source] = (baked, float(entry["factor"]), float(entry["source_mtime"]))
+                logger.info(f"{len(self._baked)} texture(s) bakée(s) disponibles")
+            except Exception as e:
+                logger.error(f"Index des assets bakés illisible: {e}")
+            return self._baked
+
+    def _resolve_source(self, norm: str) -> Tuple[str, float]:
+        """Retourne le fichier à décoder et son facteur par rapport à l'original."""
+        entry = self._load_baked_index().get(norm)
+        if entry is None:
+            return norm, 1.0
+        baked, factor, source_mtime = entry
+        try:
+            if os.path.getmtime(norm) != source_mtime or not os.path.exists(baked):
+                logger.warning(f"Copie bakée périmée, original utilisé: {norm}")
+                return norm, 1.0
+        except OSError:
+            return norm, 1.0
+        return baked, factor
+
+    # ----- Atlas -----
+    def _load_atlas_index(self) -> Dict[str, Tuple[str, Rect, float, float]]:
+        """Lit l'index des atlas une seule fois (absent = pas d'atlas)."""
+        with self._lock:
+            if self._atlas_regions is not None:
+                return self._atlas_regions
+            self._atlas_regions = {}
+            if self.atlas_dir is None:
+                return self._atlas_regions
+            index_path = self.atlas_dir / ATLAS_INDEX_FILENAME
+            if not index_path.exists():
+                return self._atlas_regions
+            try:
+                with open(index_path, "r", encoding="utf-8") as f:
+                    index = json.load(f)
+                for name, atlas in index.items():
+                    sheet = self._normalize_path(self.atlas_dir / atlas["file"])
+                    members = []
+                    for rel_path, region in atlas["regions"].items():
+                        source = self._normalize_path(PROJECT_ROOT / rel_path)
+                        self._atlas_regions[source] = (
+                            sheet, tuple(region["rect"]), float(region["factor"]), float(region["source_mtime"])
+                        )
+                        members.append(source)
+                    self._atlas_members[name] = members
+                logger.info(f"{len(index)} atlas de textures disponibles")
+            except Exception as e:
+                logger.error(f"Index des atlas illisible: {e}")
+            return self._atlas_regions
+
+    def _load_from_atlas(self, norm: str) -> Optional[Tuple[arcade.Texture, float]]:
+        """Découpe la sous-texture d'une source dans sa feuille (décodée une fois)."""
+        entry = self._load_atlas_index().get(norm)
+        if entry is None:
+            return None
+        sheet_path, (x, y, w, h), factor, source_mtime = entry
+        try:
+            if os.path.getmtime(norm) != source_mtime:
+                logger.warning(f"Atlas périmé, original utilisé: {norm}")
+                return None
+        except OSError:
+            return None
+        sheet = self.get_texture(sheet_path)
+        image = sheet.image.crop((x, y, x + w, y + h))
+        texture = arcade.Texture(image, hash=f"{sheet_path}|{x},{y},{w},{h}")
+        # La sous-texture provient de la feuille, pas de l'image source
+        texture.file_path = Path(sheet_path)
+        return texture, factor
+
+    def get_atlas(self, name: str) -> Dict[str, arcade.Texture]:
+        """
+        Retourne toutes les sous-textures d'un atlas de scène.
+
+        Args:
+            name: Nom de l'atlas dans data/atlas_manifest.json ('alien', 'human_dog', 'atom')
+
+        Returns:
+            dict: Chemin absolu de la source -> sous-texture
+        """
+        self._load_atlas_index()
+        return {source: self.get_texture(source) for source in self._atlas_members.get(name, [])}
+
+    def source_factor(self, path: PathLike) -> float:
+        """Facteur de réduction de la texture chargée pour ce chemin (1.0 si original)."""
+        return self._factors.get(self._normalize_path(path), 1.0)
+
+    @staticmethod
+    def _estimate_bytes(texture: arcade.Texture) -> int:
+        return max(1, int(texture.width) * int(texture.height) * 4)
+
+    # ----- Accès -----
+    def get_texture(
+        self,
+        path: PathLike,
+        scale: float = 1.0,
+        size: Optional[Tuple[int, int]] = None,
+    ) -> arcade.Texture:
+        """
+        Retourne la texture du fichier, décodée une seule fois.
+
+        Args:
+            path: Chemin du fichier image
+            scale: Facteur de rééchantillonnage de l'image (1.0 = taille d'origine)
+            size: Taille (largeur, hauteur) exacte souhaitée, prioritaire sur scale
+        """
+        if is_headless():
+            return texture_info(path, scale, size)
+        norm = self._normalize_path(path)
+        if size is not None:
+            size = (max(1, int(size[0])), max(1, int(size[1])))
+            scale = 1.0
+        key: CacheKey = (norm, float(scale), size)
+
+        with self._lock:
+            texture = self._entries.get(key)
+            if texture is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return texture
+            self.misses += 1
+
+        # Décodage hors verrou (peut tourner dans le thread de préchargement)
+        factor = None
+        if size is None and scale == 1.0:
+            from_atlas = self._load_from_atlas(norm)
+            if from_atlas is not None:
+                texture, factor = from_atlas
+            else:
+                load_path, factor = self._resolve_source(norm)
+                texture = arcade.load_texture(load_path)
+        else:
+            texture = self._resample(norm, scale, size)
+
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                # Un autre thread a décodé le même fichier entre-temps
+                return existing
+            if factor is not None:
+                self._factors[norm] = factor
+            self._store(key, texture)
+        return texture
+
+    def _resample(self, norm: str, scale: float, size: Optional[Tuple[int, int]]) -> arcade.Texture:
+        """Crée une variante redimensionnée à partir de la texture d'origine (elle aussi mise en cache)."""
+        source = self.get_texture(norm)
+        if size is None:
+            # scale est exprimé par rapport à l'original, pas à la copie bakée
+            factor = self.source_factor(norm)
+            size = (max(1, round(source.width * scale / factor)), max(1, round(source.height * scale / factor)))
+        image = source.image.resize(size)
+        return arcade.Texture(image, hash=f"{norm}|{size[0]}x{size[1]}")
+
+    def _store(self, key: CacheKey, texture: arcade.Texture):
+        nbytes = self._estimate_bytes(texture)
+        self._entries[key] = texture
+        self._sizes[key] = nbytes
+        self.current_bytes += nbytes
+        self._evict()
+
+    def _evict(self):
+        """Évince les entrées les moins récemment utilisées jusqu'à respecter le budget."""
+        # On garde toujours au moins l'entrée la plus récente
+        while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+            key, _ = self._entries.popitem(last=False)
+            self.current_bytes -= self._sizes.pop(key, 0)
+            self.evictions += 1
+            logger.debug(f"Texture évincée: {key[0]}")
+
+    def make_sprite(
+        self,
+        path: PathLike,
+        scale: float = 1.0,
+        target_w: Optional[float] = None,
+    ) -> arcade.Sprite:
+        """
+        Crée un sprite à partir d'une texture en cache.
+
+        Args:
+            path: Chemin du fichier image
+            scale: Échelle du sprite par rapport à l'image d'origine (ignorée si target_w est fourni)
+            target_w: Largeur à l'écran souhaitée en pixels (conserve le ratio)
+        """
+        texture = self.get_texture(path)
+        if target_w is not None and texture.width:
+            scale = target_w / float(texture.width)
+        else:
+            scale = scale / self.source_factor(path)
+        if is_headless():
+            return Entity(texture, scale=scale)
+        return arcade.Sprite(texture, scale=scale)
+
+    # ----- Configuration / stats -----
+    def set_budget(self, max_bytes: int):
+        """Modifie le budget mémoire et évince si nécessaire."""
+        with self._lock:
+            self.max_bytes = max(0, int(max_bytes))
+            self._evict()
+
+    def clear(self):
+        """Vide le cache (les compteurs sont conservés)."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Retourne les compteurs d'instrumentation du cache."""
+        return {
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    def __contains__(self, path: PathLike) -> bool:
+        return (self._normalize_path(path), 1.0, None) in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Instance globale du cache de textures
+_texture_cache = None
+
+
+def get_texture_cache() -> TextureCache:
+    """Retourne l'instance globale du cache de textures."""
+    global _texture_cache
+    if _texture_cache is None:
+        _texture_cache = TextureCache()
+    return _texture_cache
+
+
+def load_texture(path: PathLike, scale: float = 1.0, size: Optional[Tuple[int, int]] = None) -> arcade.Texture:
+    """Fonction utilitaire pour obtenir une texture en cache."""
+    return get_texture_cache().get_texture(path, scale, size)
+
+
+def make_sprite(path: PathLike, scale: float = 1.0, target_w: Optional[float] = None) -> arcade.Sprite:
+    """Fonction utilitaire pour créer un sprite à partir d'une texture en cache."""
+    return get_texture_cache().make_sprite(path, scale, target_w)
+
+
+def texture_sources(textures: Iterable[arcade.Texture]) -> Set[str]:
+    """
+    Images distinctes derrière des textures : la feuille d'atlas pour une
+    sous-texture, le fichier chargé sinon (les pixels pour une texture générée).
+    """
+    sources = set()
+    for texture in textures:
+        path = getattr(texture, "file_path", None)
+        sources.add(str(path) if path is not None else texture.atlas_name)
+    return sources
@@ -0,0 +1,96 @@
+"""
+Tampon circulaire NumPy pour une trajectoire échantillonnée (file de fourmis).
+
+Les points sont écrits dans un tableau de capacité fixe : ajouter un point
+écrase le plus ancien, sans décaler le reste (pas de ``del trail[:n]``).
+``gather()`` lit en une opération les points situés à plusieurs distances
+du plus récent, pour déplacer toute une file de suiveurs d'un coup.
+
+La capacité ne grandit que sur demande (``reserve``) : la mémoire dépend de
+la longueur de la file, pas de la durée de la partie.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Capacité initiale (doublée à la demande par reserve())
+DEFAULT_CAPACITY = 1024
+
+
+class TrailBuffer:
+    """Derniers points (x, y) d'une trajectoire, du plus ancien au plus récent."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Args:
+            capacity: Nombre de points gardés avant le premier agrandissement
+        """
+        self.points = np.zeros((capacity, 2))
+        # Nombre total de points ajoutés (le plus récent est à (head - 1) % capacité)
+        self.head = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self.points)
+
+    def __len__(self) -> int:
+        return min(self.head, len(self.points))
+
+    def _ordered(self) -> np.ndarray:
+        """Points gardés, du plus ancien au plus récent (copie)."""
+        n = len(self)
+        capacity = len(self.points)
+        return self.points[(self.head - n + np.arange(n)) % capacity]
+
+    def reserve(self, capacity: int):
+        """Garantit au moins `capacity` points gardés (les points actuels sont conservés)."""
+        if capacity <= len(self.points):
+            return
+        new_capacity = len(self.points)
+        while new_capacity < capacity:
+            new_capacity *= 2
+        ordered = self._ordered()
+        self.points = np.zeros((new_capacity, 2))
+        self.points[:len(ordered)] = ordered
+        self.head = len(ordered)
+
+    def append(self, x: float, y: float):
+        """Ajoute un point (remplace le plus ancien si le tampon est plein)."""
+        self.points[self.head % len(self.points)] = (x, y)
+        self.head += 1
+
+    @property
+    def last(self) -> Optional[Tuple[float, float]]:
+        """Point le plus récent, ou None si le tampon est vide."""
+        if not self.head:
+            return None
+        x, y = self.points[(self.head - 1) % len(self.points)]
+        return float(x), float(y)
+
+    def gather(self, offsets: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Points situés `offsets` échantillons avant le plus récent (0 = le plus récent).
+
+        Un décalage au-delà de la trajectoire gardée donne le point le plus ancien.
+
+        Args:
+            offsets: Décalages (entiers positifs)
+            out: Tableau (len(offsets), 2) à remplir, pour ne rien allouer à chaque tick
+
+        Returns:
+            np.ndarray: Tableau (len(offsets), 2)
+        """
+        if out is None:
+            out = np.empty((len(offsets), 2))
+        n = len(self)
+        if not n:
+            out[:] = 0.0
+            return out
+        index = np.minimum(offsets, n - 1)
+        np.subtract(self.head - 1, index, out=index)
+        np.remainder(index, len(self.points), out=index)
+        return np.take(self.points, index, axis=0, out=out)
+
+    def clear(self):
+        self.head = 0
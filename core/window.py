@@ -0,0 +1,57 @@
+"""
+Fenêtre du jeu : rendu à la demande pour les scènes statiques.
+
+Les dialogues, les crédits et les menus ne changent qu'à une touche pressée,
+mais la boucle d'Arcade les redessine et échange les tampons à chaque frame.
+Une vue qui expose ``needs_redraw`` (voir ``BaseView.RENDER_ON_DEMAND``) peut
+laisser ``GameWindow`` sauter ces frames : ni ``on_draw`` ni ``flip()``,
+l'écran garde la dernière image présentée et le GPU reste au repos. Seuls
+``on_update`` et les évènements continuent de tourner.
+
+Un changement de vue, un redimensionnement ou une fenêtre ré-exposée
+(découverte, restaurée) forcent toujours un rendu complet.
+"""
+
+from typing import Dict
+
+import arcade
+
+
+class GameWindow(arcade.Window):
+    """arcade.Window qui ne redessine une vue statique que lorsqu'elle le demande."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Rendu imposé par la fenêtre elle-même (nouvelle vue, resize, expose)
+        self._force_redraw = True
+        self.frames_drawn = 0
+        self.frames_skipped = 0
+
+    def request_redraw(self):
+        """Force le rendu de la prochaine frame, quelle que soit la vue."""
+        self._force_redraw = True
+
+    def draw(self, dt: float):
+        view = self.current_view
+        if not self._force_redraw and not getattr(view, "needs_redraw", True):
+            self.frames_skipped += 1
+            return
+        self._force_redraw = False
+        self.frames_drawn += 1
+        super().draw(dt)
+
+    def show_view(self, new_view: arcade.View):
+        super().show_view(new_view)
+        self._force_redraw = True
+
+    def on_resize(self, width: int, height: int):
+        self._force_redraw = True
+        return super().on_resize(width, height)
+
+    def on_expose(self):
+        # Contenu de la fenêtre perdu (recouverte, minimisée) : le tampon avant n'est plus valide
+        self._force_redraw = True
+
+    def stats(self) -> Dict[str, int]:
+        """Compteurs d'instrumentation du rendu à la demande."""
+        return {"drawn": self.frames_drawn, "skipped": self.frames_skipped}
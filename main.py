@@ -1,5 +1,8 @@
+import argparse
+
 import arcade
-from scenes import MainMenuView
+from core import GameWindow, get_recorder
+from scenes import get_scene, preimport_scenes
 
 # Dimensions de la fenêtre
 SCREEN_WIDTH = 1080
@@ -30,9 +33,24 @@ class MyGame(arcade.Window):
             print("Espace pressé !")
 
 def main():
-    window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
-    window.show_view(MainMenuView())  # setup sera appelé automatiquement
+    parser = argparse.ArgumentParser(description=SCREEN_TITLE)
+    parser.add_argument("--record", nargs="?", const="", metavar="FICHIER",
+                        help="Enregistrer les entrées de toute la session (défaut : recordings/)")
+    args = parser.parse_args()
+    if args.record is not None:
+        get_recorder().start(args.record or None)
+
+    # Affichage synchronisé sur l'écran ; la logique des scènes tourne à pas
+    # fixe (voir scenes.base.FIXED_TIMESTEP) quelle que soit la cadence.
+    # Les scènes statiques (dialogues, menus) ne sont redessinées qu'à la demande.
+    window = GameWindow(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, vsync=True,
+                        update_rate=1 / 240, draw_rate=1 / 240)
+    window.show_view(get_scene("MainMenuView"))  # setup sera appelé automatiquement
+    # Les autres scènes s'importent pendant que le menu tourne
+    preimport_scenes()
     arcade.run()
+    # Écrit la scène en cours si un enregistrement est actif (F5 ou --record)
+    get_recorder().stop()
     
 if __name__ == "__main__":
     main()
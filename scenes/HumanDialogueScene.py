@@ -1,7 +1,7 @@
 import os
 import arcade
 from .base import BaseView  # BaseView doit hériter de arcade.View
-from .atom import AtomView
+from core import make_solid_sprite, make_sprite, make_sprite_list
 
 # --- Constantes ---
 SCREEN_WIDTH = 1080
@@ -27,14 +27,15 @@ PARAGRAPHS = [
 
 
 class HumanDialogueScene(BaseView):
+    RENDER_ON_DEMAND = True
+
     def __init__(self):
         super().__init__()
-        arcade.set_background_color(arcade.color.BLUEBERRY)
 
         self.current_paragraph_index = 0
 
         # SpriteList pour l'alien
-        self.sprites = arcade.SpriteList()
+        self.sprites = make_sprite_list()
         self.alien_sprite: arcade.Sprite | None = None
 
         # Textes
@@ -62,18 +63,16 @@ class HumanDialogueScene(BaseView):
         self._is_setup = False
         self._done = False  # pour savoir si tous les paragraphes ont été affichés
 
-    def on_show_view(self):
-        if not self._is_setup:
-            self.setup()
-
     def setup(self):
+        if self._is_setup:
+            return
         self._is_setup = True
 
         sprite_path = "assets/alien.png"
         if os.path.isfile(sprite_path):
-            self.alien_sprite = arcade.Sprite(sprite_path, ALIEN_SCALE)
+            self.alien_sprite = make_sprite(sprite_path, ALIEN_SCALE)
         else:
-            self.alien_sprite = arcade.SpriteSolidColor(80, 80, arcade.color.AVOCADO)
+            self.alien_sprite = make_solid_sprite(80, 80, arcade.color.AVOCADO)
 
         # On centre horizontalement, et place verticalement au milieu entre haut de la fenêtre et début de la boîte de dialogue
         self.alien_sprite.center_x = SCREEN_WIDTH / 2
@@ -97,16 +96,19 @@ class HumanDialogueScene(BaseView):
         )
 
         # dessiner le texte centré dans la boîte
+        self.dialog_text.value = PARAGRAPHS[self.current_paragraph_index]
         self.dialog_text.draw()
         # dessiner le hint
+        if self._done:
+            self.hint_text.value = "[Entrée] Commencer le jeu"
         self.hint_text.draw()
 
     def on_key_press(self, key: int, modifiers: int):
         if self._done:
             # Si le dialogue est terminé, passer à la scène AtomView
             if (key == arcade.key.ENTER):
-                from .human_dog import HumanDogView
-                self.window.show_view(HumanDogView())
+                # Attend la fin du préchargement puis ouvre HumanDogView (graphe de scènes)
+                self.show_next_scene()
             return
 
         if key == arcade.key.ENTER:
@@ -115,9 +117,6 @@ class HumanDialogueScene(BaseView):
                 # Si on dépasse le nombre, on reste sur le dernier paragraphe
                 self.current_paragraph_index = len(PARAGRAPHS) - 1
                 self._done = True  # marque que le dialogue est fini
-                # Mettre à jour le texte d'aide pour indiquer comment continuer
-                self.hint_text.value = "[Entrée] Commencer le jeu"
-            self.dialog_text.value = PARAGRAPHS[self.current_paragraph_index]
 
 
 def main():
@@ -1,14 +1,43 @@
+"""
+Scènes du jeu. Les modules de scène sont importés à la demande (voir
+``scenes.registry``) : ``from scenes import AtomView`` n'importe que
+``scenes.atom``.
+"""
+
 from .base import BaseView
-from .main_menu import MainMenuView
-from .menu import MenuView
-from .credits import CreditsView
-from .hub import HubView
-from .atom import AtomView
-from .ant import AntView
-from .human_dog import HumanDogView
-from .alien import AlienView
-from .galaxy import GalaxyView
-from .universe import UniverseView
+from .registry import (
+    SCENES, get_scene_class, get_scene, resident_scenes, clear_scenes, preimport_scenes
+)
+
+# Enchaînement fixe de l'histoire : scène -> scène suivante
+SCENE_GRAPH = {
+    "AtomDialogueScene": "AtomView",
+    "AtomView": "FourmiDialogueScene",
+    "AtomStormView": "HubView",
+    "FourmiDialogueScene": "AntView",
+    "AntView": "HumanDialogueScene",
+    "HumanDialogueScene": "HumanDogView",
+    "HumanDogView": "AlienDialogueScene",
+    "AlienDialogueScene": "AlienView",
+    "AlienView": "GalaxyDialogueScene",
+    "GalaxyDialogueScene": "GalaxyView",
+    "GalaxyView": "UniversDialogueScene",
+    "UniversDialogueScene": "UniverseView",
+}
+
+
+def next_scene_class(name: str):
+    """Retourne la classe de la scène qui suit `name`, ou None."""
+    next_name = SCENE_GRAPH.get(name)
+    return get_scene_class(next_name) if next_name else None
+
+
+def __getattr__(name: str):
+    # Import paresseux : scenes.AtomView importe scenes.atom au premier accès
+    if name in SCENES:
+        return get_scene_class(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "BaseView",
@@ -17,12 +46,27 @@ __all__ = [
     "CreditsView",
     "HubView",
     "AtomView",
+    "AtomStormView",
     "AntView",
     "HumanDogView",
     "AlienView",
-    "MoonShipView",
+    "PopupView",
     "GalaxyView",
     "UniverseView",
+    "AtomDialogueScene",
+    "FourmiDialogueScene",
+    "HumanDialogueScene",
+    "AlienDialogueScene",
+    "GalaxyDialogueScene",
+    "UniversDialogueScene",
+    "SCENES",
+    "SCENE_GRAPH",
+    "get_scene_class",
+    "get_scene",
+    "resident_scenes",
+    "clear_scenes",
+    "next_scene_class",
+    "preimport_scenes",
 ]
 
 
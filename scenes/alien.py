@@ -1,5 +1,6 @@
 import arcade, random, math
 from .base import BaseView
+from core import load_texture, make_sprite, make_solid_sprite, make_sprite_list, get_sprites_at_point, is_headless
 from pathlib import Path
 from arcade.gui import (
     UIAnchorLayout,
@@ -7,14 +8,32 @@ from arcade.gui import (
     UIGridLayout,
     UIManager
 )
-from .popup_view import PopupView
+from .registry import get_scene
 
 class AlienView(BaseView):
+    PRELOAD_TEXTURES = (
+        "assets/lune.png",
+        "assets/alien.png",
+        "assets/telescope.png",
+        "assets/tete_alien_bleue.png",
+        "assets/tete_alien_orange.png",
+        "assets/tete_alien_rouge.png",
+        "assets/tete_alien_violet.png",
+        "assets/tete_alien_rouge_cible.png",
+        "assets/tete_alien_bleue_cible.png",
+        "assets/tete_alien_violet_cible.png",
+        "assets/alien-world-sunset.png",
+    )
+    INTERPOLATED_LISTS = ("aliens",)
+    REUSABLE = True
+
     def __init__(self):
         super().__init__()
 
-        self.ui = UIManager()
-        self.ui.enable()
+        # Pas d'interface graphique en mode headless (pas de fenêtre)
+        self.ui = None
+        if not is_headless():
+            self.ui = UIManager()
         # Les boutons pour la suite
         self.nextButtonPressed = False
         self.max_lives = 5
@@ -25,33 +44,39 @@ class AlienView(BaseView):
 
         # Image de la cible (indice visuel affiché en haut)
         cibles = ["rouge", "bleue", "violet"]
-        self.target_hint = arcade.Sprite(f"assets/tete_alien_{cibles[self.level-1]}_cible.png", scale=0.2)
+        self.target_hint = make_sprite(f"assets/tete_alien_{cibles[self.level-1]}_cible.png", scale=0.2)
         
         # Booleen pour la popup
         self.show_popup = False
 
 
         # --- Décor ---
-        self.background = arcade.Sprite("assets/image.png")
-        self.background.center_x = 0
-        self.background.center_y = 0
+        # Le fond n'est pas livré avec le dépôt : à défaut, un aplat de nuit
+        if Path("assets/image.png").exists():
+            self.background = make_sprite("assets/image.png")
+            self.background.center_x = 0
+            self.background.center_y = 0
+        else:
+            self.background = make_solid_sprite(self.window.width, self.window.height, arcade.color.MIDNIGHT_BLUE)
+            self.background.center_x = self.window.width / 2
+            self.background.center_y = self.window.height / 2
 
-        self.lune = arcade.Sprite("assets/lune.png", scale=0.075)
+        self.lune = make_sprite("assets/lune.png", scale=0.075)
         self.lune.center_x = 100
         self.lune.center_y = 90
 
 
-        self.alien = arcade.Sprite("assets/alien.png", scale=0.6)
+        self.alien = make_sprite("assets/alien.png", scale=0.6)
         self.alien.center_x = 110
         self.alien.center_y = 310
 
-        self.telescope = arcade.Sprite("assets/telescope.png", scale=0.9)
+        self.telescope = make_sprite("assets/telescope.png", scale=0.9)
         self.telescope.center_x = 380
         self.telescope.center_y = 350
         self.telescope.angle = -15
         
 
-        self.img_list = arcade.SpriteList()
+        self.img_list = make_sprite_list()
         self.img_list.extend([self.background, self.alien, self.lune, self.telescope, self.target_hint])
 
         # --- Cercle ---
@@ -59,48 +84,29 @@ class AlienView(BaseView):
         self.circle_y = self.window.height - 250
         self.circle_r = 250
 
-        # --- Aliens flottants ---
-        self.aliens = arcade.SpriteList()
+        # --- Aliens flottants (créés à chaque partie par spawn_aliens) ---
+        self.aliens = make_sprite_list()
         self.alien_speeds = {}
-        self.target_change_timer = 0  # compteur pour changer de direction
-
-        speed = 3.0  # <-- vitesse fixe pour tous
-        
-
-        # La tête spéciale à trouver
-        self.target = arcade.Sprite(f"assets/tete_alien_{cibles[self.level - 1]}_cible.png", scale=0.1)
-        self.target.center_x = self.circle_x
-        self.target.center_y = self.circle_y
-
-        dir_angle = random.uniform(0, 2 * math.pi)
-        dx = math.cos(dir_angle) * speed
-        dy = math.sin(dir_angle) * speed
-        self.alien_speeds[self.target] = [dx, dy]
-        
-        self.aliens.append(self.target)
-
-        colors = ["bleue", "rouge", "orange"]
-        for color in colors:
-            for i in range(25):  # 3 têtes par couleur
-                sprite = arcade.Sprite(f"assets/tete_alien_{color}.png", scale=0.1)
-
-                # Position aléatoire dans le cercle
-                angle = random.uniform(0, 2 * math.pi)
-                radius = random.uniform(20, self.circle_r - 30)
-                sprite.center_x = self.circle_x + math.cos(angle) * radius
-                sprite.center_y = self.circle_y + math.sin(angle) * radius
-
-                # Direction aléatoire mais vitesse fixe
-                dir_angle = random.uniform(0, 2 * math.pi)
-                dx = math.cos(dir_angle) * speed
-                dy = math.sin(dir_angle) * speed
-                self.alien_speeds[sprite] = [dx, dy]
+        self.target = None
 
-                self.aliens.append(sprite)
-        self.spawn_aliens()
+    def reset(self):
+        super().reset()
+        self.level = 1
+        self.lives = self.max_lives
+        self.show_popup = False
+        self.nextButtonPressed = False
 
     def on_show_view(self):
         super().on_show_view()
+        if self.ui:
+            self.ui.enable()
+        # Tirés après la graine de la partie (rejouables)
+        self.spawn_aliens()
+
+    def on_hide_view(self):
+        # L'interface gardée par une vue réutilisée ne doit plus capter les clics
+        if self.ui:
+            self.ui.disable()
 
     def on_draw(self):
         super().on_draw()
@@ -131,7 +137,7 @@ class AlienView(BaseView):
         # Aliens
         self.aliens.draw()
 
-    def on_update(self, delta_time: float):
+    def fixed_update(self, delta_time: float):
         """Mettre à jour la position des têtes flottantes"""
         for alien in self.aliens:
             dx, dy = self.alien_speeds[alien]
@@ -178,7 +184,9 @@ class AlienView(BaseView):
 
 
     def show_text_center(self, text, color=arcade.color.WHITE, size=20, height = 50, width = 100):
-        arcade.draw_text(
+        # Clé = position : chaque emplacement garde son libellé
+        self.labels.text(
+            ("center", width, height),
             text,
             width,
             height,
@@ -189,7 +197,7 @@ class AlienView(BaseView):
         )
 
     def on_mouse_press(self, x, y, button, modifiers):
-        aliens_clicked = arcade.get_sprites_at_point((x, y), self.aliens)
+        aliens_clicked = get_sprites_at_point((x, y), self.aliens)
         if self.target in aliens_clicked:
             if self.level < 3:
                 self.level += 1
@@ -197,8 +205,7 @@ class AlienView(BaseView):
             else:
                 # Tous les niveaux terminés -> popup ou fin de jeu
                 self.show_popup = True
-                popup = PopupView(self)
-                self.window.show_view(popup, win=True)
+                self._open_popup(win=True)
         else:
             # Clic raté → retirer une vie
             self.lives -= 1
@@ -207,8 +214,17 @@ class AlienView(BaseView):
                 print("💀 Game Over !")
                 # Afficher popup de fin de jeu
                 self.show_popup = True
-                popup = PopupView(self, win=False)
-                self.window.show_view(popup)
+                self._open_popup(win=False)
+
+    def _open_popup(self, win: bool):
+        if is_headless():
+            # Fin de partie simulée : la popup n'est pas construite
+            self.window.record_transition("PopupView")
+            return
+        popup = get_scene("PopupView")
+        popup.parent_view = self
+        popup.win = win
+        self.window.show_view(popup)
 
 
         
@@ -241,7 +257,7 @@ class AlienView(BaseView):
 
     def spawn_aliens(self):
         """Crée les aliens avec vitesse adaptée au niveau et met à jour la cible"""
-        self.aliens = arcade.SpriteList()
+        self.aliens = make_sprite_list()
         self.alien_speeds = {}
 
         # Vitesse qui augmente avec le niveau
@@ -251,12 +267,12 @@ class AlienView(BaseView):
         tete_cible = cibles[self.level-1]
 
         # Création de la cible
-        self.target = arcade.Sprite(f"assets/tete_alien_{tete_cible}_cible.png", scale=0.1)
+        self.target = make_sprite(f"assets/tete_alien_{tete_cible}_cible.png", scale=0.1)
         self.target.center_x = self.circle_x
         self.target.center_y = self.circle_y
 
         # Mise à jour de l'indice visuel
-        self.target_hint.texture = arcade.load_texture(f"assets/tete_alien_{tete_cible}_cible.png")
+        self.target_hint.texture = load_texture(f"assets/tete_alien_{tete_cible}_cible.png")
 
         # Vitesse initiale de la cible
         dir_angle = random.uniform(0, 2 * math.pi)
@@ -270,7 +286,7 @@ class AlienView(BaseView):
         colors = ["bleue", "rouge", "violet"]
         for color in colors:
             for i in range(25):
-                sprite = arcade.Sprite(f"assets/tete_alien_{color}.png", scale=0.1)
+                sprite = make_sprite(f"assets/tete_alien_{color}.png", scale=0.1)
                 angle = random.uniform(0, 2 * math.pi)
                 radius = random.uniform(20, self.circle_r - 30)
                 sprite.center_x = self.circle_x + math.cos(angle) * radius
@@ -1,11 +1,14 @@
 import arcade
 import random
 import math
-import time
+from itertools import chain
 from pathlib import Path
+import numpy as np
 from .base import BaseView
-from core import play_ambient_sound, play_footstep
-from .human_dog import HumanDogView
+from core import (
+    play_ambient_sound, play_footstep, make_sprite, make_sprite_list, make_blank_sprite,
+    make_solid_sprite, check_for_collision, SpritePool, SpatialGrid, TrailBuffer, soft_ellipse_texture
+)
 
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
@@ -15,8 +18,40 @@ ANT_SPEED = 100
 CONTROL_DURATION = 5.0
 FOOT_WARNING_DURATION = 2.0
 FOOT_INTERVAL_RANGE = (5.0, 10.0)
+# Foot event states
+FOOT_WARNING, FOOT_FALLING, FOOT_LANDED, FOOT_RETRACTING = range(4)
+# Time a landed foot stays down before retracting (seconds)
+FOOT_LANDED_PAUSE = 0.6
+# Feet, shadows and event records created at setup (more are made on demand)
+FOOT_PREWARM = 8
+
+
+class FootEvent:
+    """A foot and its shadow warning; records are recycled by AntView."""
+
+    __slots__ = ("state", "timer", "warning_duration", "shadow", "foot", "target_y", "fall_speed")
+
+    def __init__(self):
+        self.state = FOOT_WARNING
+        # Time spent in the current state, on the simulation clock
+        self.timer = 0.0
+        self.warning_duration = 0.0
+        self.shadow = None
+        self.foot = None
+        self.target_y = 0.0
+        self.fall_speed = 0.0
+
 
 class AntView(BaseView):
+    PRELOAD_TEXTURES = (
+        "assets/ant/background_dirt.png",
+        "assets/ant/queen.png",
+        "assets/ant/ant.png",
+        "assets/ant/arrow.png",
+        "assets/ant/foot.png",
+    )
+    INTERPOLATED_LISTS = ("actors", "feet")
+
     def __init__(self):
         super().__init__()
         self.ant = None
@@ -31,23 +66,28 @@ class AntView(BaseView):
         self.minigame_success = False
         self.minigame = None
 
-        self.feet = arcade.SpriteList()
+        self.feet = make_sprite_list()
         self.foot_warnings = []
-        self.last_foot_time = time.time()
 
         self.game_over = False
         # Assets
         self.asset_dir: Path = Path(__file__).resolve().parent.parent / "assets" / "ant"
         # Background and actors
-        self._bg_list = arcade.SpriteList()
-        self.actors = arcade.SpriteList()
+        self._bg_list = make_sprite_list()
+        self.actors = make_sprite_list()
         # Colony: queen and followers
         self.queen: arcade.Sprite | None = None
-        self.followers: arcade.SpriteList = arcade.SpriteList()
-        # Trail for follower pathing
-        self._trail: list[tuple[float, float]] = []
+        self.followers: arcade.SpriteList = make_sprite_list()
+        # Trail for follower pathing (ring buffer of queen positions)
+        self._trail = TrailBuffer()
         self._trail_stride_px: float = 10.0
         self._follower_spacing_px: float = 20.0
+        # Trail offset of each follower and work arrays, sized for the current colony
+        self._follower_offsets = np.zeros(0, dtype=np.int64)
+        self._follower_pos = np.zeros((0, 2))
+        self._follower_delta = np.zeros((0, 2))
+        self._follower_dist = np.zeros(0)
+        self._follower_scale = np.zeros(0)
         # Queen horizontal direction (for bouncing inside bounds)
         self._queen_dirx: int = 1
         # Control
@@ -61,15 +101,21 @@ class AntView(BaseView):
         self._next_foot_in: float = 2.0
         self._foot_img = self.asset_dir / "foot.png"
         self._foot_target_w: int = 80
+        self._shadow_size: tuple[int, int] = (76, 33)
+        # Followers indexed by position for the crush test (rebuilt once per tick)
+        self._ant_grid = SpatialGrid(cell_size=self._foot_target_w)
+        self._ant_reach: float = 18.0
         # Arrow asset
         self._arrow_img = self.asset_dir / "arrow.png"
-        # Foot events with shadow pre-warning
-        self.foot_events: list[dict] = []
+        # Foot events with shadow pre-warning (unordered, removed by swap-pop)
+        self.foot_events: list[FootEvent] = []
+        self._free_foot_events: list[FootEvent] = []
         # Queen asset
         self._queen_img = self.asset_dir / "queen.png"
         # Difficulty / progression
         self._elapsed: float = 0.0
         self._next_ant_spawn_in: float = 6.0
+        self._make_pools()
 
     def on_show_view(self):
         # Ensure base behavior (background color, mouse) then initialize sprites
@@ -86,11 +132,11 @@ class AntView(BaseView):
         play_ambient_sound('ant', 0.3)
 
         # Reset lists
-        self._bg_list = arcade.SpriteList()
-        self.actors = arcade.SpriteList()
-        self.followers = arcade.SpriteList()
-        self.feet = arcade.SpriteList()
-        self._trail = []
+        self._bg_list = make_sprite_list()
+        self.actors = make_sprite_list()
+        self.followers = make_sprite_list()
+        self.feet = make_sprite_list()
+        self._trail.clear()
         self.foot_warnings = []
         self.game_over = False
 
@@ -111,8 +157,14 @@ class AntView(BaseView):
         # Sizes scaled to screen (larger as requested)
         ant_target_w = max(18, int(height * 0.06))
         self._foot_target_w = max(60, int(height * 0.22))
+        self._shadow_size = (int(self._foot_target_w * 0.95), int(self._foot_target_w * 0.42))
         self._trail_stride_px = max(6.0, ant_target_w * 0.6)
         self._follower_spacing_px = max(ant_target_w * 0.9, 14.0)
+        # One cell per shadow width: a landed foot only looks at a few cells.
+        # An ant overlaps a shadow if its center is within the shadow's half
+        # extent plus the ant's own (full width, to cover tall sprites).
+        self._ant_grid = SpatialGrid(cell_size=self._foot_target_w)
+        self._ant_reach = float(ant_target_w)
 
         # Queen ant
         ant_img = self.asset_dir / "ant.png"
@@ -122,7 +174,7 @@ class AntView(BaseView):
         elif ant_img.exists():
             self.queen = self._load_scaled(str(ant_img), target_w=ant_target_w)
         else:
-            self.queen = arcade.SpriteSolidColor(ant_target_w, ant_target_w, arcade.color.BROWN)
+            self.queen = make_solid_sprite(ant_target_w, ant_target_w, arcade.color.BROWN)
         self.queen.center_x = width * 0.15
         self.queen.center_y = height * 0.5
         self._queen_dirx = 1
@@ -134,7 +186,7 @@ class AntView(BaseView):
             if ant_img.exists():
                 follower = self._load_scaled(str(ant_img), target_w=ant_target_w)
             else:
-                follower = arcade.SpriteSolidColor(ant_target_w, ant_target_w, arcade.color.BROWN)
+                follower = make_solid_sprite(ant_target_w, ant_target_w, arcade.color.BROWN)
             follower.center_x = self.queen.center_x - 30
             follower.center_y = self.queen.center_y
             self.followers.append(follower)
@@ -149,13 +201,19 @@ class AntView(BaseView):
         else:
             arrow_w = max(12, int(ant_target_w * 0.7))
             arrow_h = max(18, int(ant_target_w * 1.1))
-            self.arrow = arcade.SpriteSolidColor(arrow_w, arrow_h, arcade.color.RED)
+            self.arrow = make_solid_sprite(arrow_w, arrow_h, arcade.color.RED)
         target = self.controlled_ant if self.controlled_ant else self.queen
         if target:
             self.arrow.center_x = target.center_x
             self.arrow.center_y = target.center_y + ant_target_w
         self.actors.append(self.arrow)
 
+        # Feet and shadows are recycled (sizes depend on the screen, set above)
+        self._make_pools()
+        while self.foot_events:
+            self._remove_foot_event(len(self.foot_events) - 1)
+        self.prewarm_feet(FOOT_PREWARM)
+
         # Feet spawn state
         self._foot_timer = 0.0
         self._next_foot_in = 1.8
@@ -167,32 +225,40 @@ class AntView(BaseView):
         self.minigame = MiniGame()
         self.keys_held.clear()
         # Timebase for animations/difficulty
-        self._start_time = time.time()
         self._elapsed = 0.0
         self._next_ant_spawn_in = 6.0
 
     def _load_scaled(self, path: str, target_w: int) -> arcade.Sprite:
-        sprite = arcade.Sprite(path, scale=1.0)
-        tex = sprite.texture
-        if tex and tex.width:
-            sprite.scale = target_w / float(tex.width)
-        return sprite
+        return make_sprite(path, target_w=target_w)
+
+    def _make_pools(self):
+        self.foot_pool = SpritePool(self.feet, self._make_foot_sprite, "feet")
+        self.shadow_pool = SpritePool(self.actors, self._make_shadow_sprite, "shadows")
+
+    def prewarm_feet(self, count: int):
+        """Create `count` feet, shadows and event records up front (e.g. before a stampede)."""
+        self.foot_pool.prewarm(count)
+        self.shadow_pool.prewarm(count, self._shadow_size)
+        for _ in range(count - len(self._free_foot_events)):
+            self._free_foot_events.append(FootEvent())
+
+    def _make_foot_sprite(self, _key=None) -> arcade.Sprite:
+        if self._foot_img.exists():
+            return self._load_scaled(str(self._foot_img), target_w=self._foot_target_w)
+        return make_solid_sprite(self._foot_target_w, int(self._foot_target_w * 1.8), arcade.color.GRAY)
+
+    def _make_shadow_sprite(self, size: tuple[int, int]) -> arcade.Sprite:
+        # Oval, semi-transparent shadow (black) via soft ellipse texture
+        shadow_w, shadow_h = size
+        shadow = make_blank_sprite()
+        shadow.texture = self._make_shadow_texture(shadow_w, shadow_h, alpha=150)
+        shadow.width = shadow_w
+        shadow.height = shadow_h
+        return shadow
 
     def _make_shadow_texture(self, width: int, height: int, alpha: int = 140) -> arcade.Texture:
-        """Create a soft oval shadow texture (semi-transparent black).
-
-        Returns an arcade.Texture. Falls back to circle if ellipse unavailable.
-        """
-        try:
-            tex = arcade.make_soft_ellipse_texture(width, height, (0, 0, 0, alpha))
-            return tex
-        except Exception:
-            diameter = max(width, height)
-            try:
-                tex = arcade.make_soft_circle_texture(diameter, (0, 0, 0, alpha))
-            except Exception:
-                tex = arcade.make_circle_texture(diameter, (0, 0, 0, alpha))
-            return tex
+        """Soft oval shadow texture (semi-transparent black), generated once per size."""
+        return soft_ellipse_texture(width, height, (0, 0, 0, alpha))
 
     def on_draw(self):
         # Use base clear() to avoid start_render() incompatibility
@@ -212,20 +278,19 @@ class AntView(BaseView):
             self.minigame.draw()
 
         if self.game_over:
-            arcade.draw_text("GAME OVER", SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2,
+            self.labels.text("game_over", "GAME OVER", SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2,
                              arcade.color.RED, 40, anchor_x="center")
+
+    def fixed_update(self, delta_time):
+        if self.game_over:
             if not hasattr(self, "next_scene_timer"):
-                self.next_scene_timer = 300  # 5 secondes à 60 FPS
+                self.next_scene_timer = 300  # 5 secondes (300 ticks)
 
             # Décrémenter le timer
             self.next_scene_timer -= 1
             if self.next_scene_timer <= 0:
-                # Passer à la scène suivante
-                from .HumanDialogueScene import HumanDialogueScene
-                self.window.show_view(HumanDialogueScene())
-
-    def on_update(self, delta_time):
-        if self.game_over:
+                # Passer à la scène suivante (HumanDialogueScene)
+                self.show_next_scene()
             return
 
         # Time accumulation for difficulty scaling & spawning
@@ -237,7 +302,7 @@ class AntView(BaseView):
 
         # Update queen movement and followers
         self._update_queen(delta_time)
-        self._update_trail_and_followers()
+        self._update_trail_and_followers(delta_time)
 
         # Control window timer
         if self.can_control:
@@ -304,27 +369,8 @@ class AntView(BaseView):
             jitter = random.uniform(-0.3, 0.5)
             self._next_ant_spawn_in = max(0.7, base + jitter)
 
-        # Remove feet off-screen
-        if self.window:
-            for foot in list(self.feet):
-                if foot.center_y < -100:
-                    foot.remove_from_sprite_lists()
-
         # Collisions: only when foot has landed (visible at target)
-        # Only the controlled ant causes game over; followers are removed
-        active_shadows = [e["shadow"] for e in getattr(self, "foot_events", []) if e["state"] == "landed"]
-        if self.controlled_ant and any(arcade.check_for_collision(self.controlled_ant, s) for s in active_shadows):
-            self.game_over = True
-        crushed = []
-        for ant in self.followers:
-            if any(arcade.check_for_collision(ant, s) for s in active_shadows):
-                crushed.append(ant)
-        for ant in crushed:
-            if ant is self.controlled_ant:
-                self.game_over = True
-            ant.remove_from_sprite_lists()
-            if ant in self.followers:
-                self.followers.remove(ant)
+        self._crush_ants_under_feet()
 
     def _update_queen(self, dt: float):
         if not self.queen or not self.window:
@@ -332,8 +378,8 @@ class AntView(BaseView):
         speed = max(60.0, self.window.width * 0.12)
         # Horizontal bouncing within screen
         self.queen.center_x += self._queen_dirx * speed * dt
-        # Vertical sine movement clamped to bounds
-        elapsed = time.time() - getattr(self, "_start_time", 0.0)
+        # Vertical sine movement clamped to bounds (simulation clock, not wall clock)
+        elapsed = self._elapsed
         target_y = self.window.height * 0.5 + math.sin(elapsed * 0.8) * (self.window.height * 0.2)
         self.queen.center_y = max(8, min(self.window.height - 8, target_y))
         # Bounce on left/right edges
@@ -344,40 +390,53 @@ class AntView(BaseView):
             self.queen.center_x = self.window.width - 16
             self._queen_dirx = -1
 
-    def _update_trail_and_followers(self):
+    def _update_trail_and_followers(self, dt: float):
         if not self.queen:
             return
+        trail = self._trail
         # Sample queen position
-        last = self._trail[-1] if self._trail else None
+        last = trail.last
         qx, qy = self.queen.center_x, self.queen.center_y
         if not last or math.hypot(qx - last[0], qy - last[1]) >= self._trail_stride_px:
-            self._trail.append((qx, qy))
-        # Trim trail
-        max_len = int((len(self.followers) + 2) * (self._follower_spacing_px / max(1e-3, self._trail_stride_px)) + 200)
-        if len(self._trail) > max_len:
-            del self._trail[: len(self._trail) - max_len]
-        # Move followers
-        for i, ant in enumerate(self.followers):
-            desired_offset = int((i + 1) * (self._follower_spacing_px / max(1e-3, self._trail_stride_px)))
-            idx = max(0, len(self._trail) - 1 - desired_offset)
-            target_x, target_y = self._trail[idx]
-            if self.can_control and ant is self.controlled_ant:
-                # Clamp to screen
-                if self.window:
-                    ant.center_x = max(8, min(self.window.width - 8, ant.center_x))
-                    ant.center_y = max(8, min(self.window.height - 8, ant.center_y))
-                continue
-            dx = target_x - ant.center_x
-            dy = target_y - ant.center_y
-            dist = math.hypot(dx, dy)
-            if dist > 1:
-                step = min(dist, 180)
-                ant.center_x += dx / dist * step * (1/60)
-                ant.center_y += dy / dist * step * (1/60)
-            # Clamp follower to screen
-            if self.window:
-                ant.center_x = max(8, min(self.window.width - 8, ant.center_x))
-                ant.center_y = max(8, min(self.window.height - 8, ant.center_y))
+            trail.append(qx, qy)
+        # Keep enough trail for the whole line (older points are overwritten)
+        samples_per_ant = self._follower_spacing_px / max(1e-3, self._trail_stride_px)
+        n = len(self.followers)
+        trail.reserve(int((n + 2) * samples_per_ant + 200))
+        if not n:
+            return
+        # Move followers, all at once: each one heads to the trail point
+        # (i + 1) spacings behind the queen
+        if len(self._follower_offsets) != n:
+            self._follower_offsets = (np.arange(1, n + 1) * samples_per_ant).astype(np.int64)
+            self._follower_pos = np.empty((n, 2))
+            self._follower_delta = np.empty((n, 2))
+            self._follower_dist = np.empty(n)
+            self._follower_scale = np.empty(n)
+        pos, delta = self._follower_pos, self._follower_delta
+        dist, scale = self._follower_dist, self._follower_scale
+        pos.reshape(-1)[:] = np.fromiter(chain.from_iterable(ant.position for ant in self.followers),
+                                         float, 2 * n)
+        trail.gather(self._follower_offsets, out=delta)
+        delta -= pos
+        np.hypot(delta[:, 0], delta[:, 1], out=dist)
+        # Step of min(dist, 180) px/s toward the target, none when already there
+        moving = dist > 1
+        np.minimum(dist, 180, out=scale)
+        scale *= dt
+        np.divide(scale, dist, out=scale, where=moving)
+        scale *= moving
+        if self.can_control and self.controlled_ant is not None and self.controlled_ant in self.followers:
+            # The controlled ant is only clamped to the screen
+            scale[self.followers.index(self.controlled_ant)] = 0.0
+        delta *= scale[:, None]
+        pos += delta
+        # Clamp followers to screen
+        if self.window:
+            np.clip(pos[:, 0], 8, self.window.width - 8, out=pos[:, 0])
+            np.clip(pos[:, 1], 8, self.window.height - 8, out=pos[:, 1])
+        for ant, x, y in zip(self.followers, pos[:, 0].tolist(), pos[:, 1].tolist()):
+            ant.position = (x, y)
 
     def on_key_press(self, key, modifiers):
         if self.minigame_active:
@@ -412,85 +471,98 @@ class AntView(BaseView):
             # Create shadow warning then falling foot
             target_y = random.uniform(self.window.height * 0.25, self.window.height * 0.75)
             center_x = random.uniform(60, self.window.width - 60)
-            # Oval, semi-transparent shadow (black) via soft ellipse texture
-            shadow_w = int(self._foot_target_w * 0.95)
-            shadow_h = int(self._foot_target_w * 0.42)
-            shadow_tex = self._make_shadow_texture(shadow_w, shadow_h, alpha=150)
-            shadow = arcade.Sprite()
-            shadow.texture = shadow_tex
-            shadow.width = shadow_w
-            shadow.height = shadow_h
+            shadow = self.shadow_pool.acquire(self._shadow_size)
             shadow.center_x = center_x
             shadow.center_y = target_y
-            self.actors.append(shadow)
-            if self._foot_img.exists():
-                foot = self._load_scaled(str(self._foot_img), target_w=self._foot_target_w)
-            else:
-                foot = arcade.SpriteSolidColor(self._foot_target_w, int(self._foot_target_w * 1.8), arcade.color.GRAY)
+            # Foot waits above the screen until the warning ends
+            foot = self.foot_pool.acquire()
             foot.center_x = center_x
-            foot.center_y = self.window.height + float(getattr(foot, "height", 60))
-            self.foot_events.append({
-                "state": "warning",
-                "spawn_time": time.time(),
-                # Warning shortens slightly over time
-                "warning_duration": max(0.5, random.uniform(1.0, 1.8) / (1.0 + 0.25 * difficulty)),
-                "shadow": shadow,
-                "foot": foot,
-                "target_y": target_y,
-                # Fall speed increases with time
-                "fall_speed": self.window.height * 0.12 * (1.0 + 0.35 * difficulty),
-            })
+            foot.center_y = self.window.height + foot.height
+            evt = self._free_foot_events.pop() if self._free_foot_events else FootEvent()
+            evt.state = FOOT_WARNING
+            evt.timer = 0.0
+            # Warning shortens slightly over time
+            evt.warning_duration = max(0.5, random.uniform(1.0, 1.8) / (1.0 + 0.25 * difficulty))
+            evt.shadow = shadow
+            evt.foot = foot
+            evt.target_y = target_y
+            # Fall speed increases with time
+            evt.fall_speed = self.window.height * 0.12 * (1.0 + 0.35 * difficulty)
+            self.foot_events.append(evt)
+
+    def _remove_foot_event(self, index: int):
+        """O(1) removal: the last event takes the freed slot, the record is kept for reuse."""
+        events = self.foot_events
+        evt = events[index]
+        last = events.pop()
+        if last is not evt:
+            events[index] = last
+        evt.shadow = evt.foot = None
+        self._free_foot_events.append(evt)
 
     def _update_feet_and_shadows(self, dt: float):
-        now = time.time()
-        for evt in list(self.foot_events):
-            state = evt["state"]
-            shadow: arcade.Sprite = evt["shadow"]
-            foot: arcade.Sprite = evt["foot"]
-            target_y: float = evt["target_y"]
-            if state == "warning":
-                if now - evt["spawn_time"] >= evt["warning_duration"]:
-                    evt["state"] = "falling"
-                    foot.center_y = self.window.height + float(getattr(foot, "height", 60))
-                    foot.change_y = -evt["fall_speed"]
-                    if foot not in self.feet:
-                        self.feet.append(foot)
-            elif state == "falling":
-                if foot.center_y <= target_y:
-                    foot.center_y = target_y
+        events = self.foot_events
+        top = self.window.height if self.window else 0
+        i = 0
+        while i < len(events):
+            evt = events[i]
+            evt.timer += dt
+            state = evt.state
+            foot = evt.foot
+            if state == FOOT_WARNING:
+                if evt.timer >= evt.warning_duration:
+                    evt.state = FOOT_FALLING
+                    evt.timer = 0.0
+                    foot.center_y = top + foot.height
+                    foot.change_y = -evt.fall_speed
+            elif state == FOOT_FALLING:
+                if foot.center_y <= evt.target_y:
+                    foot.center_y = evt.target_y
                     foot.change_y = 0
-                    evt["state"] = "landed"
-                    evt["land_time"] = now
-            elif state == "landed":
+                    evt.state = FOOT_LANDED
+                    evt.timer = 0.0
+            elif state == FOOT_LANDED:
                 # After a short pause, foot retracts upward and shadow disappears
-                if now - evt.get("land_time", now) > 0.6 and "retracting" not in evt:
-                    # start retract
-                    evt["retracting"] = True
-                    if shadow in self.actors:
-                        shadow.remove_from_sprite_lists()
-                    foot.change_y = +evt["fall_speed"] * 0.9
-                elif "retracting" in evt:
-                    # Once foot is off-screen, cleanup
-                    if foot.center_y > self.window.height + float(getattr(foot, "height", 60)):
-                        if foot in self.feet:
-                            foot.remove_from_sprite_lists()
-                        self.foot_events.remove(evt)
-
-        # Crush logic based on shadow area only when landed
-        active_shadows = [e["shadow"] for e in self.foot_events if e["state"] == "landed"]
-        if active_shadows:
-            if self.controlled_ant and any(arcade.check_for_collision(self.controlled_ant, s) for s in active_shadows):
+                if evt.timer > FOOT_LANDED_PAUSE:
+                    evt.state = FOOT_RETRACTING
+                    self.shadow_pool.release(evt.shadow)
+                    foot.change_y = +evt.fall_speed * 0.9
+            elif foot.center_y > top + foot.height:
+                # Retracted off-screen: cleanup (the moved-in last event is handled next)
+                self.foot_pool.release(foot)
+                self._remove_foot_event(i)
+                continue
+            i += 1
+
+    def _crush_ants_under_feet(self):
+        """
+        One collision pass per tick: followers under a landed foot's shadow are removed.
+
+        The followers are indexed once in a spatial grid, then each landed shadow
+        only tests the ants of the cells around it. Only the controlled ant
+        causes game over; the crushed followers are removed in one batch.
+        """
+        if not self.followers:
+            return
+        crushed = {}
+        with self.profiler.timer("feet_collisions"):
+            grid = None
+            for evt in self.foot_events:
+                if evt.state != FOOT_LANDED:
+                    continue
+                if grid is None:
+                    grid = self._ant_grid
+                    grid.rebuild(self.followers)
+                shadow = evt.shadow
+                reach = max(shadow.width, shadow.height) / 2 + self._ant_reach
+                for ant in grid.query(shadow.center_x, shadow.center_y, reach):
+                    if id(ant) not in crushed and check_for_collision(ant, shadow):
+                        crushed[id(ant)] = ant
+        for ant in crushed.values():
+            if ant is self.controlled_ant:
                 self.game_over = True
-            crushed2 = []
-            for ant in self.followers:
-                if any(arcade.check_for_collision(ant, s) for s in active_shadows):
-                    crushed2.append(ant)
-            for ant in crushed2:
-                if ant is self.controlled_ant:
-                    self.game_over = True
-                ant.remove_from_sprite_lists()
-                if ant in self.followers:
-                    self.followers.remove(ant)
+            # Also removes it from self.followers
+            ant.remove_from_sprite_lists()
 
     def on_mouse_motion(self, x: float, y: float, dx: float, dy: float):
         self._mouse_x, self._mouse_y = x, y
@@ -527,7 +599,7 @@ class AntView(BaseView):
         if ant_img.exists():
             follower = self._load_scaled(str(ant_img), target_w=ant_target_w)
         else:
-            follower = arcade.SpriteSolidColor(ant_target_w, ant_target_w, arcade.color.BROWN)
+            follower = make_solid_sprite(ant_target_w, ant_target_w, arcade.color.BROWN)
         anchor = self.followers[-1] if len(self.followers) else (self.queen if self.queen else None)
         if anchor:
             follower.center_x = anchor.center_x - 24
@@ -545,19 +617,19 @@ class MiniGame:
         self.speed = 300  # px/sec
         self.target_zone = (350, 450)
         # Build sprites instead of using draw_* API
-        self.sprites = arcade.SpriteList()
+        self.sprites = make_sprite_list()
         # Background gray bar
-        self.bg = arcade.SpriteSolidColor(400, 20, arcade.color.GRAY)
+        self.bg = make_solid_sprite(400, 20, arcade.color.GRAY)
         self.bg.center_x = 400
         self.bg.center_y = 100
         self.sprites.append(self.bg)
         # Red zone indicator
-        self.red = arcade.SpriteSolidColor(100, 30, arcade.color.RED)
+        self.red = make_solid_sprite(100, 30, arcade.color.RED)
         self.red.center_x = 400
         self.red.center_y = 100
         self.sprites.append(self.red)
         # Moving blue bar
-        self.bar = arcade.SpriteSolidColor(20, 30, arcade.color.BLUE)
+        self.bar = make_solid_sprite(20, 30, arcade.color.BLUE)
         self.bar.center_x = self.bar_x
         self.bar.center_y = 100
         self.sprites.append(self.bar)
@@ -1,5 +1,114 @@
+import functools
+import random
+import time
+
 import arcade
-from core import get_sound_manager, play_ui_sound
+from core import (
+    get_sound_manager, play_ui_sound, get_preloader, get_headless_window, is_headless,
+    get_profiler, get_texture_cache, get_procedural_textures, get_recorder, new_scene_seed,
+    EntityList, SpritePool, TextCache, PARK_POSITION
+)
+
+# Pas de simulation fixe (secondes) : la logique des scènes tourne à 60 ticks/s
+# quelle que soit la fréquence d'affichage.
+FIXED_TIMESTEP = 1 / 60
+# Nombre maximum de ticks rattrapés par frame (évite la spirale sur machine lente)
+MAX_STEPS_PER_FRAME = 5
+
+# Méthodes de scène mesurées par le profileur (voir core.profiler)
+_INSTRUMENTED = {"on_update": "update", "on_draw": "draw", "on_key_press": "key"}
+# Entrées notées pour la relecture (voir core.replay)
+_RECORDED_INPUTS = (
+    "on_key_press", "on_key_release", "on_mouse_press", "on_mouse_release",
+    "on_mouse_motion", "on_mouse_drag",
+)
+# Entrées fréquentes, traitées sans repasser par l'état simulé
+_MOTION_INPUTS = ("on_mouse_motion", "on_mouse_drag")
+# Touches de l'overlay de performance, de la trace Chrome et de l'enregistrement
+PERF_OVERLAY_KEY = arcade.key.F3
+PERF_TRACE_KEY = arcade.key.F4
+RECORD_KEY = arcade.key.F5
+
+
+def _recorded(method):
+    """Enveloppe une méthode d'entrée : l'entrée est notée au tick courant (core.replay)."""
+    if getattr(method, "_recorded", False):
+        return method
+    name = method.__name__
+    motion = name in _MOTION_INPUTS
+
+    @functools.wraps(method)
+    def wrapper(self, *args):
+        # Appel via super() : déjà noté par la méthode la plus dérivée
+        if self._dispatching:
+            return method(self, *args)
+        self._dispatching = True
+        try:
+            self.recorder.record(self, name, args)
+            try:
+                return method(self, *args)
+            finally:
+                # Une touche ou un clic peut changer l'affichage d'une scène statique
+                if not motion:
+                    self._needs_redraw = True
+        finally:
+            self._dispatching = False
+
+    wrapper._recorded = True
+    return wrapper
+
+
+def _instrumented(kind: str, method):
+    """Enveloppe une méthode de scène : mesure update / draw, touches F3 / F4."""
+    if getattr(method, "_instrumented", False):
+        return method
+
+    if kind == "key":
+        @functools.wraps(method)
+        def wrapper(self, key, modifiers):
+            if key == PERF_OVERLAY_KEY:
+                self.profiler.toggle()
+                self.request_redraw()
+                return
+            if key == PERF_TRACE_KEY:
+                self.profiler.toggle_trace()
+                return
+            if key == RECORD_KEY:
+                self.recorder.toggle()
+                return
+            return method(self, key, modifiers)
+    else:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            # Appel via super() : déjà mesuré par la méthode la plus dérivée
+            if self._measuring:
+                return method(self, *args, **kwargs)
+            self._measuring = True
+            start = time.perf_counter()
+            if kind == "draw":
+                # Une demande faite pendant ce rendu vaut pour le suivant
+                self._needs_redraw = False
+                # Positions interpolées le temps de ce rendu seulement : une
+                # fois par frame présentée, quel que soit le rythme d'on_update
+                self._apply_interpolation()
+            try:
+                result = method(self, *args, **kwargs)
+                # Libellés demandés mais pas encore dessinés par la scène
+                if kind == "draw" and self.labels.pending:
+                    self.labels.draw()
+                return result
+            finally:
+                if kind == "draw":
+                    self._restore_simulated_state()
+                self._measuring = False
+                self.profiler.add_time(kind, start, time.perf_counter())
+                if kind == "draw":
+                    self.profiler.end_frame()
+                    if self.profiler.enabled:
+                        self.draw_perf_overlay()
+
+    wrapper._instrumented = True
+    return wrapper
 
 
 class BaseView(arcade.View):
@@ -7,12 +116,104 @@ class BaseView(arcade.View):
 
     Provides common lifecycle hooks and minimal shared behavior.
     Subclasses should override hooks as needed.
+
+    Subclasses may declare ``PRELOAD_TEXTURES`` / ``PRELOAD_SOUNDS`` /
+    ``PRELOAD_ANIMATIONS`` (paths relative to the project root) so the
+    previous scene can decode them in the background before they are shown.
+
+    Game logic goes in ``fixed_update(dt)``, which runs at a fixed
+    ``FIXED_TIMESTEP`` tick rate. Sprites of the lists named in
+    ``INTERPOLATED_LISTS`` are drawn interpolated between the last two ticks,
+    so rendering can run uncapped or vsynced without changing game speed.
+    Interpolated positions only exist during ``on_draw``; everywhere else
+    (ticks, input handlers) sprites sit at their simulated positions.
+
+    ``on_update`` / ``on_draw`` of every scene are timed automatically. F3
+    toggles the performance overlay, F4 records a Chrome trace, and hot
+    sections can be timed with ``with self.profiler.timer("name"):``.
+
+    Each scene seeds ``random`` with ``self.seed`` when it is built and again
+    when it is shown, and its key and mouse inputs are noted with the tick
+    they arrive at. F5 writes the session to ``recordings/`` so that
+    ``core.replay`` can play it again exactly. Game randomness must come from
+    ``random`` (no wall clock).
+
+    Scenes that only change on input (dialogues, credits, menus) set
+    ``RENDER_ON_DEMAND``: under ``core.GameWindow`` a frame is then drawn and
+    presented only after a key or button press, a view change, a resize, or
+    ``self.request_redraw()``; otherwise the last frame stays on screen.
+
+    Text goes through ``self.labels.text(key, ...)`` rather than
+    ``arcade.draw_text``: labels are kept between frames and drawn in one
+    batch at the end of ``on_draw`` (or earlier with ``self.labels.draw()``).
+
+    Scenes with ``REUSABLE = True`` are kept by ``scenes.registry.get_scene``
+    and shown again instead of being rebuilt: ``reset()`` is called first and
+    must bring the game state back to its start, keeping sprite lists and
+    textures. ``on_show_view`` runs again as usual.
     """
 
+    PRELOAD_TEXTURES: tuple[str, ...] = ()
+    PRELOAD_SOUNDS: tuple[str, ...] = ()
+    PRELOAD_ANIMATIONS: tuple[str, ...] = ()
+    INTERPOLATED_LISTS: tuple[str, ...] = ()
+    REUSABLE: bool = False
+    RENDER_ON_DEMAND: bool = False
+    _measuring: bool = False
+    _dispatching: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._instrument()
+
+    @classmethod
+    def _instrument(cls):
+        for name in _RECORDED_INPUTS:
+            if name in cls.__dict__:
+                setattr(cls, name, _recorded(cls.__dict__[name]))
+        for name, kind in _INSTRUMENTED.items():
+            if name in cls.__dict__:
+                setattr(cls, name, _instrumented(kind, cls.__dict__[name]))
+
     def __init__(self):
-        super().__init__()
+        # Graine de la partie, appliquée avant que la scène ne tire quoi que ce soit
+        self.seed: int = new_scene_seed()
+        random.seed(self.seed)
+        # En mode headless, la vue est rattachée à la fenêtre simulée
+        super().__init__(get_headless_window())
         self.background_color = arcade.color.BLACK
         self.sound_manager = get_sound_manager()
+        self.preloader = get_preloader()
+        self.profiler = get_profiler()
+        self.recorder = get_recorder()
+        # Textes conservés d'un frame à l'autre (voir core.text_cache)
+        self.labels = TextCache()
+        self._perf_text: arcade.Text | None = None
+        self._perf_background: arcade.SpriteList | None = None
+        # Rendu à la demande (RENDER_ON_DEMAND) : frame à redessiner
+        self._needs_redraw: bool = True
+        # Horloge de simulation
+        self.tick: int = 0
+        self.render_alpha: float = 1.0
+        self._accumulator: float = 0.0
+        # sprite -> (x, y, angle) avant le dernier tick / état simulé courant
+        self._prev_state: dict = {}
+        self._sim_state: dict = {}
+
+    def reset(self):
+        """Remet la vue dans son état de départ avant sa réutilisation (voir REUSABLE).
+
+        Les sous-classes réutilisables complètent avec leur état de jeu
+        (``super().reset()`` d'abord).
+        """
+        self.tick = 0
+        self.render_alpha = 1.0
+        self._accumulator = 0.0
+        self._prev_state = {}
+        self._sim_state = {}
+        self._needs_redraw = True
+        # Nouvelle partie, nouvelle graine (appliquée par on_show_view)
+        self.seed = new_scene_seed()
 
     def setup(self):
         """Méthode de préparation de la vue (par défaut ne fait rien).
@@ -23,17 +224,118 @@ class BaseView(arcade.View):
     # ----- Lifecycle -----
     def on_show_view(self):
         """Appelé automatiquement quand la vue devient active"""
+        random.seed(self.seed)
+        self.recorder.begin_scene(self, self.seed)
         self.setup()  # <-- chaque sous-classe peut surcharger setup()
+        if is_headless():
+            return
         arcade.set_background_color(self.background_color)
         if self.window:
             self.window.set_mouse_visible(True)
+        self.preload_next_scene()
 
     def on_draw(self):
         self.clear()
 
+    # ----- Render on demand -----
+    def request_redraw(self):
+        """L'affichage a changé : la prochaine frame sera dessinée (voir RENDER_ON_DEMAND)."""
+        self._needs_redraw = True
+
+    @property
+    def needs_redraw(self) -> bool:
+        """Lu par core.GameWindow : False = garder la dernière image à l'écran."""
+        return not self.RENDER_ON_DEMAND or self._needs_redraw or self.profiler.enabled
+
     def on_update(self, delta_time: float):
+        # Envoi GPU progressif des textures préchargées
+        self.preloader.pump()
+
+        # Les sprites sont à leur position simulée hors du draw (voir _instrumented)
+        self._accumulator += min(delta_time, FIXED_TIMESTEP * MAX_STEPS_PER_FRAME)
+        while self._accumulator >= FIXED_TIMESTEP:
+            self._accumulator -= FIXED_TIMESTEP
+            self._prev_state = self._capture_state()
+            self.step()
+            # La scène a pu changer pendant le tick
+            if self.window is None or self.window.current_view is not self:
+                return
+        self.render_alpha = self._accumulator / FIXED_TIMESTEP
+
+    def step(self):
+        """Avance la simulation d'un tick (aussi utilisé par core.headless.simulate)."""
+        self.fixed_update(FIXED_TIMESTEP)
+        self.tick += 1
+
+    def fixed_update(self, delta_time: float):
+        """Logique de jeu, appelée à pas fixe (delta_time == FIXED_TIMESTEP)."""
         pass
 
+    # ----- Interpolation -----
+    def _interpolated_sprites(self):
+        for name in self.INTERPOLATED_LISTS:
+            sprite_list = getattr(self, name, None)
+            if sprite_list:
+                yield from sprite_list
+
+    def _capture_state(self) -> dict:
+        return {s: (s.center_x, s.center_y, s.angle) for s in self._interpolated_sprites()}
+
+    def _apply_interpolation(self):
+        """Place les sprites entre l'avant-dernier et le dernier tick pour l'affichage."""
+        alpha = self.render_alpha
+        self._sim_state = {}
+        for sprite in self._interpolated_sprites():
+            cur = (sprite.center_x, sprite.center_y, sprite.angle)
+            prev = self._prev_state.get(sprite)
+            if prev is None or prev == cur:
+                continue
+            # Sprite tiré du pool ou rendu pendant le tick : pas de trajet depuis / vers le parking
+            if prev[:2] == PARK_POSITION or cur[:2] == PARK_POSITION:
+                continue
+            sprite.position = (prev[0] + (cur[0] - prev[0]) * alpha, prev[1] + (cur[1] - prev[1]) * alpha)
+            sprite.angle = prev[2] + (cur[2] - prev[2]) * alpha
+            self._sim_state[sprite] = (cur, (sprite.center_x, sprite.center_y, sprite.angle))
+
+    def reset_interpolation(self, sprite):
+        """Sprite téléporté (recyclé, respawn) : l'afficher directement à sa nouvelle position."""
+        self._prev_state.pop(sprite, None)
+
+    def _restore_simulated_state(self):
+        for sprite, (cur, shown) in self._sim_state.items():
+            # Un sprite déplacé pendant le rendu garde sa nouvelle position
+            if (sprite.center_x, sprite.center_y, sprite.angle) != shown:
+                continue
+            sprite.position = cur[:2]
+            sprite.angle = cur[2]
+        self._sim_state = {}
+
+    # ----- Scene graph -----
+    def next_scene_class(self):
+        """Classe de la scène suivante dans l'histoire (None si fin de chaîne)."""
+        from . import next_scene_class
+        return next_scene_class(type(self).__name__)
+
+    def preload_next_scene(self):
+        """Lance le décodage en arrière-plan des assets de la scène suivante."""
+        view_class = self.next_scene_class()
+        if view_class is not None and not is_headless():
+            self.preloader.preload_view(view_class)
+
+    def show_next_scene(self):
+        """Ouvre la scène suivante une fois tous ses assets résidents."""
+        view_class = self.next_scene_class()
+        if view_class is None or not self.window:
+            return
+        if is_headless():
+            # La scène suivante n'est pas construite : la partie simulée s'arrête ici
+            self.window.record_transition(view_class.__name__)
+            return
+        self.preloader.preload_view(view_class)
+        self.preloader.finish()
+        from .registry import get_scene
+        self.window.show_view(get_scene(view_class))
+
     # ----- Input -----
     def on_key_press(self, key: int, modifiers: int):
         pass
@@ -41,12 +343,84 @@ class BaseView(arcade.View):
     def on_key_release(self, key: int, modifiers: int):
         pass
 
+    def on_mouse_press(self, x: float, y: float, button: int, modifiers: int):
+        pass
+
+    def on_mouse_release(self, x: float, y: float, button: int, modifiers: int):
+        pass
+
+    def on_mouse_motion(self, x: float, y: float, dx: float, dy: float):
+        pass
+
+    def on_mouse_drag(self, x: float, y: float, dx: float, dy: float, buttons: int, modifiers: int):
+        pass
+
+    # ----- Performance overlay -----
+    def draw_perf_overlay(self):
+        """Overlay F3 : FPS, temps, appels draw_*, sprites par liste, caches, voix audio."""
+        if not self.window:
+            return
+        averages = self.profiler.averages()
+        timers = ", ".join(
+            f"{name} {ms:.2f}" for name, ms in sorted(averages.items())
+            if name not in ("update", "draw", "draw_calls", "gl_draws", "texture_binds")
+        )
+        lists = ", ".join(
+            f"{name} {len(value)}" for name, value in vars(self).items()
+            if isinstance(value, (arcade.SpriteList, EntityList))
+        )
+        pools = ", ".join(
+            f"{pool.name} {len(pool)}/{pool.high_water}" for pool in vars(self).values()
+            if isinstance(pool, SpritePool)
+        )
+        tex = get_texture_cache().stats()
+        procedural = get_procedural_textures().stats()
+        voices = self.sound_manager.voice_stats()
+        lines = [
+            f"FPS {self.profiler.fps():.0f}   update {averages.get('update', 0.0):.2f} ms"
+            f"   draw {averages.get('draw', 0.0):.2f} ms   draw_* {self.profiler.last_draw_calls}"
+            f"   draws GPU {self.profiler.last_gl_draws} / textures liées {self.profiler.last_texture_binds}",
+            f"timers (ms): {timers or '-'}",
+            f"sprites: {lists or '-'}",
+            f"pools (actifs/max): {pools or '-'}",
+            f"textures: {tex['entries']} ({tex['bytes'] / 1e6:.1f} Mo)"
+            f"   hits {tex['hits']} / misses {tex['misses']} / evictions {tex['evictions']}"
+            f"   procédurales {procedural['entries']} (misses {procedural['misses']})",
+            f"voix: {voices['active']}/{voices['max']}   jouées {voices['played']}"
+            f" / volées {voices['stolen']} / ignorées {voices['dropped']}",
+            f"entrées: graine {self.seed}, tick {self.tick}"
+            + (f"   enregistrement {self.recorder.path.name}" if self.recorder.recording else "   F5 pour enregistrer"),
+        ]
+        if self.RENDER_ON_DEMAND and hasattr(self.window, "stats"):
+            frames = self.window.stats()
+            lines.append(f"rendu à la demande: {frames['drawn']} frames dessinées / {frames['skipped']} sautées")
+
+        if self._perf_text is None:
+            self._perf_text = arcade.Text("", 10, 0, arcade.color.YELLOW, 11,
+                                          multiline=True, width=self.window.width - 20, anchor_y="top")
+            background = arcade.SpriteSolidColor(1, 1, color=(0, 0, 0, 170))
+            self._perf_background = arcade.SpriteList()
+            self._perf_background.append(background)
+        self._perf_text.text = "\n".join(lines)
+        self._perf_text.y = self.window.height - 8
+        background = self._perf_background[0]
+        background.width = self._perf_text.content_width + 16
+        background.height = self._perf_text.content_height + 12
+        background.center_x = 2 + background.width / 2
+        background.center_y = self.window.height - 2 - background.height / 2
+
+        # Repère écran, indépendant de la caméra de la scène
+        self.window.default_camera.use()
+        self._perf_background.draw()
+        self._perf_text.draw()
+
     # ----- Utility -----
     def show_text_center(self, text: str, color: arcade.color = arcade.color.WHITE, size: int = 24):
         width = self.window.width if self.window else 1280
         height = self.window.height if self.window else 800
 
-        arcade.draw_text(
+        self.labels.text(
+            "show_text_center",
             text,
             width / 2,
             height / 2,
@@ -55,3 +429,6 @@ class BaseView(arcade.View):
             anchor_x="center",
             anchor_y="center",
         )
+
+
+BaseView._instrument()
@@ -2,9 +2,13 @@ from typing import Optional
 import arcade
 
 from .base import BaseView
+from .registry import get_scene
 
 
 class CreditsView(BaseView):
+    REUSABLE = True
+    RENDER_ON_DEMAND = True
+
     def __init__(self):
         super().__init__()
         self.background_color = (10, 12, 16)
@@ -142,5 +146,4 @@ class CreditsView(BaseView):
         if not self.window:
             return
         if key == arcade.key.ESCAPE :
-            from .main_menu import MainMenuView
-            self.window.show_view(MainMenuView())
\ No newline at end of file
+            self.window.show_view(get_scene("MainMenuView"))
\ No newline at end of file
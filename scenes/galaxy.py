@@ -3,10 +3,22 @@ from pathlib import Path
 
 from .UniversDialogueScene import UniversDialogueScene
 from .base import BaseView
+from core import load_texture, make_sprite
 
 PATH = Path(__file__).resolve().parent.parent / "assets" 
 
 class GalaxyView(BaseView):
+    PRELOAD_TEXTURES = (
+        "assets/galaxy.png",
+        "assets/planet.png",
+        "assets/planet_rose.png",
+        "assets/planet_verte.png",
+        "assets/down_arrow.png",
+        "assets/alien_spaceship_no_fire.png",
+        "assets/explosion.png",
+    )
+    INTERPOLATED_LISTS = ("planet_list",)
+
     def __init__(self):
         super().__init__()
         self.background_list = arcade.SpriteList()  
@@ -28,43 +40,43 @@ class GalaxyView(BaseView):
         self.alien = arcade.SpriteList()  
         self.directions = []
 
-        bg = arcade.Sprite(str(PATH / "galaxy.png"), scale=1)
+        bg = make_sprite(str(PATH / "galaxy.png"), scale=1)
         bg.center_x = 0
         bg.center_y = 0
         self.background_list.append(bg)
 
         # --- création planètes ---
-        planet = arcade.Sprite(str(PATH / "planet.png"), scale=0.1)
+        planet = make_sprite(str(PATH / "planet.png"), scale=0.1)
         planet.center_x = 400
         planet.center_y = 400
         self.planet_list.append(planet)
         self.directions.append(-1)  
 
-        planet1 = arcade.Sprite(str(PATH / "planet_rose.png"), scale=0.1)
+        planet1 = make_sprite(str(PATH / "planet_rose.png"), scale=0.1)
         planet1.center_x = 600
         planet1.center_y = 400
         self.planet_list.append(planet1)
         self.directions.append(1)
 
-        planet2 = arcade.Sprite(str(PATH / "planet_verte.png"), scale=0.1)
+        planet2 = make_sprite(str(PATH / "planet_verte.png"), scale=0.1)
         planet2.center_x = 800
         planet2.center_y = 400
         self.planet_list.append(planet2)
         self.directions.append(-1)  
 
         # --- création flèche ---
-        arrow1 = arcade.Sprite(str(PATH / "down_arrow.png"), scale=0.1)
+        arrow1 = make_sprite(str(PATH / "down_arrow.png"), scale=0.1)
         arrow1.center_x = 400
         arrow1.center_y = 600
         self.arrow_list.append(arrow1)
         self.directions.append(1)
-        arrow2 = arcade.Sprite(str(PATH / "down_arrow.png"), scale=0.1)
+        arrow2 = make_sprite(str(PATH / "down_arrow.png"), scale=0.1)
         arrow2.center_x = 600
         arrow2.center_y = 600
         arrow2.visible = False
         self.arrow_list.append(arrow2)
         self.directions.append(-1)
-        arrow3 = arcade.Sprite(str(PATH / "down_arrow.png"), scale=0.1)
+        arrow3 = make_sprite(str(PATH / "down_arrow.png"), scale=0.1)
         arrow3.center_x = 800
         arrow3.center_y = 600
         arrow3.visible = False
@@ -72,7 +84,7 @@ class GalaxyView(BaseView):
         self.directions.append(-1)
 
         # --- création alien ---
-        alien1 = arcade.Sprite(str(PATH / "alien_spaceship_no_fire.png"), scale=0.075)
+        alien1 = make_sprite(str(PATH / "alien_spaceship_no_fire.png"), scale=0.075)
         alien1.center_x = 150
         alien1.center_y = 400
         alien1.visible = True
@@ -85,7 +97,8 @@ class GalaxyView(BaseView):
         self.arrow_list.draw()
         self.alien.draw()
         if self.planet_names:
-            arcade.draw_text(
+            self.labels.text(
+            "planet_name",
             self.planet_names[self.selected_index],
         600,  # fixed under the middle planet
         60,
@@ -94,7 +107,8 @@ class GalaxyView(BaseView):
         anchor_x="center"
         )
         if self.planet_desc:
-            arcade.draw_text(
+            self.labels.text(
+            "planet_desc",
             self.planet_desc[self.selected_index],
             600,  # fixed under the middle planet
             30,
@@ -104,7 +118,7 @@ class GalaxyView(BaseView):
         )
 
 
-    def on_update(self, delta_time):
+    def fixed_update(self, delta_time):
         """Idle animation : haut/bas des planètes"""
         for i, planet in enumerate(self.planet_list):
             planet.center_y += self.directions[i] * 0.5
@@ -129,9 +143,11 @@ class GalaxyView(BaseView):
         if key == arcade.key.ENTER:
             for i, planet in enumerate(self.planet_list):
                 if i != self.selected_index:
-                    planet.texture = arcade.load_texture(str(PATH / "explosion.png"))
+                    planet.texture = load_texture(str(PATH / "explosion.png"))
                     planet.scale = 1
-            self.alien[0].texture = arcade.load_texture(str(PATH / "alien_spaceship.png"))
+            self.alien[0].texture = load_texture(str(PATH / "alien_spaceship.png"))
+            # Le vaisseau d'origine peut venir d'une copie bakée : on réapplique l'échelle voulue
+            self.alien[0].scale = 0.075
             self.planet_names = ["HAHAHHAHA","HAHAHHAHA","HAHAHHAHA"]
             self.planet_desc = ["","",""]
             self.window.show_view(UniversDialogueScene())
@@ -1,10 +1,11 @@
 import arcade
 from .base import BaseView
-from .atom import AtomView
-from .ant import AntView
-from .galaxy import GalaxyView
+from .registry import get_scene
 
 class HubView(BaseView):
+    REUSABLE = True
+    RENDER_ON_DEMAND = True
+
     def __init__(self):
         super().__init__()
         self.background_color = arcade.color.DARK_BROWN
@@ -17,20 +18,17 @@ class HubView(BaseView):
         if not self.window:
             return
         key_to_view = {
-            arcade.key.KEY_1: ("atom", "AtomView"),
-            arcade.key.KEY_2: ("ant", "AntView"),
-            arcade.key.KEY_3: ("human_dog", "HumanDogView"),
-            arcade.key.KEY_4: ("alien", "AlienView"),
-            arcade.key.KEY_5: ("galaxy", "GalaxyView"),
-            arcade.key.KEY_6: ("universe", "UniverseView"),
+            arcade.key.KEY_1: "AtomView",
+            arcade.key.KEY_2: "AntView",
+            arcade.key.KEY_3: "HumanDogView",
+            arcade.key.KEY_4: "AlienView",
+            arcade.key.KEY_5: "GalaxyView",
+            arcade.key.KEY_6: "UniverseView",
+            arcade.key.KEY_7: "AtomStormView",
         }
         if key in key_to_view:
-            module_name, class_name = key_to_view[key]
-            module = __import__(f"scenes.{module_name}", fromlist=[class_name])
-            view_class = getattr(module, class_name)
-            self.window.show_view(view_class())
+            self.window.show_view(get_scene(key_to_view[key]))
         elif key == arcade.key.ESCAPE:
-            from .menu import MenuView
-            self.window.show_view(MenuView())
+            self.window.show_view(get_scene("MenuView"))
 
 
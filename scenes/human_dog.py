@@ -3,8 +3,11 @@ import math
 from pathlib import Path
 import arcade
 from .base import BaseView
-from core import play_dog_sound, play_car_crash, play_footstep
-from .alien import AlienView
+from .registry import get_scene
+from core import (
+    play_dog_sound, play_car_crash, play_footstep, make_sprite, make_sprite_list,
+    make_solid_sprite, check_for_collision_with_list, SpritePool
+)
 
 ROAD_MARGIN = 96  # height of sidewalks at top/bottom
 LEASH_LENGTH = 140.0
@@ -23,6 +26,19 @@ CAR_TARGET_W = 90
 
 
 class HumanDogView(BaseView):
+    PRELOAD_TEXTURES = (
+        "assets/human_dog/background.png",
+        "assets/human_dog/owner.png",
+        "assets/human_dog/dog.png",
+        "assets/human_dog/bone.png",
+        "assets/human_dog/car_red.png",
+        "assets/human_dog/car_blue.png",
+        "assets/human_dog/car_yellow.png",
+        "assets/human_dog/paf.png",
+    )
+    INTERPOLATED_LISTS = ("_actors", "cars")
+    REUSABLE = True
+
     def __init__(self):
         super().__init__()
         # Use conservative colors available in older Arcade versions
@@ -31,12 +47,15 @@ class HumanDogView(BaseView):
         # Sprites / lists
         self.owner: arcade.Sprite | None = None
         self.dog: arcade.Sprite | None = None
-        self.bones = arcade.SpriteList()
-        self.cars = arcade.SpriteList()
-        self._bg = arcade.SpriteList()
-        self._actors = arcade.SpriteList()
-        self._bg_image_list = arcade.SpriteList()
-        self._effects = arcade.SpriteList()
+        self.bones = make_sprite_list()
+        self.cars = make_sprite_list()
+        self._bg = make_sprite_list()
+        self._actors = make_sprite_list()
+        self._bg_image_list = make_sprite_list()
+        self._effects = make_sprite_list()
+        self._make_pools()
+        # Window size the scenery was built for (None = not built yet)
+        self._built_size: tuple[int, int] | None = None
 
         # Input state
         self.keys_held: set[int] = set()
@@ -71,9 +90,39 @@ class HumanDogView(BaseView):
         width = self.window.width if self.window else 800
         height = self.window.height if self.window else 600
 
+        # Scenery, actors and pools are built once per window size; a reused
+        # view (see scenes.registry.get_scene) only parks its pooled sprites
+        if self._built_size != (width, height):
+            self._build_sprites(width, height)
+            self._built_size = (width, height)
+        else:
+            self.bone_pool.release_all()
+            self.car_pool.release_all()
+            self.paf_pool.release_all()
+
+        self.owner.center_x = width * 0.6
+        self.owner.center_y = height * 0.5
+        self.dog.center_x = self.owner.center_x - 50
+        self.dog.center_y = self.owner.center_y - 10
+        while len(self.bone_pool) < NUM_BONES:
+            self._spawn_bone(width, height)
+
+        # Reset state
+        self.keys_held.clear()
+        self._pick_new_owner_direction()
+        self._car_timer = 0.0
+        self._next_car_in = random.uniform(CAR_MIN_INTERVAL, CAR_MAX_INTERVAL)
+        self.score = 0
+        self.game_over = False
+        self._elapsed = 0.0
+        self._repulse_cooldown = 0.0
+        self._owner_repulse_target_y = None
+        self.__dict__.pop("next_scene_timer", None)
+
+    def _build_sprites(self, width: int, height: int):
         # Background image if provided, else draw blocks
         bg_path = self.asset_dir / "background.png"
-        self._bg_image_list = arcade.SpriteList()
+        self._bg_image_list = make_sprite_list()
         if bg_path.exists():
             bg_sprite = self._load_scaled(str(bg_path), target_w=width)
             # Stretch to cover height if needed
@@ -92,13 +141,13 @@ class HumanDogView(BaseView):
             self._bg_image_list.append(bg_sprite)
         
         # Background blocks as sprites (compatible across Arcade versions)
-        self._bg = arcade.SpriteList()
+        self._bg = make_sprite_list()
         # Grass top/bottom
-        sprite = arcade.SpriteSolidColor(int(width), 30, arcade.color.DARK_GREEN)
+        sprite = make_solid_sprite(int(width), 30, arcade.color.DARK_GREEN)
         sprite.center_x = width / 2
         sprite.center_y = height - 15
         self._bg.append(sprite)
-        sprite = arcade.SpriteSolidColor(int(width), 30, arcade.color.DARK_GREEN)
+        sprite = make_solid_sprite(int(width), 30, arcade.color.DARK_GREEN)
         sprite.center_x = width / 2
         sprite.center_y = 15
         self._bg.append(sprite)
@@ -106,54 +155,36 @@ class HumanDogView(BaseView):
         # Sidewalks
         sidewalk_height = max(0, ROAD_MARGIN - 30)
         if sidewalk_height > 0:
-            sprite = arcade.SpriteSolidColor(int(width), int(sidewalk_height), arcade.color.GRAY)
+            sprite = make_solid_sprite(int(width), int(sidewalk_height), arcade.color.GRAY)
             sprite.center_x = width / 2
             sprite.center_y = height - (30 + ROAD_MARGIN) / 2
             self._bg.append(sprite)
-            sprite = arcade.SpriteSolidColor(int(width), int(sidewalk_height), arcade.color.GRAY)
+            sprite = make_solid_sprite(int(width), int(sidewalk_height), arcade.color.GRAY)
             sprite.center_x = width / 2
             sprite.center_y = (30 + ROAD_MARGIN) / 2
             self._bg.append(sprite)
 
         # Road
         road_height = height - 2 * ROAD_MARGIN
-        sprite = arcade.SpriteSolidColor(int(width), int(road_height), arcade.color.BLACK)
+        sprite = make_solid_sprite(int(width), int(road_height), arcade.color.BLACK)
         sprite.center_x = width / 2
         sprite.center_y = height / 2
         self._bg.append(sprite)
 
-        # Owner sprite
+        # Owner and dog sprites
         self.owner = self._make_owner_sprite()
-        self.owner.center_x = width * 0.6
-        self.owner.center_y = height * 0.5
-
-        # Dog sprite
         self.dog = self._make_dog_sprite()
-        self.dog.center_x = self.owner.center_x - 50
-        self.dog.center_y = self.owner.center_y - 10
 
         # Actors list for drawing
-        self._actors = arcade.SpriteList()
+        self._actors = make_sprite_list()
         self._actors.append(self.owner)
         self._actors.append(self.dog)
 
-        # Bones
-        self.bones = arcade.SpriteList()
-        while len(self.bones) < NUM_BONES:
-            self._spawn_bone(width, height)
-
-        # Cars
-        self.cars = arcade.SpriteList()
-        # Effects
-        self._effects = arcade.SpriteList()
-
-        # Reset state
-        self.keys_held.clear()
-        self._pick_new_owner_direction()
-        self._car_timer = 0.0
-        self._next_car_in = random.uniform(CAR_MIN_INTERVAL, CAR_MAX_INTERVAL)
-        self.score = 0
-        self.game_over = False
+        # Bones, cars, effects: recycled through pools
+        self.bones = make_sprite_list()
+        self.cars = make_sprite_list()
+        self._effects = make_sprite_list()
+        self._make_pools()
 
     # ----- Drawing -----
     def on_draw(self):
@@ -183,31 +214,28 @@ class HumanDogView(BaseView):
 
         # UI
         if self.window:
-            arcade.draw_text(
+            self.labels.text(
+                "score",
                 f"Score: {self.score}",
                 10,
                 self.window.height - 30,
                 arcade.color.WHITE,
                 20,
             )
-            arcade.draw_text(
+            self.labels.text(
+                "title",
                 "Humain & Chien",
                 40,
                 self.window.height - 120,
                 arcade.color.WHITE,
                 40,
             )
-        if self.game_over and self.window:
-            #self.show_text_center("Collision ! Appuie sur ESC pour revenir")
-            if not hasattr(self, "next_scene_timer"):
-                self.next_scene_timer = 300  # 5 secondes à 60 FPS
 
-            # Décrémenter le timer
-            self.next_scene_timer -= 1
-            if self.next_scene_timer <= 0:
-                # Passer à la scène suivante
-                from .AlienDialogueScene import AlienDialogueScene
-                self.window.show_view(AlienDialogueScene())
+    def _make_pools(self):
+        """Pools of the short-lived sprites (bones, cars keyed by colour, paf keyed by size)."""
+        self.bone_pool = SpritePool(self.bones, lambda _key: self._make_bone_sprite(), "bones")
+        self.car_pool = SpritePool(self.cars, self._make_pooled_car, "cars")
+        self.paf_pool = SpritePool(self._effects, self._make_paf_sprite, "paf")
 
     def _draw_background(self):
         # Kept for compatibility; no-op because background is prebuilt as sprites
@@ -216,14 +244,23 @@ class HumanDogView(BaseView):
         # Center dashed line
         for x in range(40, w, 80):
             # Use sprites for dashed line to avoid draw_* API variance
-            dash = arcade.SpriteSolidColor(40, 6, arcade.color.YELLOW)
+            dash = make_solid_sprite(40, 6, arcade.color.YELLOW)
             dash.center_x = x
             dash.center_y = h / 2
             dash.draw()
 
     # ----- Update -----
-    def on_update(self, delta_time: float):
+    def fixed_update(self, delta_time: float):
         if self.game_over:
+            #self.show_text_center("Collision ! Appuie sur ESC pour revenir")
+            if not hasattr(self, "next_scene_timer"):
+                self.next_scene_timer = 300  # 5 secondes (300 ticks)
+
+            # Décrémenter le timer
+            self.next_scene_timer -= 1
+            if self.next_scene_timer <= 0:
+                # Passer à la scène suivante (AlienDialogueScene)
+                self.show_next_scene()
             return
         if not self.window:
             return
@@ -243,8 +280,7 @@ class HumanDogView(BaseView):
     # ----- Input -----
     def on_key_press(self, key: int, modifiers: int):
         if key == arcade.key.ESCAPE and self.window:
-            from .menu import MenuView
-            self.window.show_view(MenuView())
+            self.window.show_view(get_scene("MenuView"))
             return
         self.keys_held.add(key)
 
@@ -334,24 +370,23 @@ class HumanDogView(BaseView):
     # ----- Bones -----
     def _spawn_bone(self, width: int, height: int):
         # Bone sprite (image if available, else placeholder)
-        bone = self._make_bone_sprite()
+        bone = self.bone_pool.acquire()
         # Ensure it spawns on the road and not too close to owner
         x = random.uniform(40, width - 40)
         y = random.uniform(ROAD_MARGIN + 24, height - ROAD_MARGIN - 24)
         bone.center_x = x
         bone.center_y = y
-        self.bones.append(bone)
 
     def _check_bone_collisions(self):
         if not self.dog:
             return
-        hit_list = arcade.check_for_collision_with_list(self.dog, self.bones)
+        hit_list = check_for_collision_with_list(self.dog, self.bones)
         for bone in hit_list:
-            bone.remove_from_sprite_lists()
+            self.bone_pool.release(bone)
             self.score += 1
             play_dog_sound('bark', 0.7)
         # Maintain 5 bones
-        while len(self.bones) < NUM_BONES and self.window:
+        while len(self.bone_pool) < NUM_BONES and self.window:
             self._spawn_bone(self.window.width, self.window.height)
 
     # ----- Cars -----
@@ -361,7 +396,7 @@ class HumanDogView(BaseView):
         difficulty = min(3.0, self._elapsed / 30.0)  # after ~90s reaches cap
         # Allow more concurrent cars as difficulty rises
         max_cars = 2 + int(difficulty * 2)
-        if self._car_timer >= self._next_car_in and self.window and len(self.cars) < max_cars:
+        if self._car_timer >= self._next_car_in and self.window and len(self.car_pool) < max_cars:
             self._car_timer = 0.0
             base_interval = random.uniform(CAR_MIN_INTERVAL, CAR_MAX_INTERVAL)
             # Spawn faster with higher difficulty
@@ -371,7 +406,7 @@ class HumanDogView(BaseView):
     def _spawn_car(self, width: int, height: int):
         # Car sprite (image if available, else colored rectangle)
         color_choice = random.choice(["red", "blue", "yellow"])
-        car = self._make_car_sprite(color_choice)
+        car = self.car_pool.acquire(color_choice)
         # Keep cars fully on the road, away from sidewalks
         lane_padding = 50  # distance from road edges
         road_top = height - ROAD_MARGIN - lane_padding
@@ -398,9 +433,6 @@ class HumanDogView(BaseView):
                 car.angle = -90
             except Exception:
                 pass
-        # Use texture-derived hitbox for accurate collisions
-        self._set_texture_hitbox(car)
-        self.cars.append(car)
 
     def _update_cars(self, dt: float):
         if not self.window:
@@ -410,19 +442,19 @@ class HumanDogView(BaseView):
         lane_padding = 50
         road_top = self.window.height - ROAD_MARGIN - lane_padding
         road_bottom = ROAD_MARGIN + lane_padding
-        for car in list(self.cars):
+        for car in list(self.car_pool.active):
             # Clamp Y to the road band just in case
             if car.center_y > road_top:
                 car.center_y = road_top
             elif car.center_y < road_bottom:
                 car.center_y = road_bottom
             if car.center_x < -100 or car.center_x > self.window.width + 100:
-                car.remove_from_sprite_lists()
+                self.car_pool.release(car)
 
     def _check_car_collisions(self):
         if not self.dog:
             return
-        hit_cars = arcade.check_for_collision_with_list(self.dog, self.cars)
+        hit_cars = check_for_collision_with_list(self.dog, self.cars)
         if hit_cars:
             # Spawn explosion midway between dog and each car
             play_car_crash(0.8)
@@ -438,19 +470,19 @@ class HumanDogView(BaseView):
         img = self.asset_dir / "owner.png"
         if img.exists():
             return self._load_scaled(str(img), target_w=OWNER_TARGET_W)
-        return arcade.SpriteSolidColor(28, 28, arcade.color.ORANGE)
+        return make_solid_sprite(28, 28, arcade.color.ORANGE)
 
     def _make_dog_sprite(self) -> arcade.Sprite:
         img = self.asset_dir / "dog.png"
         if img.exists():
             return self._load_scaled(str(img), target_w=DOG_TARGET_W)
-        return arcade.SpriteSolidColor(30, 20, arcade.color.DARK_BROWN)
+        return make_solid_sprite(30, 20, arcade.color.DARK_BROWN)
 
     def _make_bone_sprite(self) -> arcade.Sprite:
         img = self.asset_dir / "bone.png"
         if img.exists():
             return self._load_scaled(str(img), target_w=BONE_TARGET_W)
-        return arcade.SpriteSolidColor(24, 12, arcade.color.ORANGE)
+        return make_solid_sprite(24, 12, arcade.color.ORANGE)
 
     def _make_car_sprite(self, color: str) -> arcade.Sprite:
         img = self.asset_dir / f"car_{color}.png"
@@ -461,18 +493,27 @@ class HumanDogView(BaseView):
             "blue": arcade.color.BLUE,
             "yellow": arcade.color.YELLOW,
         }
-        return arcade.SpriteSolidColor(52, 26, color_map.get(color, arcade.color.RED))
+        return make_solid_sprite(52, 26, color_map.get(color, arcade.color.RED))
+
+    def _make_pooled_car(self, color: str) -> arcade.Sprite:
+        car = self._make_car_sprite(color)
+        # Use texture-derived hitbox for accurate collisions (once per pooled car)
+        self._set_texture_hitbox(car)
+        return car
+
+    def _make_paf_sprite(self, target_w: int) -> arcade.Sprite:
+        img = self.asset_dir / "paf.png"
+        if img.exists():
+            return self._load_scaled(str(img), target_w=target_w)
+        return make_solid_sprite(target_w, target_w, arcade.color.YELLOW_ORANGE)
 
     def _load_scaled(self, path: str, target_w: int) -> arcade.Sprite:
         """Load a sprite and scale it so its width equals target_w pixels.
 
         Keeps original aspect ratio. Falls back to scale 1.0 if texture not ready.
         """
-        sprite = arcade.Sprite(path, scale=1.0)
-        # Some Arcade versions load texture lazily; ensure texture exists
-        texture = sprite.texture
-        if texture and texture.width:
-            sprite.scale = target_w / float(texture.width)
+        # Texture décodée une seule fois via le cache partagé
+        sprite = make_sprite(path, target_w=target_w)
         # Prefer detailed/texture hit box when available
         self._set_texture_hitbox(sprite)
         return sprite
@@ -546,7 +587,7 @@ class HumanDogView(BaseView):
         """
         if not self.owner or self._repulse_cooldown > 0:
             return
-        for car in self.cars:
+        for car in self.car_pool.active:
             # Close in X (car approaching the owner horizontally)
             near_x = abs(car.center_x - self.owner.center_x) < (car.width / 2 + self.owner.width / 2 + 10)
             # Almost same lane in Y
@@ -568,12 +609,7 @@ class HumanDogView(BaseView):
 
     # ----- Effects -----
     def _spawn_paf(self, x: float, y: float, target_w: float):
-        img = self.asset_dir / "paf.png"
-        if img.exists():
-            sprite = self._load_scaled(str(img), target_w=int(target_w))
-        else:
-            sprite = arcade.SpriteSolidColor(int(target_w), int(target_w), arcade.color.YELLOW_ORANGE)
+        sprite = self.paf_pool.acquire(int(target_w))
         sprite.center_x = x
         sprite.center_y = y
-        self._effects.append(sprite)
 
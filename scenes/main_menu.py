@@ -1,22 +1,19 @@
 # scenes/main_menu.py
 
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Optional, List
 import math
 import arcade
 
-# Pillow est optionnel. Si non installé, le code utilisera frames PNG ou un fallback visuel.
-try:
-    from PIL import Image, ImageSequence
-    _PIL_OK = True
-except Exception:
-    _PIL_OK = False
-
 from .base import BaseView
-from core import play_ui_sound
+from .registry import get_scene
+from core import play_ui_sound, load_texture, get_animations
 
 
 class MainMenuView(BaseView):
+    # Gardée entre deux passages (fond animé décodé une seule fois)
+    REUSABLE = True
+
     def __init__(self):
         super().__init__()
         self.background_color = arcade.color.BLACK
@@ -34,15 +31,24 @@ class MainMenuView(BaseView):
         # Fallback si aucun asset dispo
         self._use_fallback: bool = False
         self._fallback_t: float = 0.0
+        # GIF en cours de décodage (core.animations) : fallback affiché en attendant
+        self._pending_gif: Optional[Path] = None
 
         # Menu
         self._options = ["Start", "Credit", "Quit"]  # ordre demandé
         self._selected_index = 0
 
     # ---------- Lifecycle ----------
+    def reset(self):
+        super().reset()
+        self._selected_index = 0
+        self._bg_index = 0
+        self._bg_time_accum = 0.0
+
     def on_show_view(self):
         super().on_show_view()
-        self._load_background()
+        if not self._bg_textures and not self._use_fallback:
+            self._load_background()
         self._ensure_spritelist_and_sprite()
         self._fit_sprite_to_window()
 
@@ -51,6 +57,10 @@ class MainMenuView(BaseView):
         self._fit_sprite_to_window()
 
     def on_update(self, delta_time: float):
+        # GIF décodé en arrière-plan : remplace le fallback dès qu'il est prêt
+        if self._pending_gif and get_animations().is_ready(self._pending_gif):
+            self._use_gif_background()
+
         # Anime les textures si on en a plusieurs
         if not self._use_fallback and self._bg_textures and len(self._bg_textures) > 1 and self._bg_sprite:
             self._bg_time_accum += delta_time
@@ -102,7 +112,8 @@ class MainMenuView(BaseView):
             arcade.draw_circle_filled(win_w * 0.35, win_h * 0.35, win_h * 0.5, (b, g, r, 25))
 
         # Titre centré
-        arcade.draw_text(
+        self.labels.text(
+            "title",
             "OUT OF SCALE",
             win_w // 2,
             win_h // 1.5,
@@ -121,7 +132,8 @@ class MainMenuView(BaseView):
         for i, option in enumerate(self._options):
             y = stack_top_y - i * line_h
             color = arcade.color.YELLOW if i == self._selected_index else arcade.color.WHITE
-            arcade.draw_text(
+            self.labels.text(
+                ("option", i),
                 option,
                 win_w - right_margin,
                 y,
@@ -155,7 +167,7 @@ class MainMenuView(BaseView):
         files = sorted(frames_dir.glob("*.png")) if frames_dir.exists() else []
         if files:
             try:
-                self._bg_textures = [arcade.load_texture(str(p)) for p in files]
+                self._bg_textures = [load_texture(str(p)) for p in files]
                 self._bg_durations = [0.08] * len(self._bg_textures)
                 print(f"[MainMenu] Loaded {len(self._bg_textures)} PNG frames")
                 return
@@ -166,7 +178,7 @@ class MainMenuView(BaseView):
         # 2) PNG statique
         if static_path.exists():
             try:
-                tex = arcade.load_texture(str(static_path))
+                tex = load_texture(str(static_path))
                 self._bg_textures = [tex]
                 self._bg_durations = [9999.0]
                 print("[MainMenu] Loaded static PNG background")
@@ -174,17 +186,14 @@ class MainMenuView(BaseView):
             except Exception as e:
                 print(f"[MainMenu] Static PNG load failed: {e}")
 
-        # 3) GIF via Pillow (optionnel)
-        if _PIL_OK and gif_path.exists():
-            try:
-                textures, durations = self._decode_gif_to_textures(gif_path)
-                if textures:
-                    self._bg_textures = textures
-                    self._bg_durations = durations
-                    print(f"[MainMenu] Decoded GIF -> {len(textures)} frames")
-                    return
-            except Exception as e:
-                print(f"[MainMenu] GIF decode failed: {e}")
+        # 3) GIF, décodé sur un thread de travail (fallback visuel en attendant)
+        if gif_path.exists():
+            self._pending_gif = gif_path
+            self.preloader.preload(animations=(gif_path,))
+            self._use_fallback = True
+            if get_animations().is_ready(gif_path):
+                self._use_gif_background()
+            return
 
         # 4) Fallback visuel
         print("[MainMenu] No background asset found. Using animated fallback.")
@@ -223,33 +232,28 @@ class MainMenuView(BaseView):
         self._bg_sprite.center_x = win_w / 2
         self._bg_sprite.center_y = win_h / 2
 
-    def _decode_gif_to_textures(self, gif_path: Path) -> Tuple[List[arcade.Texture], List[float]]:
-        """Decode un GIF en textures Arcade en conservant les durées de frames (ms -> s)."""
-        textures: List[arcade.Texture] = []
-        durations: List[float] = []
-
-        im = Image.open(str(gif_path))
-        for i, frame in enumerate(ImageSequence.Iterator(im)):
-            fr = frame.convert("RGBA")
-            tex = arcade.Texture(name=f"bg_{i}", image=fr)
-            textures.append(tex)
-            d_ms = frame.info.get("duration", 80)
-            durations.append(max(0.01, d_ms / 1000.0))
-
-        if not textures:
-            fr = im.convert("RGBA")
-            textures.append(arcade.Texture(name="bg_0", image=fr))
-            durations.append(0.08)
-
-        return textures, durations
+    def _use_gif_background(self):
+        """Passe du fallback au GIF décodé (textures + durées en secondes)."""
+        gif_path, self._pending_gif = self._pending_gif, None
+        animation = get_animations().get(gif_path)
+        if animation is None:
+            print("[MainMenu] GIF decode failed. Using animated fallback.")
+            return
+        self._bg_textures = [keyframe.texture for keyframe in animation.keyframes]
+        self._bg_durations = [keyframe.duration / 1000.0 for keyframe in animation.keyframes]
+        self._bg_index = 0
+        self._bg_time_accum = 0.0
+        self._use_fallback = False
+        print(f"[MainMenu] Decoded GIF -> {len(self._bg_textures)} frames")
+        if self.window:
+            self._ensure_spritelist_and_sprite()
+            self._fit_sprite_to_window()
 
     def _activate_option(self):
         option = self._options[self._selected_index]
         if option == "Start":
-            from .AtomDialogueScene import AtomDialogueScene
-            self.window.show_view(AtomDialogueScene())
+            self.window.show_view(get_scene("AtomDialogueScene"))
         elif option == "Credit":
-            from .credits import CreditsView
-            self.window.show_view(CreditsView())
+            self.window.show_view(get_scene("CreditsView"))
         elif option == "Quit":
             arcade.exit()
\ No newline at end of file
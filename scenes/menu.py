@@ -1,8 +1,12 @@
 import arcade
 from .base import BaseView
+from .registry import get_scene
 
 
 class MenuView(BaseView):
+    REUSABLE = True
+    RENDER_ON_DEMAND = True
+
     def __init__(self):
         super().__init__()
         self.background_color = arcade.color.DARK_GREEN
@@ -15,10 +19,8 @@ class MenuView(BaseView):
         if not self.window:
             return
         if key == arcade.key.ENTER:
-            from .atom import AtomView
-            self.window.show_view(AtomView)
+            self.window.show_view(get_scene("AtomView"))
         if key == arcade.key.ESCAPE:
-            from .main_menu import MainMenuView
-            self.window.show_view(MainMenuView())
+            self.window.show_view(get_scene("MainMenuView"))
 
 
@@ -1,24 +1,23 @@
 import arcade
 from arcade.gui import UIManager, UIAnchorLayout, UIGridLayout, UIFlatButton
-from .GalaxyDialogueScene import GalaxyDialogueScene
+from .base import BaseView
+from .registry import get_scene
+from core import make_sprite
 
-class PopupView(arcade.View):
-    def __init__(self, parent_view, win=True):
+class PopupView(BaseView):
+    REUSABLE = True
+
+    def __init__(self, parent_view=None, win=True):
         super().__init__()
         self.parent_view = parent_view
         self.win = win  # True si partie gagnée, False si perdue
 
-        # UI Manager
+        # UI Manager (activé seulement quand la popup est affichée)
         self.ui = UIManager()
-        self.ui.enable()
 
         # --- Fond image ---
         self.background_sprite_list = arcade.SpriteList()
-        self.background = arcade.Sprite("assets/alien-world-sunset.png")
-        self.background.center_x = self.window.width / 2
-        self.background.center_y = self.window.height / 2
-        self.background.width = self.window.width
-        self.background.height = self.window.height
+        self.background = make_sprite("assets/alien-world-sunset.png")
         self.background_sprite_list.append(self.background)
 
         # --- Boutons ---
@@ -34,6 +33,24 @@ class PopupView(arcade.View):
 
         self.ui.add(UIAnchorLayout(children=[grid]))
 
+    def on_show_view(self):
+        super().on_show_view()
+        self._fit_background()
+        self.ui.enable()
+
+    def on_hide_view(self):
+        self.ui.disable()
+
+    def on_resize(self, width: int, height: int):
+        super().on_resize(width, height)
+        self._fit_background()
+
+    def _fit_background(self):
+        self.background.center_x = self.window.width / 2
+        self.background.center_y = self.window.height / 2
+        self.background.width = self.window.width
+        self.background.height = self.window.height
+
     def on_draw(self):
         self.clear()
 
@@ -57,11 +74,11 @@ class PopupView(arcade.View):
 
     def on_key_press(self, symbol, modifiers):
         if symbol == arcade.key.ENTER:
-            self.window.show_view(GalaxyDialogueScene())
+            self.window.show_view(get_scene("GalaxyDialogueScene"))
 
     def on_next_click(self, event):
         print("👉 Jeu suivant")
-        self.window.show_view(GalaxyDialogueScene())
+        self.window.show_view(get_scene("GalaxyDialogueScene"))
 
     def on_quit_click(self, event):
         print("👉 Quitter")
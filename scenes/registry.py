@@ -0,0 +1,125 @@
+"""
+Registre des scènes : nom de classe -> module, importé à la demande.
+
+``import scenes`` ne charge plus que ``scenes.base`` ; le module d'une scène
+(et ce qu'il tire, comme ``arcade.gui`` pour l'AlienView) n'est importé qu'au
+premier accès à sa classe (``scenes.AtomView``, ``get_scene_class("AtomView")``).
+``preimport_scenes()`` peut importer les autres en arrière-plan pendant que
+le menu tourne, pour que le premier changement de scène ne paie pas l'import.
+
+Les transitions passent par ``get_scene()`` : une scène ``REUSABLE`` déjà
+construite est remise à zéro (``reset()``) et réaffichée au lieu d'être
+reconstruite (textures, listes de sprites, fond animé du menu...). Au plus
+``MAX_RESIDENT_SCENES`` instances sont gardées ; la moins récemment demandée
+est oubliée au-delà.
+"""
+
+import importlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Nom de la scène -> module du paquet scenes qui la définit
+SCENES: Dict[str, str] = {
+    "BaseView": "base",
+    "MainMenuView": "main_menu",
+    "MenuView": "menu",
+    "CreditsView": "credits",
+    "HubView": "hub",
+    "AtomView": "atom",
+    "AtomStormView": "atom",
+    "AntView": "ant",
+    "HumanDogView": "human_dog",
+    "AlienView": "alien",
+    "PopupView": "popup_view",
+    "GalaxyView": "galaxy",
+    "UniverseView": "universe",
+    "AtomDialogueScene": "AtomDialogueScene",
+    "FourmiDialogueScene": "FourmiDialogueScene",
+    "HumanDialogueScene": "HumanDialogueScene",
+    "AlienDialogueScene": "AlienDialogueScene",
+    "GalaxyDialogueScene": "GalaxyDialogueScene",
+    "UniversDialogueScene": "UniversDialogueScene",
+}
+
+# Nombre maximum de scènes gardées pour réutilisation
+MAX_RESIDENT_SCENES = 4
+
+_import_lock = threading.Lock()
+# Nom de la scène -> instance réutilisable, de la moins à la plus récemment demandée
+_resident: "OrderedDict[str, object]" = OrderedDict()
+
+
+def get_scene_class(name: str):
+    """
+    Retourne la classe de la scène `name`, en important son module au besoin.
+
+    Raises:
+        KeyError: Scène absente du registre
+    """
+    module_name = SCENES.get(name)
+    if module_name is None:
+        raise KeyError(f"Scène inconnue: {name}")
+    module = importlib.import_module(f"{__package__}.{module_name}")
+    return getattr(module, name)
+
+
+def get_scene(scene: Union[str, type]):
+    """
+    Retourne une instance prête à afficher de la scène `scene` (nom ou classe).
+
+    Une scène ``REUSABLE`` déjà construite est remise à zéro par ``reset()`` ;
+    les autres sont construites à chaque appel.
+    """
+    view_class = get_scene_class(scene) if isinstance(scene, str) else scene
+    name = view_class.__name__
+    view = _resident.get(name)
+    if view is not None and type(view) is view_class:
+        _resident.move_to_end(name)
+        view.reset()
+        return view
+    view = view_class()
+    if getattr(view_class, "REUSABLE", False):
+        _resident[name] = view
+        while len(_resident) > MAX_RESIDENT_SCENES:
+            evicted, _ = _resident.popitem(last=False)
+            logger.debug(f"Scène {evicted} libérée (plus de {MAX_RESIDENT_SCENES} scènes gardées)")
+    return view
+
+
+def resident_scenes() -> List[str]:
+    """Noms des scènes gardées, de la moins à la plus récemment demandée."""
+    return list(_resident)
+
+
+def clear_scenes():
+    """Oublie toutes les scènes gardées (elles seront reconstruites)."""
+    _resident.clear()
+
+
+def preimport_scenes(names: Optional[Iterable[str]] = None) -> threading.Thread:
+    """
+    Importe en arrière-plan les modules des scènes `names` (toutes par défaut).
+
+    Returns:
+        threading.Thread: Thread démon lancé (join() pour attendre la fin)
+    """
+    modules = list(dict.fromkeys(SCENES[name] for name in (names or SCENES)))
+
+    def run():
+        # Un seul pré-import à la fois ; le verrou d'import de Python protège
+        # des imports concurrents du thread principal
+        with _import_lock:
+            for module_name in modules:
+                try:
+                    importlib.import_module(f"{__package__}.{module_name}")
+                except Exception as e:
+                    logger.error(f"Erreur lors du pré-import de {module_name}: {e}")
+            logger.debug(f"{len(modules)} module(s) de scène pré-importé(s)")
+
+    thread = threading.Thread(target=run, name="scene-preimport", daemon=True)
+    thread.start()
+    return thread
@@ -1,8 +1,12 @@
 import math
 from pathlib import Path
 import arcade
-import pyglet
 from .base import BaseView
+from .registry import get_scene
+from core import make_sprite, make_sprite_list, make_solid_sprite, is_headless, get_animations
+
+# Animation de la collision, décodée en arrière-plan dès l'entrée dans la scène
+EXPLOSION_ANIMATION = "assets/universe/explosion.gif"
 
 
 class UniverseView(BaseView):
@@ -11,6 +15,14 @@ class UniverseView(BaseView):
     Appuyez sur le bouton "Ralentir !" pour temporiser et éviter la collision.
     """
 
+    PRELOAD_TEXTURES = (
+        "assets/universe/blackhole.png",
+        "assets/universe/blackhole2.png",
+        "assets/universe/wind.png",
+    )
+    PRELOAD_ANIMATIONS = (EXPLOSION_ANIMATION,)
+    INTERPOLATED_LISTS = ("_objects",)
+
     def __init__(self):
         super().__init__()
         self.background_color = arcade.color.BLACK
@@ -28,9 +40,9 @@ class UniverseView(BaseView):
         self.right_bh: arcade.Sprite | None = None
         self.wind: arcade.Sprite | None = None
         self._wind_angle: float = 0.0
-        self._objects = arcade.SpriteList()
-        self._fx = arcade.SpriteList()
-        self._bg_image_list = arcade.SpriteList()
+        self._objects = make_sprite_list()
+        self._fx = make_sprite_list()
+        self._bg_image_list = make_sprite_list()
 
         # Timer
         self.timer = 20 # Valeur initiale
@@ -43,13 +55,14 @@ class UniverseView(BaseView):
         self._help_fill: arcade.Sprite | None = None
         self._help_border: arcade.Sprite | None = None
         self._help_rect: tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0)
-        self._ui = arcade.SpriteList()
+        self._ui = make_sprite_list()
         self._slow_timer: float = 0.0
         self._game_over: bool = False
         self._slow_uses: int = 0
         self._space_held: bool = False
         self._slow_impulse: float = 0.12
-        self._explosion_sprite: pyglet.sprite.Sprite | None = None
+        self._explosion_sprite: arcade.Sprite | None = None
+        self._explosion_list = make_sprite_list()
         self._explosion_timer: float = 0.0
         self._explosion_duration: float = 0.0
         self._exploding: bool = False
@@ -62,6 +75,8 @@ class UniverseView(BaseView):
     # ----- Lifecycle -----
     def on_show_view(self):
         super().on_show_view()
+        # Explosion décodée pendant la partie (déjà fait si la scène précédente l'a préchargée)
+        self.preloader.preload(animations=self.PRELOAD_ANIMATIONS)
         # Positionnement initial dépendant de la fenêtre
         w = self.window.width if self.window else 1080
         h = self.window.height if self.window else 720
@@ -78,7 +93,7 @@ class UniverseView(BaseView):
 
         # Charger les sprites
         # Fond d'écran si disponible
-        self._bg_image_list = arcade.SpriteList()
+        self._bg_image_list = make_sprite_list()
         bg_path = self.asset_dir / "SpaceBackground.png"
         if bg_path.exists():
             bg = self._load_scaled(bg_path, target_w=w)
@@ -124,10 +139,10 @@ class UniverseView(BaseView):
         # Bouton centré en haut (sprites pour compat maximal)
         btn_w, btn_h = 380, 80
         self._btn_rect = (w / 2, h - 60, float(btn_w), float(btn_h))
-        self._ui = arcade.SpriteList()
-        self._btn_border = arcade.SpriteSolidColor(int(btn_w + 6), int(btn_h + 6), arcade.color.RED)
+        self._ui = make_sprite_list()
+        self._btn_border = make_solid_sprite(int(btn_w + 6), int(btn_h + 6), arcade.color.RED)
         self._btn_border.center_x, self._btn_border.center_y = self._btn_rect[0], self._btn_rect[1]
-        self._btn_fill = arcade.SpriteSolidColor(int(btn_w), int(btn_h), arcade.color.DARK_RED)
+        self._btn_fill = make_solid_sprite(int(btn_w), int(btn_h), arcade.color.DARK_RED)
         self._btn_fill.center_x, self._btn_fill.center_y = self._btn_rect[0], self._btn_rect[1]
         self._ui.append(self._btn_border)
         self._ui.append(self._btn_fill)
@@ -138,9 +153,9 @@ class UniverseView(BaseView):
         help_x = w - help_w / 2 - margin
         help_y = h - help_h / 2 - margin
         self._help_rect = (help_x, help_y, float(help_w), float(help_h))
-        self._help_border = arcade.SpriteSolidColor(int(help_w + 4), int(help_h + 4), arcade.color.RED)
+        self._help_border = make_solid_sprite(int(help_w + 4), int(help_h + 4), arcade.color.RED)
         self._help_border.center_x, self._help_border.center_y = help_x, help_y
-        self._help_fill = arcade.SpriteSolidColor(int(help_w), int(help_h), (10, 10, 18))
+        self._help_fill = make_solid_sprite(int(help_w), int(help_h), (10, 10, 18))
         self._help_fill.center_x, self._help_fill.center_y = help_x, help_y
         self._ui.append(self._help_border)
         self._ui.append(self._help_fill)
@@ -150,6 +165,7 @@ class UniverseView(BaseView):
         self._slow_uses = 0
         self._space_held = False
         self._explosion_sprite = None
+        self._explosion_list.clear()
         self._explosion_timer = 0.0
         self._explosion_duration = 0.0
         self._exploding = False
@@ -173,7 +189,7 @@ class UniverseView(BaseView):
 
         # Explosion par-dessus le fond
         if self._exploding and self._explosion_sprite is not None:
-            self._explosion_sprite.draw()
+            self._explosion_list.draw()
         elif not self._game_over:
             # Dessin des trous noirs (sprites si dispo), sinon fallback uniquement en jeu
             if len(self._objects) > 0:
@@ -193,7 +209,7 @@ class UniverseView(BaseView):
             self._draw_button()
             hint = f"Temps restant :  {self.timer}"
             hx, hy, _, _ = self._help_rect
-            arcade.draw_text(hint, hx, hy - 9, arcade.color.BLUE, 18, anchor_x="center")
+            self.labels.text("hint", hint, hx, hy - 9, arcade.color.BLUE, 18, anchor_x="center")
 
         if self._show_game_over:
             self._draw_game_over_text()
@@ -201,7 +217,7 @@ class UniverseView(BaseView):
         # Rien ici: l'explosion est déjà dessinée plus haut
 
     # ----- Update -----
-    def on_update(self, delta_time: float):
+    def fixed_update(self, delta_time: float):
         # Gérer le timer qui décrémente de 20 à 1
         if self.timer > 1:
             self.time_accumulator += delta_time
@@ -215,17 +231,12 @@ class UniverseView(BaseView):
             if self._explosion_timer > 0.0:
                 # Fade-out dans les dernières secondes de l'animation
                 if self._explosion_sprite is not None:
+                    self._explosion_sprite.update_animation(delta_time)
                     if self._explosion_timer <= self._explosion_fade_time:
                         ratio = max(0.0, min(1.0, self._explosion_timer / self._explosion_fade_time))
-                        try:
-                            self._explosion_sprite.opacity = int(255 * ratio)
-                        except Exception:
-                            pass
+                        self._explosion_sprite.alpha = int(255 * ratio)
                     else:
-                        try:
-                            self._explosion_sprite.opacity = 255
-                        except Exception:
-                            pass
+                        self._explosion_sprite.alpha = 255
                 self._explosion_timer = max(0.0, self._explosion_timer - delta_time)
             else:
                 self._exploding = False
@@ -281,19 +292,18 @@ class UniverseView(BaseView):
                     self.right_bh.remove_from_sprite_lists()
                 self.left_bh = None
                 self.right_bh = None
-                self._objects = arcade.SpriteList()
+                self._objects = make_sprite_list()
                 # Retirer aussi le vent
                 if self.wind:
                     self.wind.remove_from_sprite_lists()
                     self.wind = None
-                self._fx = arcade.SpriteList()
+                self._fx = make_sprite_list()
                 self._exploding = True
 
     # ----- Input -----
     def on_key_press(self, key: int, modifiers: int):
         if key == arcade.key.ESCAPE and self.window:
-            from .main_menu import MainMenuView
-            self.window.show_view(MainMenuView())
+            self.window.show_view(get_scene("MainMenuView"))
             return
         if key == arcade.key.SPACE:
             # Ralentissement court uniquement à l'appui (pas en maintien)
@@ -325,7 +335,7 @@ class UniverseView(BaseView):
     def _draw_button(self):
         cx, cy, _, _ = self._btn_rect
         label = f"Ralentir !  (Espace)  x{self._slow_uses}"
-        arcade.draw_text(label, cx, cy - 14, arcade.color.RED, 28, anchor_x="center")
+        self.labels.text("button", label, cx, cy - 14, arcade.color.RED, 28, anchor_x="center")
 
     def _draw_game_over_text(self):
         """Affiche le texte de game over avec retour à la ligne automatique"""
@@ -403,7 +413,8 @@ class UniverseView(BaseView):
                 color = arcade.color.WHITE
                 size = font_size
             
-            arcade.draw_text(
+            self.labels.text(
+                ("game_over", i),
                 line,
                 w / 2,
                 y_pos,
@@ -420,39 +431,27 @@ class UniverseView(BaseView):
 
     # ----- Asset helper -----
     def _load_scaled(self, path: Path, target_w: int) -> arcade.Sprite:
-        sprite = arcade.Sprite(str(path), scale=1.0)
-        tex = sprite.texture
-        if tex and tex.width:
-            sprite.scale = target_w / float(tex.width)
-        return sprite
+        return make_sprite(path, target_w=target_w)
 
     # ----- Explosion -----
     def _start_explosion(self):
         if self._explosion_sprite is not None:
             return
-        path = self.asset_dir / "explosion.gif"
-        if not path.exists():
+        if is_headless():
+            # Pas d'animation sans fenêtre : fin de partie immédiate
             return
-        try:
-            anim = pyglet.image.load_animation(str(path))
-            self._explosion_duration = 0.0
-            try:
-                # Sum frame durations if available
-                for f in getattr(anim, "frames", []) or []:
-                    self._explosion_duration += getattr(f, "duration", 0.05)
-                if self._explosion_duration <= 0:
-                    self._explosion_duration = 1.0
-            except Exception:
-                self._explosion_duration = 1.0
-            self._explosion_sprite = pyglet.sprite.Sprite(anim)
-            # Position au milieu des deux trous noirs
-            cx = (self.left_pos[0] + self.right_pos[0]) / 2
-            cy = (self.left_pos[1] + self.right_pos[1]) / 2
-            # Convert to bottom-left origin for pyglet sprite
-            self._explosion_sprite.update(x=cx - self._explosion_sprite.width / 2,
-                                          y=cy - self._explosion_sprite.height / 2)
-            self._explosion_timer = self._explosion_duration
-        except Exception:
+        if not (self.asset_dir / "explosion.gif").exists():
+            return
+        # Décodée depuis l'entrée dans la scène : normalement prête, sans attente
+        sprite = get_animations().make_sprite(EXPLOSION_ANIMATION, loop=False)
+        if sprite is None:
             # Si l'animation ne charge pas, ignorer proprement
-            self._explosion_sprite = None
             self._explosion_timer = 0.0
+            return
+        # Position au milieu des deux trous noirs
+        sprite.center_x = (self.left_pos[0] + self.right_pos[0]) / 2
+        sprite.center_y = (self.left_pos[1] + self.right_pos[1]) / 2
+        self._explosion_sprite = sprite
+        self._explosion_list.append(sprite)
+        self._explosion_duration = sprite.animation.duration_seconds or 1.0
+        self._explosion_timer = self._explosion_duration
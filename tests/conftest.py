@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Les tests importent core comme le jeu, depuis la racine du projet
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
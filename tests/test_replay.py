@@ -0,0 +1,77 @@
+"""Format binaire .oosr : ce qui est écrit se relit à l'identique."""
+
+import struct
+
+import pytest
+
+from core.replay import MAGIC, VERSION, InputRecorder, Segment, _HEADER, decode, load_recording
+
+
+def _segment(scene="AtomView", seed=2**40 + 7, ticks=600):
+    segment = Segment(scene, seed, 1080, 720)
+    segment.events = [
+        (0, "on_key_press", (65362, 0)),
+        (12, "on_key_release", (65362, 16)),
+        (12, "on_mouse_motion", (10.5, -3.25, 1.0, -0.5)),
+        (30, "on_mouse_press", (100.0, 200.0, 1, 0)),
+        (31, "on_mouse_drag", (101.0, 201.0, 1.0, 1.0, 1, 0)),
+        (32, "on_mouse_release", (101.0, 201.0, 1, 0)),
+    ]
+    segment.ticks = ticks
+    return segment
+
+
+def _fields(segment):
+    return segment.scene, segment.seed, segment.width, segment.height, segment.events, segment.ticks
+
+
+def test_round_trip():
+    segments = [_segment(), _segment("FourmiDialogueScene", 0, 0), _segment("Scène é", 1, 5)]
+    segments[1].events = []
+    data = _HEADER.pack(MAGIC, VERSION) + b"".join(segment.encode() for segment in segments)
+    assert [_fields(segment) for segment in decode(data)] == [_fields(segment) for segment in segments]
+
+
+def test_header_layout():
+    # Disposition persistée : la changer impose de passer à une nouvelle VERSION
+    data = _HEADER.pack(MAGIC, VERSION) + _segment("A", 3, 10).encode()
+    assert data[:5] == b"OOSR" + bytes((VERSION,))
+    assert data[5] == 0
+    assert struct.unpack_from("<QHHB", data, 6) == (3, 1080, 720, 1)
+    assert data[-5:] == struct.pack("<BI", 255, 10)
+
+
+def test_unknown_header():
+    with pytest.raises(ValueError):
+        decode(b"OOSX" + bytes((VERSION,)))
+    with pytest.raises(ValueError):
+        decode(MAGIC + bytes((VERSION + 1,)))
+
+
+class _View:
+    window = None
+
+    def __init__(self):
+        self.tick = 0
+
+
+def test_recorder_file(tmp_path):
+    recorder = InputRecorder()
+    first, second = _View(), _View()
+    recorder.begin_scene(first, 42)
+    path = recorder.start(tmp_path / "session.oosr")
+    first.tick = 5
+    recorder.record(first, "on_key_press", (32, 0))
+    # Entrée d'une autre vue ou non rejouable : ignorée
+    recorder.record(second, "on_key_press", (33, 0))
+    recorder.record(first, "on_text", ("a",))
+    first.tick = 9
+    recorder.begin_scene(second, 43)
+    second.tick = 3
+    recorder.stop()
+
+    segments = load_recording(path)
+    assert [(s.scene, s.seed, s.events, s.ticks) for s in segments] == [
+        ("_View", 42, [(5, "on_key_press", (32, 0))], 9),
+        ("_View", 43, [], 3),
+    ]
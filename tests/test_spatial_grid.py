@@ -0,0 +1,39 @@
+"""SpatialGrid : cellules et requêtes, y compris aux coordonnées négatives."""
+
+from types import SimpleNamespace
+
+from core.spatial_grid import SpatialGrid
+
+
+def _item(x, y):
+    return SimpleNamespace(center_x=x, center_y=y)
+
+
+def test_negative_coordinates_use_floor_cells():
+    grid = SpatialGrid(cell_size=10)
+    # int(-0.5 / 10) vaudrait 0 : la division entière arrondit vers -inf
+    assert grid._cell(-0.5, -0.5) == (-1, -1)
+    assert grid._cell(-10.0, 0.0) == (-1, 0)
+    assert grid._cell(-10.5, 9.9) == (-2, 0)
+
+
+def test_query_across_origin():
+    left, right, far = _item(-3, 2), _item(4, -6), _item(-45, 0)
+    grid = SpatialGrid(cell_size=10)
+    grid.rebuild([left, right, far])
+
+    found = grid.query(0, 0, 5)
+    assert left in found and right in found
+    assert far not in found
+    assert grid.query(-45, 0, 1) == [far]
+
+
+def test_insert_matches_rebuild():
+    items = [_item(-15, -15), _item(-0.1, 0.1), _item(25, -25)]
+    rebuilt, inserted = SpatialGrid(8), SpatialGrid(8)
+    rebuilt.rebuild(items)
+    for item in items:
+        inserted.insert(item)
+
+    assert dict(rebuilt._cells) == dict(inserted._cells)
+    assert len(inserted) == 3
@@ -0,0 +1,57 @@
+"""TrailBuffer : écrasement circulaire, agrandissement et lecture groupée."""
+
+import numpy as np
+
+from core.trail import TrailBuffer
+
+
+def _filled(capacity, count):
+    trail = TrailBuffer(capacity)
+    for i in range(count):
+        trail.append(i, -i)
+    return trail
+
+
+def test_wraparound_keeps_latest_points():
+    trail = _filled(4, 10)
+
+    assert len(trail) == 4
+    assert trail.last == (9.0, -9.0)
+    assert trail._ordered()[:, 0].tolist() == [6, 7, 8, 9]
+
+
+def test_reserve_after_wrap_keeps_order():
+    trail = _filled(4, 10)
+    trail.reserve(6)
+
+    assert trail.capacity == 8
+    assert trail._ordered()[:, 0].tolist() == [6, 7, 8, 9]
+
+    trail.append(10, -10)
+    assert len(trail) == 5
+    assert trail.last == (10.0, -10.0)
+    assert trail._ordered()[:, 0].tolist() == [6, 7, 8, 9, 10]
+
+
+def test_reserve_smaller_is_a_no_op():
+    trail = _filled(4, 6)
+    trail.reserve(3)
+
+    assert trail.capacity == 4
+    assert trail._ordered()[:, 0].tolist() == [2, 3, 4, 5]
+
+
+def test_gather_clamps_offsets_past_stored_length():
+    trail = _filled(4, 10)
+    out = np.empty((4, 2))
+    result = trail.gather(np.array([0, 2, 3, 50]), out=out)
+
+    assert result is out
+    assert out[:, 0].tolist() == [9, 7, 6, 6]
+
+    # Tampon pas encore plein : le point le plus ancien est le premier ajouté
+    assert _filled(8, 3).gather(np.array([0, 7]))[:, 0].tolist() == [2, 0]
+
+
+def test_gather_on_empty_buffer():
+    assert TrailBuffer(4).gather(np.array([0, 3])).tolist() == [[0.0, 0.0], [0.0, 0.0]]